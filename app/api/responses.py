@@ -0,0 +1,114 @@
+"""Response helpers shared by API endpoints.
+
+FastAPI validates and encodes whatever a handler returns against its
+``response_model`` unless the handler returns a ``Response`` itself.
+Endpoints returning ORM rows use these helpers to serialize them through
+their response schema exactly once, in pydantic-core, and hand FastAPI a
+finished response; ``jsonable_encoder`` never runs for them.
+The ``response_model`` on the route still documents the schema.
+
+ORM rows come from our own database and are trusted, so by default
+schemas are filled with ``model_construct`` and no validators run. Set
+``VALIDATE_API_RESPONSE`` to validate rows against the schema instead.
+Request bodies are always validated by FastAPI as usual.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Sequence, Tuple, Type, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import settings
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# Read once; these helpers run for every response
+_VALIDATE_API_RESPONSE = settings.VALIDATE_API_RESPONSE
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Get the cached ``TypeAdapter`` for a list of ``schema``."""
+    return TypeAdapter(List[schema])
+
+
+@lru_cache(maxsize=None)
+def _field_names(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    """Get a schema's field names, computed once per schema."""
+    return tuple(schema.model_fields)
+
+
+def construct_trusted(schema: Type[SchemaT], row: Any, **extra: Any) -> SchemaT:
+    """Fill a response schema from a trusted ORM row without validation.
+    
+    Only for data read from the database; never pass request input here.
+    
+    Args:
+        schema: Response schema
+        row: ORM row providing the schema's fields as attributes
+        **extra: Additional field values, e.g. aggregates for
+            ``CampaignWithStats``, merged into the same construction.
+            These names are never read from the row, so they may shadow
+            a ``lazy="raise"`` relationship.
+    
+    Returns:
+        Schema instance holding the row's values
+    """
+    values = dict(extra)
+    for name in _field_names(schema):
+        if name in values:
+            continue
+        value = getattr(row, name, _MISSING)
+        if value is not _MISSING:
+            values[name] = value
+    return schema.model_construct(**values)
+
+
+def orm_list_response(
+    schema: Type[BaseModel],
+    rows: Sequence[Any],
+) -> Response:
+    """Serialize ORM rows with a response schema.
+    
+    JSON encoding runs inside pydantic-core through a cached
+    ``TypeAdapter``.
+    
+    Args:
+        schema: Response schema with ``from_attributes`` enabled
+        rows: ORM rows to serialize
+    
+    Returns:
+        JSON response containing the serialized rows
+    """
+    adapter = list_adapter(schema)
+    if _VALIDATE_API_RESPONSE:
+        items = adapter.validate_python(rows, from_attributes=True)
+    else:
+        items = [construct_trusted(schema, row) for row in rows]
+    return Response(
+        content=adapter.dump_json(items),
+        media_type="application/json",
+    )
+
+
+def orm_response(schema: Type[BaseModel], row: Any) -> Response:
+    """Serialize a single ORM row with a response schema.
+    
+    Args:
+        schema: Response schema with ``from_attributes`` enabled
+        row: ORM row to serialize
+    
+    Returns:
+        JSON response containing the serialized row
+    """
+    if _VALIDATE_API_RESPONSE:
+        item = schema.model_validate(row, from_attributes=True)
+    else:
+        item = construct_trusted(schema, row)
+    return Response(
+        content=item.model_dump_json(),
+        media_type="application/json",
+    )
@@ -4,19 +4,24 @@ Provides REST API for managing Buffer API configuration.
 """
 
 import logging
-from typing import Optional
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 
-from app.db.session import get_db
+from app.api.responses import orm_response
+from app.core.cache import cache
+from app.core.config import settings
 from app.dependencies.auth import CurrentUser, get_current_user, require_auth
+from app.dependencies.buffer import get_user_buffer_service
+from app.dependencies.services import get_buffer_config_service
 from app.schemas.buffer_config import (
     BufferConfigCreate,
     BufferConfigUpdate,
     BufferConfigResponse,
 )
 from app.services.buffer_config_service import BufferConfigService
+from app.services.buffer_service import BufferAPIError, BufferService
 from app.services.providers.provider_factory import get_provider
 from app.services.providers.base_provider import ProviderError
 
@@ -34,23 +39,21 @@ router = APIRouter()
 )
 async def create_buffer_config(
     config_data: BufferConfigCreate,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: BufferConfigService = Depends(get_buffer_config_service),
 ):
     """Configure Buffer for the current user."""
-    service = BufferConfigService(db)
-    
     try:
         config = await service.create_config(
             user_id=current_user.user_id,
             config_data=config_data,
         )
-        return config
-    except Exception as e:
-        logger.error(f"Failed to create Buffer config: {e}")
+        return orm_response(BufferConfigResponse, config)
+    except IntegrityError:
+        logger.warning("Failed to create Buffer config: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create Buffer config: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to create Buffer config: conflicts with existing data",
         )
 
 
@@ -61,12 +64,10 @@ async def create_buffer_config(
     description="Get Buffer configuration for the current user",
 )
 async def get_buffer_config(
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: BufferConfigService = Depends(get_buffer_config_service),
 ):
     """Get Buffer configuration."""
-    service = BufferConfigService(db)
-    
     config = await service.get_user_config(current_user.user_id)
     if not config:
         raise HTTPException(
@@ -74,7 +75,7 @@ async def get_buffer_config(
             detail="Buffer is not configured for this user",
         )
     
-    return config
+    return orm_response(BufferConfigResponse, config)
 
 
 @router.put(
@@ -85,12 +86,10 @@ async def get_buffer_config(
 )
 async def update_buffer_config(
     config_data: BufferConfigUpdate,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: BufferConfigService = Depends(get_buffer_config_service),
 ):
     """Update Buffer configuration."""
-    service = BufferConfigService(db)
-    
     # Get existing config
     config = await service.get_user_config(current_user.user_id)
     if not config:
@@ -101,12 +100,12 @@ async def update_buffer_config(
     
     try:
         updated_config = await service.update_config(config.id, config_data)
-        return updated_config
-    except Exception as e:
-        logger.error(f"Failed to update Buffer config: {e}")
+        return orm_response(BufferConfigResponse, updated_config)
+    except IntegrityError:
+        logger.warning("Failed to update Buffer config: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update Buffer config: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to update Buffer config: conflicts with existing data",
         )
 
 
@@ -117,12 +116,10 @@ async def update_buffer_config(
     description="Test connection to Buffer API",
 )
 async def test_buffer_connection(
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: BufferConfigService = Depends(get_buffer_config_service),
 ):
     """Test Buffer connection."""
-    service = BufferConfigService(db)
-    
     # Get config
     config = await service.get_user_config(current_user.user_id)
     if not config:
@@ -137,11 +134,11 @@ async def test_buffer_connection(
             "connected": is_connected,
             "message": "Connection successful" if is_connected else "Connection failed",
         }
-    except Exception as e:
-        logger.error(f"Failed to test Buffer connection: {e}")
+    except (ProviderError, BufferAPIError) as e:
+        logger.warning("Failed to test Buffer connection: %s", e.message)
         return {
             "connected": False,
-            "message": f"Connection test failed: {str(e)}",
+            "message": f"Connection test failed: {e.message}",
         }
 
 
@@ -151,27 +148,17 @@ async def test_buffer_connection(
     summary="Get Buffer profiles",
     description="Get all social media profiles connected to Buffer",
 )
+@cache(expire=settings.BUFFER_PROFILES_CACHE_TTL)
 async def get_buffer_profiles(
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    buffer_service: BufferService = Depends(get_user_buffer_service),
 ):
     """Get Buffer profiles."""
-    service = BufferConfigService(db)
-    
-    # Get Buffer service
-    buffer_service = await service.get_buffer_service(current_user.user_id)
-    if not buffer_service:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Buffer is not configured for this user",
-        )
-    
     try:
         profiles = await buffer_service.get_profiles()
         return profiles
-    except ProviderError as e:
-        logger.error(f"Failed to get Buffer profiles: {e.message}")
+    except (ProviderError, BufferAPIError) as e:
+        logger.warning("Failed to get Buffer profiles: %s", e.message)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_502_BAD_GATEWAY,
             detail=f"Failed to get Buffer profiles: {e.message}",
         )
@@ -4,14 +4,21 @@ Provides REST API for managing social media campaigns.
 """
 
 import logging
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import list_adapter, orm_list_response, orm_response
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.pagination import Cursor, set_next_cursor
 from app.db.session import get_db
 from app.dependencies.auth import CurrentUser, get_current_user
-from app.models.campaign import CampaignStatus, CampaignType
+from app.dependencies.campaigns import valid_owned_campaign
+from app.dependencies.pagination import get_cursor
+from app.models.campaign import Campaign, CampaignStatus, CampaignType
 from app.schemas.campaign import (
     CampaignCreate,
     CampaignUpdate,
@@ -24,6 +31,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Build the list serializers at import rather than on the first request
+list_adapter(CampaignResponse)
+list_adapter(ScheduledPostResponse)
+
 
 @router.post(
     "",
@@ -34,7 +45,7 @@ router = APIRouter()
 )
 async def create_campaign(
     campaign_data: CampaignCreate,
-    current_user: CurrentUser = Depends(get_current_user),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new campaign."""
@@ -45,12 +56,12 @@ async def create_campaign(
             user_id=current_user.user_id,
             campaign_data=campaign_data,
         )
-        return campaign
-    except Exception as e:
-        logger.error(f"Failed to create campaign: {e}")
+        return orm_response(CampaignResponse, campaign)
+    except IntegrityError:
+        logger.warning("Failed to create campaign: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create campaign: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to create campaign: conflicts with existing data",
         )
 
 
@@ -61,28 +72,10 @@ async def create_campaign(
     description="Get a campaign by ID",
 )
 async def get_campaign(
-    campaign_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    campaign: Campaign = Depends(valid_owned_campaign),
 ):
     """Get a campaign by ID."""
-    service = CampaignService(db)
-    
-    campaign = await service.get_campaign(campaign_id)
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Campaign {campaign_id} not found",
-        )
-    
-    # Verify ownership
-    if campaign.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this campaign",
-        )
-    
-    return campaign
+    return orm_response(CampaignResponse, campaign)
 
 
 @router.get(
@@ -92,11 +85,12 @@ async def get_campaign(
     description="Get campaigns with optional filters",
 )
 async def list_campaigns(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     status_filter: Optional[CampaignStatus] = Query(None, alias="status"),
     campaign_type: Optional[CampaignType] = None,
     limit: int = Query(100, le=500),
-    offset: int = Query(0, ge=0),
-    current_user: CurrentUser = Depends(get_current_user),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[Cursor] = Depends(get_cursor),
     db: AsyncSession = Depends(get_db),
 ):
     """List campaigns for the current user."""
@@ -108,8 +102,11 @@ async def list_campaigns(
         campaign_type=campaign_type,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
-    return campaigns
+    response = orm_list_response(CampaignResponse, campaigns)
+    set_next_cursor(response, campaigns, limit, "created_at")
+    return response
 
 
 @router.put(
@@ -119,36 +116,21 @@ async def list_campaigns(
     description="Update a campaign",
 )
 async def update_campaign(
-    campaign_id: int,
     campaign_data: CampaignUpdate,
-    current_user: CurrentUser = Depends(get_current_user),
+    campaign: Campaign = Depends(valid_owned_campaign),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a campaign."""
     service = CampaignService(db)
     
-    # Check ownership
-    campaign = await service.get_campaign(campaign_id)
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Campaign {campaign_id} not found",
-        )
-    
-    if campaign.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this campaign",
-        )
-    
     try:
-        updated_campaign = await service.update_campaign(campaign_id, campaign_data)
-        return updated_campaign
-    except Exception as e:
-        logger.error(f"Failed to update campaign: {e}")
+        updated_campaign = await service.update_campaign(campaign, campaign_data)
+        return orm_response(CampaignResponse, updated_campaign)
+    except IntegrityError:
+        logger.warning("Failed to update campaign: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update campaign: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to update campaign: conflicts with existing data",
         )
 
 
@@ -159,28 +141,13 @@ async def update_campaign(
     description="Delete a campaign",
 )
 async def delete_campaign(
-    campaign_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
+    campaign: Campaign = Depends(valid_owned_campaign),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a campaign."""
     service = CampaignService(db)
     
-    # Check ownership
-    campaign = await service.get_campaign(campaign_id)
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Campaign {campaign_id} not found",
-        )
-    
-    if campaign.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to delete this campaign",
-        )
-    
-    deleted = await service.delete_campaign(campaign_id)
+    deleted = await service.delete_campaign(campaign)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -195,35 +162,24 @@ async def delete_campaign(
     description="Get all posts in a campaign",
 )
 async def get_campaign_posts(
-    campaign_id: int,
     limit: int = Query(100, le=500),
-    offset: int = Query(0, ge=0),
-    current_user: CurrentUser = Depends(get_current_user),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    campaign: Campaign = Depends(valid_owned_campaign),
     db: AsyncSession = Depends(get_db),
 ):
     """Get posts in a campaign."""
     service = CampaignService(db)
     
-    # Verify campaign ownership
-    campaign = await service.get_campaign(campaign_id)
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Campaign {campaign_id} not found",
-        )
-    
-    if campaign.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this campaign",
-        )
-    
     posts = await service.get_campaign_posts(
-        campaign_id=campaign_id,
+        campaign_id=campaign.id,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
-    return posts
+    response = orm_list_response(ScheduledPostResponse, posts)
+    set_next_cursor(response, posts, limit, "scheduled_time")
+    return response
 
 
 @router.get(
@@ -232,27 +188,13 @@ async def get_campaign_posts(
     summary="Get campaign analytics",
     description="Get aggregated analytics for a campaign",
 )
+@cache(expire=settings.ANALYTICS_CACHE_TTL)
 async def get_campaign_analytics(
-    campaign_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
+    campaign: Campaign = Depends(valid_owned_campaign),
     db: AsyncSession = Depends(get_db),
 ):
     """Get campaign analytics."""
     service = CampaignService(db)
     
-    # Verify campaign ownership
-    campaign = await service.get_campaign(campaign_id)
-    if not campaign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Campaign {campaign_id} not found",
-        )
-    
-    if campaign.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this campaign",
-        )
-    
-    analytics = await service.get_campaign_analytics(campaign_id)
+    analytics = await service.get_campaign_analytics(campaign.id)
     return analytics
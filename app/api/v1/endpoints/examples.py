@@ -5,7 +5,7 @@ Replace with your actual business logic endpoints.
 """
 
 import logging
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -27,11 +27,11 @@ router = APIRouter()
     description="Get a list of examples with optional filtering and pagination",
 )
 async def list_examples(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
     db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user),
 ):
     """List all examples.
     
@@ -57,8 +57,8 @@ async def list_examples(
 )
 async def get_example(
     example_id: int,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Get an example by ID."""
     logger.info(f"User {current_user.user_id} getting example {example_id}")
@@ -84,8 +84,8 @@ async def get_example(
 )
 async def create_example(
     example_data: ExampleCreate,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Create a new example."""
     logger.info(f"User {current_user.user_id} creating example")
@@ -105,8 +105,8 @@ async def create_example(
 async def update_example(
     example_id: int,
     example_data: ExampleUpdate,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Update an example."""
     logger.info(f"User {current_user.user_id} updating example {example_id}")
@@ -131,8 +131,8 @@ async def update_example(
 )
 async def delete_example(
     example_id: int,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
-    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Delete an example."""
     logger.info(f"User {current_user.user_id} deleting example {example_id}")
@@ -4,27 +4,46 @@ Provides REST API for managing post analytics.
 """
 
 import logging
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.api.responses import list_adapter, orm_list_response, orm_response
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.pagination import Cursor, set_next_cursor
+from app.core.redis import get_redis
+from app.db.session import AsyncSessionLocal, get_db
+from app.dependencies.analytics import valid_owned_analytics
 from app.dependencies.auth import CurrentUser, get_current_user
+from app.dependencies.buffer import get_user_buffer_service
+from app.dependencies.pagination import get_cursor
+from app.dependencies.posts import valid_owned_post
+from app.models.post_analytics import PostAnalytics
+from app.models.scheduled_post import ScheduledPost
 from app.schemas.post_analytics import (
+    PlatformAnalyticsSummary,
     PostAnalyticsCreate,
     PostAnalyticsUpdate,
+    PostAnalyticsListItem,
     PostAnalyticsResponse,
+    AnalyticsSyncJobResponse,
 )
 from app.services.post_analytics_service import PostAnalyticsService
 from app.services.scheduled_post_service import ScheduledPostService
-from app.services.buffer_config_service import BufferConfigService
+from app.services.buffer_service import BufferService
+from app.services.sync_job_service import SyncJobService, SyncJobStatus
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Build the list serializer at import rather than on the first request
+list_adapter(PostAnalyticsListItem)
+
 
 @router.post(
     "",
@@ -35,7 +54,7 @@ router = APIRouter()
 )
 async def create_analytics(
     analytics_data: PostAnalyticsCreate,
-    current_user: CurrentUser = Depends(get_current_user),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
 ):
     """Record analytics for a post."""
@@ -43,27 +62,23 @@ async def create_analytics(
     post_service = ScheduledPostService(db)
     
     # Verify post ownership
-    post = await post_service.get_post(analytics_data.post_id)
+    post = await post_service.get_owned_post(
+        analytics_data.post_id, current_user.user_id
+    )
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Post {analytics_data.post_id} not found",
         )
     
-    if post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to record analytics for this post",
-        )
-    
     try:
         analytics = await service.create_analytics(analytics_data)
-        return analytics
-    except Exception as e:
-        logger.error(f"Failed to create analytics: {e}")
+        return orm_response(PostAnalyticsResponse, analytics)
+    except IntegrityError:
+        logger.warning("Failed to create analytics: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create analytics: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to create analytics: conflicts with existing data",
         )
 
 
@@ -74,83 +89,48 @@ async def create_analytics(
     description="Get analytics record by ID",
 )
 async def get_analytics(
-    analytics_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    analytics: PostAnalytics = Depends(valid_owned_analytics),
 ):
     """Get analytics by ID."""
-    service = PostAnalyticsService(db)
-    post_service = ScheduledPostService(db)
-    
-    analytics = await service.get_analytics(analytics_id)
-    if not analytics:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Analytics {analytics_id} not found",
-        )
-    
-    # Verify ownership through post
-    post = await post_service.get_post(analytics.post_id)
-    if not post or post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this analytics",
-        )
-    
-    return analytics
+    return orm_response(PostAnalyticsResponse, analytics)
 
 
 @router.get(
     "/posts/{post_id}/analytics",
-    response_model=List[PostAnalyticsResponse],
+    response_model=List[PostAnalyticsListItem],
     summary="Get post analytics",
     description="Get all analytics for a specific post",
 )
 async def get_post_analytics(
-    post_id: int,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    current_user: CurrentUser = Depends(get_current_user),
+    post: ScheduledPost = Depends(valid_owned_post),
     db: AsyncSession = Depends(get_db),
 ):
     """Get analytics for a specific post."""
     service = PostAnalyticsService(db)
-    post_service = ScheduledPostService(db)
-    
-    # Verify post ownership
-    post = await post_service.get_post(post_id)
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Post {post_id} not found",
-        )
-    
-    if post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access analytics for this post",
-        )
     
     analytics = await service.get_post_analytics(
-        post_id=post_id,
+        post_id=post.id,
         start_date=start_date,
         end_date=end_date,
     )
-    return analytics
+    return orm_list_response(PostAnalyticsListItem, analytics)
 
 
 @router.get(
     "",
-    response_model=List[PostAnalyticsResponse],
+    response_model=List[PostAnalyticsListItem],
     summary="List analytics",
     description="Get analytics for all posts with filters",
 )
 async def list_analytics(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     limit: int = Query(100, le=500),
-    offset: int = Query(0, ge=0),
-    current_user: CurrentUser = Depends(get_current_user),
+    offset: int = Query(0, ge=0, deprecated=True),
+    cursor: Optional[Cursor] = Depends(get_cursor),
     db: AsyncSession = Depends(get_db),
 ):
     """List analytics for the current user."""
@@ -162,8 +142,11 @@ async def list_analytics(
         end_date=end_date,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
-    return analytics
+    response = orm_list_response(PostAnalyticsListItem, analytics)
+    set_next_cursor(response, analytics, limit, "recorded_at")
+    return response
 
 
 @router.get(
@@ -172,10 +155,11 @@ async def list_analytics(
     summary="Get analytics summary",
     description="Get aggregated analytics summary",
 )
+@cache(expire=settings.ANALYTICS_CACHE_TTL)
 async def get_analytics_summary(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Get analytics summary."""
@@ -189,39 +173,112 @@ async def get_analytics_summary(
     return summary
 
 
+@router.get(
+    "/summary/platforms",
+    response_model=List[PlatformAnalyticsSummary],
+    summary="Get analytics summary by platform",
+    description="Get aggregated analytics totals for each platform",
+)
+@cache(expire=settings.ANALYTICS_CACHE_TTL)
+async def get_platform_summaries(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Get analytics summary grouped by platform."""
+    service = PostAnalyticsService(db)
+    
+    return await service.get_platform_summaries(
+        user_id=current_user.user_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+async def _run_analytics_sync(
+    job_id: str,
+    user_id: int,
+    buffer_service: BufferService,
+    days: int,
+) -> None:
+    """Run an analytics sync in the background and record its progress."""
+    jobs = SyncJobService(get_redis())
+    await jobs.update_job(job_id, status=SyncJobStatus.RUNNING)
+    
+    # The request session is closed once the 202 is sent, so the job owns
+    # its session and commits each batch as it goes.
+    synced = 0
+    async with AsyncSessionLocal() as session:
+        service = PostAnalyticsService(session)
+        try:
+            async for batch in service.iter_sync_analytics(
+                user_id=user_id,
+                buffer_service=buffer_service,
+                days=days,
+            ):
+                await session.commit()
+                synced += len(batch)
+                await jobs.update_job(job_id, synced=synced)
+        except Exception:
+            logger.exception("Analytics sync job %s failed", job_id)
+            await session.rollback()
+            await jobs.update_job(
+                job_id,
+                status=SyncJobStatus.FAILED,
+                error="Analytics sync failed",
+            )
+            return
+    
+    await jobs.update_job(job_id, status=SyncJobStatus.COMPLETED)
+
+
 @router.post(
     "/sync",
-    response_model=List[PostAnalyticsResponse],
+    response_model=AnalyticsSyncJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Sync analytics",
-    description="Sync analytics from Buffer for recent posts",
+    description=(
+        "Queue a sync of analytics from Buffer for recent posts. "
+        "Poll /analytics/sync/{job_id} for progress."
+    ),
 )
 async def sync_analytics(
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    buffer_service: BufferService = Depends(get_user_buffer_service),
 ):
-    """Sync analytics from Buffer."""
-    service = PostAnalyticsService(db)
-    buffer_config_service = BufferConfigService(db)
+    """Queue an analytics sync from Buffer."""
+    job = await SyncJobService(get_redis()).create_job(current_user.user_id)
     
-    # Get Buffer service
-    buffer_service = await buffer_config_service.get_buffer_service(current_user.user_id)
-    if not buffer_service:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Buffer is not configured for this user",
-        )
+    background_tasks.add_task(
+        _run_analytics_sync,
+        job_id=job["job_id"],
+        user_id=current_user.user_id,
+        buffer_service=buffer_service,
+        days=days,
+    )
     
-    try:
-        analytics = await service.bulk_sync_analytics(
-            user_id=current_user.user_id,
-            buffer_service=buffer_service,
-            days=days,
-        )
-        return analytics
-    except Exception as e:
-        logger.error(f"Failed to sync analytics: {e}")
+    return job
+
+
+@router.get(
+    "/sync/{job_id}",
+    response_model=AnalyticsSyncJobResponse,
+    summary="Get sync status",
+    description="Get the status of a queued analytics sync",
+)
+async def get_sync_status(
+    job_id: str,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+):
+    """Get analytics sync job status."""
+    job = await SyncJobService(get_redis()).get_user_job(job_id, current_user.user_id)
+    if not job:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to sync analytics: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sync job {job_id} not found",
         )
+    
+    return job
@@ -4,15 +4,23 @@ Provides REST API for managing scheduled social media posts.
 """
 
 import logging
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 
-from app.db.session import get_db
+from app.api.responses import list_adapter, orm_list_response, orm_response
+from app.core.pagination import Cursor, set_next_cursor
 from app.dependencies.auth import CurrentUser, get_current_user
-from app.models.scheduled_post import PostStatus, PostType
+from app.dependencies.buffer import get_user_buffer_service
+from app.dependencies.pagination import get_cursor
+from app.dependencies.posts import valid_owned_post
+from app.dependencies.services import (
+    get_buffer_config_service,
+    get_scheduled_post_service,
+)
+from app.models.scheduled_post import PostStatus, PostType, ScheduledPost
 from app.schemas.scheduled_post import (
     ScheduledPostCreate,
     ScheduledPostUpdate,
@@ -20,11 +28,16 @@ from app.schemas.scheduled_post import (
 )
 from app.services.scheduled_post_service import ScheduledPostService
 from app.services.buffer_config_service import BufferConfigService
+from app.services.buffer_service import BufferAPIError, BufferService
+from app.services.providers.base_provider import ProviderError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Build the list serializer at import rather than on the first request
+list_adapter(ScheduledPostResponse)
+
 
 @router.post(
     "",
@@ -35,23 +48,21 @@ router = APIRouter()
 )
 async def create_scheduled_post(
     post_data: ScheduledPostCreate,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
 ):
     """Create a new scheduled post."""
-    service = ScheduledPostService(db)
-    
     try:
         post = await service.create_post(
             user_id=current_user.user_id,
             post_data=post_data,
         )
-        return post
-    except Exception as e:
-        logger.error(f"Failed to create scheduled post: {e}")
+        return orm_response(ScheduledPostResponse, post)
+    except IntegrityError:
+        logger.warning("Failed to create scheduled post: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create scheduled post: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to create scheduled post: conflicts with existing data",
         )
 
 
@@ -62,28 +73,10 @@ async def create_scheduled_post(
     description="Get a scheduled post by ID",
 )
 async def get_scheduled_post(
-    post_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    post: ScheduledPost = Depends(valid_owned_post),
 ):
     """Get a scheduled post by ID."""
-    service = ScheduledPostService(db)
-    
-    post = await service.get_post(post_id)
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Scheduled post {post_id} not found",
-        )
-    
-    # Verify ownership
-    if post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this post",
-        )
-    
-    return post
+    return orm_response(ScheduledPostResponse, post)
 
 
 @router.get(
@@ -93,6 +86,7 @@ async def get_scheduled_post(
     description="Get scheduled posts with optional filters",
 )
 async def list_scheduled_posts(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     status_filter: Optional[PostStatus] = Query(None, alias="status"),
     post_type: Optional[PostType] = None,
     campaign_id: Optional[int] = None,
@@ -100,12 +94,9 @@ async def list_scheduled_posts(
     end_date: Optional[date] = None,
     limit: int = Query(100, le=500),
     offset: int = Query(0, ge=0),
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
 ):
     """List scheduled posts for the current user."""
-    service = ScheduledPostService(db)
-    
     posts = await service.get_user_posts(
         user_id=current_user.user_id,
         status=status_filter,
@@ -116,7 +107,7 @@ async def list_scheduled_posts(
         limit=limit,
         offset=offset,
     )
-    return posts
+    return orm_list_response(ScheduledPostResponse, posts)
 
 
 @router.put(
@@ -126,36 +117,19 @@ async def list_scheduled_posts(
     description="Update a scheduled post",
 )
 async def update_scheduled_post(
-    post_id: int,
     post_data: ScheduledPostUpdate,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    post: ScheduledPost = Depends(valid_owned_post),
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
 ):
     """Update a scheduled post."""
-    service = ScheduledPostService(db)
-    
-    # Check ownership
-    post = await service.get_post(post_id)
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Scheduled post {post_id} not found",
-        )
-    
-    if post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this post",
-        )
-    
     try:
-        updated_post = await service.update_post(post_id, post_data)
-        return updated_post
-    except Exception as e:
-        logger.error(f"Failed to update scheduled post: {e}")
+        updated_post = await service.update_post(post, post_data)
+        return orm_response(ScheduledPostResponse, updated_post)
+    except IntegrityError:
+        logger.warning("Failed to update scheduled post: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update scheduled post: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to update scheduled post: conflicts with existing data",
         )
 
 
@@ -166,28 +140,11 @@ async def update_scheduled_post(
     description="Delete a scheduled post",
 )
 async def delete_scheduled_post(
-    post_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    post: ScheduledPost = Depends(valid_owned_post),
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
 ):
     """Delete a scheduled post."""
-    service = ScheduledPostService(db)
-    
-    # Check ownership
-    post = await service.get_post(post_id)
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Scheduled post {post_id} not found",
-        )
-    
-    if post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to delete this post",
-        )
-    
-    deleted = await service.delete_post(post_id)
+    deleted = await service.delete_post(post)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -202,49 +159,24 @@ async def delete_scheduled_post(
     description="Schedule a post via Buffer",
 )
 async def schedule_post(
-    post_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    post: ScheduledPost = Depends(valid_owned_post),
+    buffer_service: BufferService = Depends(get_user_buffer_service),
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
 ):
     """Schedule a post via Buffer."""
-    service = ScheduledPostService(db)
-    buffer_config_service = BufferConfigService(db)
-    
-    # Check ownership
-    post = await service.get_post(post_id)
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Scheduled post {post_id} not found",
-        )
-    
-    if post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to schedule this post",
-        )
-    
-    # Get Buffer service
-    buffer_service = await buffer_config_service.get_buffer_service(current_user.user_id)
-    if not buffer_service:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Buffer is not configured for this user",
-        )
-    
     try:
-        scheduled_post = await service.schedule_with_buffer(post_id, buffer_service)
+        scheduled_post = await service.schedule_with_provider(post, buffer_service)
         if not scheduled_post:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to schedule post",
             )
-        return scheduled_post
-    except Exception as e:
-        logger.error(f"Failed to schedule post: {e}")
+        return orm_response(ScheduledPostResponse, scheduled_post)
+    except (ProviderError, BufferAPIError) as e:
+        logger.warning("Failed to schedule post: %s", e.message)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to schedule post: {str(e)}",
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=e.message,
         )
 
 
@@ -255,49 +187,24 @@ async def schedule_post(
     description="Publish a post immediately",
 )
 async def publish_post_now(
-    post_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    post: ScheduledPost = Depends(valid_owned_post),
+    buffer_service: BufferService = Depends(get_user_buffer_service),
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
 ):
     """Publish a post immediately."""
-    service = ScheduledPostService(db)
-    buffer_config_service = BufferConfigService(db)
-    
-    # Check ownership
-    post = await service.get_post(post_id)
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Scheduled post {post_id} not found",
-        )
-    
-    if post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to publish this post",
-        )
-    
-    # Get Buffer service
-    buffer_service = await buffer_config_service.get_buffer_service(current_user.user_id)
-    if not buffer_service:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Buffer is not configured for this user",
-        )
-    
     try:
-        published_post = await service.publish_now(post_id, buffer_service)
+        published_post = await service.publish_now(post, buffer_service)
         if not published_post:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to publish post",
             )
-        return published_post
-    except Exception as e:
-        logger.error(f"Failed to publish post: {e}")
+        return orm_response(ScheduledPostResponse, published_post)
+    except (ProviderError, BufferAPIError) as e:
+        logger.warning("Failed to publish post: %s", e.message)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to publish post: {str(e)}",
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=e.message,
         )
 
 
@@ -308,49 +215,24 @@ async def publish_post_now(
     description="Cancel a scheduled post",
 )
 async def cancel_scheduled_post(
-    post_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    post: ScheduledPost = Depends(valid_owned_post),
+    buffer_service: BufferService = Depends(get_user_buffer_service),
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
 ):
     """Cancel a scheduled post."""
-    service = ScheduledPostService(db)
-    buffer_config_service = BufferConfigService(db)
-    
-    # Check ownership
-    post = await service.get_post(post_id)
-    if not post:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Scheduled post {post_id} not found",
-        )
-    
-    if post.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to cancel this post",
-        )
-    
-    # Get Buffer service
-    buffer_service = await buffer_config_service.get_buffer_service(current_user.user_id)
-    if not buffer_service:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Buffer is not configured for this user",
-        )
-    
     try:
-        cancelled_post = await service.cancel_scheduled_post(post_id, buffer_service)
+        cancelled_post = await service.cancel_scheduled_post(post, buffer_service)
         if not cancelled_post:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to cancel post",
             )
-        return cancelled_post
-    except Exception as e:
-        logger.error(f"Failed to cancel post: {e}")
+        return orm_response(ScheduledPostResponse, cancelled_post)
+    except (ProviderError, BufferAPIError) as e:
+        logger.warning("Failed to cancel post: %s", e.message)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to cancel post: {str(e)}",
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=e.message,
         )
 
 
@@ -363,18 +245,22 @@ async def cancel_scheduled_post(
 async def get_content_calendar(
     start_date: date,
     end_date: date,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    limit: int = Query(100, le=500),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
 ):
     """Get content calendar."""
-    service = ScheduledPostService(db)
-    
     posts = await service.get_calendar(
         user_id=current_user.user_id,
         start_date=start_date,
         end_date=end_date,
+        limit=limit,
+        cursor=cursor,
     )
-    return posts
+    response = orm_list_response(ScheduledPostResponse, posts)
+    set_next_cursor(response, posts, limit, "scheduled_time")
+    return response
 
 
 @router.post(
@@ -385,13 +271,12 @@ async def get_content_calendar(
 )
 async def bulk_schedule_posts(
     posts_data: List[ScheduledPostCreate],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     schedule_immediately: bool = Query(False, description="Schedule with Buffer immediately"),
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
+    buffer_config_service: BufferConfigService = Depends(get_buffer_config_service),
 ):
     """Bulk schedule posts."""
-    service = ScheduledPostService(db)
-    buffer_config_service = BufferConfigService(db)
     
     # Get Buffer service if immediate scheduling requested
     buffer_service = None
@@ -407,12 +292,12 @@ async def bulk_schedule_posts(
         posts = await service.bulk_schedule(
             user_id=current_user.user_id,
             posts_data=posts_data,
-            buffer_service=buffer_service,
+            provider=buffer_service,
         )
-        return posts
-    except Exception as e:
-        logger.error(f"Failed to bulk schedule posts: {e}")
+        return orm_list_response(ScheduledPostResponse, posts)
+    except (ProviderError, BufferAPIError) as e:
+        logger.warning("Failed to bulk schedule posts: %s", e.message)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to bulk schedule posts: {str(e)}",
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=e.message,
         )
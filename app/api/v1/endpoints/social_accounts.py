@@ -4,26 +4,36 @@ Provides REST API for managing social media accounts.
 """
 
 import logging
-from typing import List
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.responses import list_adapter, orm_list_response, orm_response
+from app.core.pagination import Cursor, set_next_cursor
 from app.db.session import get_db
+from app.dependencies.accounts import valid_owned_account
 from app.dependencies.auth import CurrentUser, get_current_user
-from app.models.social_account import SocialPlatform, AccountStatus
+from app.dependencies.buffer import get_user_buffer_service
+from app.dependencies.pagination import get_cursor
+from app.models.social_account import SocialAccount, SocialPlatform, AccountStatus
 from app.schemas.social_account import (
     SocialAccountCreate,
     SocialAccountUpdate,
     SocialAccountResponse,
 )
 from app.services.social_account_service import SocialAccountService
-from app.services.buffer_config_service import BufferConfigService
+from app.services.buffer_service import BufferAPIError, BufferService
+from app.services.providers.base_provider import ProviderError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Build the list serializer at import rather than on the first request
+list_adapter(SocialAccountResponse)
+
 
 @router.post(
     "",
@@ -34,7 +44,7 @@ router = APIRouter()
 )
 async def create_social_account(
     account_data: SocialAccountCreate,
-    current_user: CurrentUser = Depends(get_current_user),
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new social media account."""
@@ -45,12 +55,12 @@ async def create_social_account(
             user_id=current_user.user_id,
             account_data=account_data,
         )
-        return account
-    except Exception as e:
-        logger.error(f"Failed to create social account: {e}")
+        return orm_response(SocialAccountResponse, account)
+    except IntegrityError:
+        logger.warning("Failed to create social account: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create social account: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to create social account: conflicts with existing data",
         )
 
 
@@ -61,28 +71,10 @@ async def create_social_account(
     description="Get a social media account by ID",
 )
 async def get_social_account(
-    account_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    account: SocialAccount = Depends(valid_owned_account),
 ):
     """Get a social account by ID."""
-    service = SocialAccountService(db)
-    
-    account = await service.get_account(account_id)
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Social account {account_id} not found",
-        )
-    
-    # Verify ownership
-    if account.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to access this account",
-        )
-    
-    return account
+    return orm_response(SocialAccountResponse, account)
 
 
 @router.get(
@@ -92,9 +84,11 @@ async def get_social_account(
     description="Get all social media accounts for the current user",
 )
 async def list_social_accounts(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     platform: SocialPlatform = None,
     status_filter: AccountStatus = None,
-    current_user: CurrentUser = Depends(get_current_user),
+    limit: int = Query(100, le=500),
+    cursor: Optional[Cursor] = Depends(get_cursor),
     db: AsyncSession = Depends(get_db),
 ):
     """List all social accounts for the current user."""
@@ -104,8 +98,12 @@ async def list_social_accounts(
         user_id=current_user.user_id,
         platform=platform,
         status=status_filter,
+        limit=limit,
+        cursor=cursor,
     )
-    return accounts
+    response = orm_list_response(SocialAccountResponse, accounts)
+    set_next_cursor(response, accounts, limit, "created_at")
+    return response
 
 
 @router.put(
@@ -115,36 +113,21 @@ async def list_social_accounts(
     description="Update a social media account",
 )
 async def update_social_account(
-    account_id: int,
     account_data: SocialAccountUpdate,
-    current_user: CurrentUser = Depends(get_current_user),
+    account: SocialAccount = Depends(valid_owned_account),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a social account."""
     service = SocialAccountService(db)
     
-    # Check ownership
-    account = await service.get_account(account_id)
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Social account {account_id} not found",
-        )
-    
-    if account.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to update this account",
-        )
-    
     try:
-        updated_account = await service.update_account(account_id, account_data)
-        return updated_account
-    except Exception as e:
-        logger.error(f"Failed to update social account: {e}")
+        updated_account = await service.update_account(account, account_data)
+        return orm_response(SocialAccountResponse, updated_account)
+    except IntegrityError:
+        logger.warning("Failed to update social account: conflicts with existing data")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update social account: {str(e)}",
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Failed to update social account: conflicts with existing data",
         )
 
 
@@ -155,28 +138,13 @@ async def update_social_account(
     description="Delete a social media account",
 )
 async def delete_social_account(
-    account_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
+    account: SocialAccount = Depends(valid_owned_account),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a social account."""
     service = SocialAccountService(db)
     
-    # Check ownership
-    account = await service.get_account(account_id)
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Social account {account_id} not found",
-        )
-    
-    if account.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to delete this account",
-        )
-    
-    deleted = await service.delete_account(account_id)
+    deleted = await service.delete_account(account)
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -191,49 +159,26 @@ async def delete_social_account(
     description="Sync social account with Buffer profile",
 )
 async def sync_account_with_buffer(
-    account_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
+    account: SocialAccount = Depends(valid_owned_account),
+    buffer_service: BufferService = Depends(get_user_buffer_service),
     db: AsyncSession = Depends(get_db),
 ):
     """Sync account with Buffer."""
     service = SocialAccountService(db)
-    buffer_config_service = BufferConfigService(db)
-    
-    # Check ownership
-    account = await service.get_account(account_id)
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Social account {account_id} not found",
-        )
-    
-    if account.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to sync this account",
-        )
-    
-    # Get Buffer service
-    buffer_service = await buffer_config_service.get_buffer_service(current_user.user_id)
-    if not buffer_service:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Buffer is not configured for this user",
-        )
     
     try:
-        synced_account = await service.sync_with_buffer(account_id, buffer_service)
+        synced_account = await service.sync_with_provider(account, buffer_service)
         if not synced_account:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Failed to sync with Buffer",
             )
-        return synced_account
-    except Exception as e:
-        logger.error(f"Failed to sync account with Buffer: {e}")
+        return orm_response(SocialAccountResponse, synced_account)
+    except (ProviderError, BufferAPIError) as e:
+        logger.warning("Failed to sync account with Buffer: %s", e.message)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to sync with Buffer: {str(e)}",
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=e.message,
         )
 
 
@@ -244,47 +189,36 @@ async def sync_account_with_buffer(
     description="Test connection to social account via Buffer",
 )
 async def test_account_connection(
-    account_id: int,
-    current_user: CurrentUser = Depends(get_current_user),
+    account: SocialAccount = Depends(valid_owned_account),
+    buffer_service: BufferService = Depends(get_user_buffer_service),
     db: AsyncSession = Depends(get_db),
 ):
     """Test connection to social account."""
     service = SocialAccountService(db)
-    buffer_config_service = BufferConfigService(db)
-    
-    # Check ownership
-    account = await service.get_account(account_id)
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Social account {account_id} not found",
-        )
     
-    if account.user_id != current_user.user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to test this account",
-        )
-    
-    # Get Buffer service
-    buffer_service = await buffer_config_service.get_buffer_service(current_user.user_id)
-    if not buffer_service:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Buffer is not configured for this user",
-        )
+    # Polling clients get the result of a recent test instead of a new Buffer call
+    cached = await service.get_cached_connection(account)
+    if cached is not None:
+        return {
+            "account_id": account.id,
+            "connected": cached,
+            "message": "Connection successful" if cached else "Connection failed",
+            "cached": True,
+        }
     
     try:
-        is_connected = await service.test_connection(account_id, buffer_service)
+        is_connected = await service.test_connection(account, buffer_service)
         return {
-            "account_id": account_id,
+            "account_id": account.id,
             "connected": is_connected,
             "message": "Connection successful" if is_connected else "Connection failed",
+            "cached": False,
         }
-    except Exception as e:
-        logger.error(f"Failed to test account connection: {e}")
+    except (ProviderError, BufferAPIError) as e:
+        logger.warning("Failed to test account connection: %s", e.message)
         return {
-            "account_id": account_id,
+            "account_id": account.id,
             "connected": False,
-            "message": f"Connection test failed: {str(e)}",
+            "message": f"Connection test failed: {e.message}",
+            "cached": False,
         }
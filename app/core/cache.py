@@ -0,0 +1,103 @@
+"""Response caching.
+
+Provides the Redis-backed response cache used by read-heavy endpoints.
+Entries are stored through the shared Redis client, so the cache needs
+no start-up initialisation. When Redis is unavailable the endpoint is
+served uncached.
+"""
+
+import functools
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Namespaces this service's keys within a shared Redis
+CACHE_PREFIX = "social-media-service-cache"
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Awaitable[Any]])
+
+
+def _key_part(value: Any) -> Any:
+    """Reduce a dependency value to something stable across requests."""
+    # Imported here to avoid a circular import with app.dependencies
+    from app.dependencies.auth import CurrentUser
+    from app.services.buffer_service import BufferService
+    
+    if isinstance(value, CurrentUser):
+        return value.user_id
+    if isinstance(value, BufferService):
+        # Keyed by token so a replaced Buffer config gets fresh entries
+        return value.access_token
+    if hasattr(value, "__table__"):
+        # Loaded ORM model (e.g. from an ownership dependency)
+        return value.id
+    return value
+
+
+def cache_key(func: Callable[..., Any], kwargs: dict) -> str:
+    """Build the cache key for a call of an endpoint.
+    
+    Per-request dependency objects would make every key unique, so
+    sessions are dropped, users/models are replaced by their IDs and
+    Buffer services by their access token. The arguments are hashed,
+    so tokens are never stored in the key.
+    """
+    parts = {
+        name: _key_part(value)
+        for name, value in sorted(kwargs.items())
+        if not isinstance(value, AsyncSession)
+    }
+    digest = hashlib.md5(
+        f"{func.__module__}:{func.__name__}:{parts}".encode()
+    ).hexdigest()
+    return f"{CACHE_PREFIX}:{digest}"
+
+
+def cache(expire: int) -> Callable[[EndpointT], EndpointT]:
+    """Cache an endpoint's JSON-compatible result in Redis.
+    
+    Hits are returned as decoded JSON and validated against the route's
+    ``response_model`` like any other return value.
+    
+    Args:
+        expire: Seconds to keep an entry
+    
+    Returns:
+        Decorator for an async endpoint function
+    """
+    def decorator(func: EndpointT) -> EndpointT:
+        # functools.wraps keeps the signature FastAPI reads dependencies from
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = cache_key(func, kwargs)
+            redis = get_redis()
+            
+            try:
+                cached = await redis.get(key)
+            except RedisError as e:
+                logger.warning("Response cache unavailable: %s", e)
+                cached = None
+            if cached is not None:
+                return orjson.loads(cached)
+            
+            result = await func(*args, **kwargs)
+            
+            try:
+                await redis.set(key, orjson.dumps(jsonable_encoder(result)), ex=expire)
+            except RedisError as e:
+                logger.warning("Failed to cache response for %s: %s", func.__name__, e)
+            
+            return result
+        
+        return wrapper  # type: ignore[return-value]
+    
+    return decorator
@@ -0,0 +1,107 @@
+"""Response compression.
+
+Provides an ASGI middleware that compresses responses with Brotli when
+the client accepts it and falls back to gzip otherwise.
+"""
+
+from typing import Optional
+
+from brotli_asgi import BrotliMiddleware
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+def _parse_accept_encoding(header: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into codings and their q-values."""
+    qualities = {}
+    for item in header.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding] = q
+    return qualities
+
+
+def select_encoding(header: str) -> Optional[str]:
+    """Pick the response encoding for an Accept-Encoding header.
+    
+    Codings listed with ``q=0`` are refused and ``*`` covers codings not
+    listed explicitly. Brotli wins a tie with gzip.
+    
+    Args:
+        header: Accept-Encoding header value
+    
+    Returns:
+        "br", "gzip" or None to send the response uncompressed
+    """
+    qualities = _parse_accept_encoding(header)
+    wildcard = qualities.get("*", 0.0)
+    br = qualities.get("br", wildcard)
+    gzip = qualities.get("gzip", wildcard)
+    if br > 0 and br >= gzip:
+        return "br"
+    if gzip > 0:
+        return "gzip"
+    return None
+
+
+def _accepting_only(scope: Scope, encoding: str) -> Scope:
+    """Copy ``scope`` with Accept-Encoding narrowed to ``encoding``.
+    
+    The delegate middlewares run their own substring check on the header,
+    so they are handed exactly the coding chosen here.
+    """
+    headers = [
+        (name, value) for name, value in scope["headers"]
+        if name != b"accept-encoding"
+    ]
+    headers.append((b"accept-encoding", encoding.encode("latin-1")))
+    return {**scope, "headers": headers}
+
+
+class CompressionMiddleware:
+    """Compress responses with Brotli or gzip based on Accept-Encoding.
+    
+    brotli-asgi's own gzip fallback always uses gzip level 9, so the
+    gzip path here goes through Starlette's middleware with an explicit
+    level instead.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1500,
+        brotli_quality: int = 4,
+        gzip_level: int = 5,
+    ) -> None:
+        self.app = app
+        self.brotli = BrotliMiddleware(
+            app,
+            quality=brotli_quality,
+            minimum_size=minimum_size,
+            gzip_fallback=False,
+        )
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=gzip_level)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = select_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        if encoding == "br":
+            await self.brotli(_accepting_only(scope, "br"), receive, send)
+        elif encoding == "gzip":
+            await self.gzip(_accepting_only(scope, "gzip"), receive, send)
+        else:
+            await self.app(scope, receive, send)
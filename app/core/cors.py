@@ -0,0 +1,27 @@
+"""CORS middleware.
+
+Starlette's ``CORSMiddleware`` checks an origin against its regex and
+then scans the ``allow_origins`` list on every request. The subclass
+here answers exact origins from a frozenset first.
+"""
+
+from typing import Sequence
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
+
+
+class FastCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with constant-time lookup of exact allowed origins."""
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        **kwargs,
+    ) -> None:
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self._origin_set = frozenset(allow_origins)
+    
+    def is_allowed_origin(self, origin: str) -> bool:
+        return origin in self._origin_set or super().is_allowed_origin(origin)
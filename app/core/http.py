@@ -0,0 +1,46 @@
+"""Outbound HTTP clients.
+
+Provides the shared async HTTP client used for Buffer API calls. One
+client per worker keeps TCP/TLS connections to Buffer alive between
+requests and multiplexes concurrent calls over HTTP/2.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+import httpx
+import orjson
+
+
+@lru_cache
+def get_buffer_client() -> httpx.AsyncClient:
+    """Get the process-wide Buffer API client."""
+    return httpx.AsyncClient(
+        http2=True,
+        # httpx drops idle connections after 5s by default; Buffer calls from
+        # one worker are often further apart than that
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0,
+        ),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+    )
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson.
+    
+    Returns an empty dict for an empty body.
+    
+    Raises:
+        orjson.JSONDecodeError: If the body is not valid JSON
+    """
+    return orjson.loads(response.content) if response.content else {}
+
+
+async def close_http_clients() -> None:
+    """Close shared HTTP clients that have been created."""
+    if get_buffer_client.cache_info().currsize:
+        await get_buffer_client().aclose()
+        get_buffer_client.cache_clear()
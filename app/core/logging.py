@@ -4,21 +4,33 @@ Provides structured logging for the application.
 Supports both JSON and text formats.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 import structlog
 from structlog.types import EventDict, Processor
 
 from app.core.config import settings
 
+# Listener thread that writes queued log records to stdout
+_listener: Optional[QueueListener] = None
+
+
+# Settings do not change at runtime, so the context is built once
+_APP_CONTEXT = {
+    "service": settings.PROJECT_NAME,
+    "environment": settings.ENVIRONMENT,
+    "version": settings.VERSION,
+}
+
 
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Add application context to log entries."""
-    event_dict["service"] = settings.PROJECT_NAME
-    event_dict["environment"] = settings.ENVIRONMENT
-    event_dict["version"] = settings.VERSION
+    event_dict.update(_APP_CONTEXT)
     return event_dict
 
 
@@ -33,7 +45,7 @@ def setup_logging() -> None:
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.TimeStamper(fmt="%Y-%m-%dT%H:%M:%S", utc=True),
         structlog.processors.StackInfoRenderer(),
         add_app_context,
     ]
@@ -65,12 +77,32 @@ def setup_logging() -> None:
             cache_logger_on_first_use=True,
         )
     
-    # Configure standard library logging
+    # Configure standard library logging. Records are handed to a queue
+    # and written to stdout from a listener thread, so formatting and I/O
+    # stay off the event loop.
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    
     logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
+        handlers=[QueueHandler(log_queue)],
         level=log_level,
+        force=True,
     )
     
     # Silence noisy loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued log records on interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
@@ -0,0 +1,65 @@
+"""Keyset pagination helpers.
+
+List endpoints page through results with an opaque cursor that encodes
+the sort key and primary key of the last row returned. The next page is
+fetched with ``WHERE (sort_key, id) < (:sort_key, :id)``, which stays an
+index range scan no matter how deep the client pages, unlike OFFSET.
+"""
+
+import base64
+from datetime import datetime
+from typing import Sequence, Tuple
+from uuid import UUID
+
+from fastapi import Response
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+Cursor = Tuple[datetime, UUID]
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Encode a keyset position as an opaque URL-safe string."""
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode a cursor produced by :func:`encode_cursor`.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def set_next_cursor(
+    response: Response,
+    rows: Sequence,
+    limit: int,
+    sort_attr: str,
+) -> None:
+    """Set the next-page cursor header when a full page was returned.
+    
+    Args:
+        response: Outgoing response
+        rows: Rows of the current page, in keyset order
+        limit: Page size that was requested
+        sort_attr: Name of the attribute the page is sorted by. Must be a
+            NOT NULL column; the keyset comparison cannot order NULLs.
+    
+    Raises:
+        ValueError: If the last row has no value for ``sort_attr``
+    """
+    if rows and len(rows) >= limit:
+        last = rows[-1]
+        sort_value = getattr(last, sort_attr)
+        if sort_value is None:
+            raise ValueError(f"Cannot paginate on {sort_attr}: last row has no value")
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(sort_value, last.id)
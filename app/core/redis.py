@@ -0,0 +1,21 @@
+"""Redis client.
+
+Provides the shared async Redis client used for response caching and
+short-lived job state.
+"""
+
+from functools import lru_cache
+
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+
+@lru_cache
+def get_redis() -> aioredis.Redis:
+    """Get the process-wide Redis client.
+    
+    The client keeps its own connection pool, so one instance is shared
+    by every request in the worker.
+    """
+    return aioredis.from_url(settings.REDIS_URL)
@@ -6,15 +6,40 @@ Provides JWT token validation, password hashing, and other security functions.
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-from jose import JWTError, jwt
+import jwt
+import orjson
+from jwt import DecodeError, InvalidTokenError as JWTError
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
+# Token signing and verification parameters, read once from settings so
+# issued tokens always verify against the same key
+_SECRET_KEY = settings.SECRET_KEY
+_ALGORITHM = settings.ALGORITHM
+_ALGORITHMS = [_ALGORITHM]
+
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT codec that parses token payloads with orjson."""
+    
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+# Every token we issue carries an expiry and a subject
+_jwt = _OrjsonJWT(options={"require": ["exp", "sub"]})
+
+
 def create_access_token(
     subject: str | Any,
     expires_delta: Optional[timedelta] = None,
@@ -42,10 +67,10 @@ def create_access_token(
     if additional_claims:
         to_encode.update(additional_claims)
     
-    encoded_jwt = jwt.encode(
+    encoded_jwt = _jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM,
+        _SECRET_KEY,
+        algorithm=_ALGORITHM,
     )
     return encoded_jwt
 
@@ -63,11 +88,7 @@ def decode_token(token: str) -> dict:
         JWTError: If token is invalid or expired
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-        )
+        payload = _jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
         return payload
     except JWTError as e:
         raise JWTError(f"Invalid token: {e}")
@@ -3,27 +3,66 @@
 Provides common fields like id, created_at, updated_at for all models.
 """
 
+import os
+import time
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DDL, CheckConstraint, DateTime, FetchedValue, Table, event, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+    
+    The first 48 bits are the Unix timestamp in milliseconds, so new
+    primary keys land at the right edge of the B-tree index instead of
+    at random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76  # version 7
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62  # RFC 4122 variant
+    return UUID(int=value)
+
+
+def enum_check(table: str, column: str, enum: type[Enum]) -> CheckConstraint:
+    """Constrain a string column to the values of an enum.
+    
+    Enum-valued columns are stored as plain strings so rows load without
+    per-value enum coercion; the constraint keeps the database strict.
+    """
+    values = ", ".join(f"'{member.value}'" for member in enum)
+    return CheckConstraint(f"{column} IN ({values})", name=f"ck_{table}_{column}")
+
+
+@lru_cache(maxsize=None)
+def _column_names(model: type) -> tuple[str, ...]:
+    """Get a model's column names, computed once per class."""
+    return tuple(column.name for column in model.__table__.columns)
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
     
     # Make this an abstract base class
     __abstract__ = True
     
+    # Fetch server-generated values (updated_at) via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Common fields for all models
+    # The primary key constraint already provides a unique index
     id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), 
-        primary_key=True, 
-        default=uuid4,
-        index=True
+        PGUUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -33,13 +72,48 @@ class Base(DeclarativeBase):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),  # Set by the set_updated_at trigger
         nullable=False,
     )
     
     def dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        return {name: getattr(self, name) for name in _column_names(type(self))}
+    
+    def __repr__(self) -> str:
+        # Read id from the instance dict: an expired or detached row must not
+        # trigger a load while SQLAlchemy or a logger formats it.
+        return f"<{type(self).__name__}(id={self.__dict__.get('id')})>"
+
+
+# Schemas created from the models (dev and tests) get the same
+# set_updated_at function and triggers as the Alembic migrations
+_SET_UPDATED_AT_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = now();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+""")
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    _SET_UPDATED_AT_FUNCTION.execute_if(dialect="postgresql"),
+)
+
+
+@event.listens_for(Table, "after_create")
+def _create_updated_at_trigger(table: Table, connection: Any, **kw: Any) -> None:
+    """Attach the set_updated_at trigger to a newly created model table."""
+    if (
+        table.metadata is Base.metadata
+        and "updated_at" in table.c
+        and connection.dialect.name == "postgresql"
+    ):
+        connection.execute(DDL(
+            f"CREATE TRIGGER {table.name}_set_updated_at "
+            f"BEFORE UPDATE ON {table.name} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        ))
@@ -0,0 +1,75 @@
+"""Development schema creation.
+
+Creates tables straight from the models when running in development.
+Production schemas are managed by Alembic migrations.
+"""
+
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.core.config import settings
+from app.db.base_class import Base
+
+logger = logging.getLogger(__name__)
+
+# Fingerprint of the schema the dev database was last created from
+SCHEMA_HASH_FILE = Path(tempfile.gettempdir()) / ".social_media_service_schema_hash"
+
+
+def schema_fingerprint(engine: AsyncEngine) -> str:
+    """Hash the DDL of all models together with the target database URL."""
+    digest = hashlib.sha1(settings.DATABASE_URL.encode())
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=engine.dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=engine.dialect)).encode())
+    return digest.hexdigest()
+
+
+async def create_dev_schema(engine: AsyncEngine) -> None:
+    """Create missing tables unless the models are unchanged since last boot.
+    
+    ``create_all`` checks every table and index against the database,
+    which slows down each auto-reload. The fingerprint of the schema it
+    last created is kept in a temp file, and the check is skipped while
+    it matches. Delete SCHEMA_HASH_FILE after dropping the dev database.
+    
+    Args:
+        engine: Database engine
+    """
+    fingerprint = schema_fingerprint(engine)
+    try:
+        if SCHEMA_HASH_FILE.read_text() == fingerprint:
+            logger.info("Database schema unchanged, skipping table creation")
+            return
+    except OSError:
+        pass
+    
+    logger.info("Creating database tables...")
+    async with engine.begin() as conn:
+        # One catalog query instead of a has_table round trip per table
+        result = await conn.execute(
+            text("SELECT tablename FROM pg_tables WHERE schemaname = current_schema()")
+        )
+        existing = set(result.scalars())
+        missing = [
+            table for table in Base.metadata.sorted_tables
+            if table.name not in existing
+        ]
+        if missing:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=missing,
+                checkfirst=False,
+            )
+    
+    try:
+        SCHEMA_HASH_FILE.write_text(fingerprint)
+    except OSError as e:
+        logger.warning("Failed to record schema fingerprint: %s", e)
@@ -4,6 +4,8 @@ Provides async database engine and session factory.
 """
 
 from collections.abc import AsyncGenerator
+from typing import Any, Dict
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -13,13 +15,44 @@ from sqlalchemy.ext.asyncio import (
 
 from app.core.config import settings
 
+
+def _connect_args() -> Dict[str, Any]:
+    """Build asyncpg connection arguments for the configured deployment."""
+    connect_args: Dict[str, Any] = {
+        # Short OLTP queries never benefit from JIT compilation
+        "server_settings": {"jit": "off"},
+    }
+    
+    if settings.DATABASE_PGBOUNCER_MODE:
+        # PgBouncer transaction pooling can hand each transaction a different
+        # server connection, so prepared statements must not be reused and
+        # their names must be unique across clients.
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+        )
+    else:
+        # asyncpg's own cache and SQLAlchemy's statement-name cache
+        connect_args.update(
+            statement_cache_size=settings.DATABASE_STATEMENT_CACHE_SIZE,
+            prepared_statement_cache_size=settings.DATABASE_STATEMENT_CACHE_SIZE // 4,
+        )
+    
+    return connect_args
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,  # Verify connections before using
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,  # Compiled SQL per query shape
+    connect_args=_connect_args(),
 )
 
 # Create session factory
@@ -35,6 +68,12 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions.
     
+    The session is committed when the request handler returns. Since
+    FastAPI 0.106 the exit code of yield dependencies runs before the
+    response is sent, so services only need to ``flush()`` their writes
+    and the single commit here is guaranteed to finish before the client
+    sees a 2xx.
+    
     Usage:
         @app.get("/items")
         async def get_items(db: AsyncSession = Depends(get_db)):
@@ -1,3 +1,17 @@
 """Dependency injection functions for FastAPI."""
 
-from app.dependencies.auth import get_current_user, require_auth  # noqa: F401
+from app.dependencies.accounts import valid_owned_account  # noqa: F401
+from app.dependencies.analytics import valid_owned_analytics  # noqa: F401
+from app.dependencies.auth import (  # noqa: F401
+    get_current_user,
+    get_optional_user,
+    require_auth,
+)
+from app.dependencies.buffer import get_user_buffer_service  # noqa: F401
+from app.dependencies.campaigns import valid_owned_campaign  # noqa: F401
+from app.dependencies.pagination import get_cursor  # noqa: F401
+from app.dependencies.posts import valid_owned_post  # noqa: F401
+from app.dependencies.services import (  # noqa: F401
+    get_buffer_config_service,
+    get_scheduled_post_service,
+)
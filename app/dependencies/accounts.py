@@ -0,0 +1,46 @@
+"""Social account dependencies.
+
+Provides dependency functions that load a social account owned by the
+current user in a single query.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.dependencies.auth import CurrentUser, get_current_user
+from app.models.social_account import SocialAccount
+from app.services.social_account_service import SocialAccountService
+
+
+async def valid_owned_account(
+    account_id: int,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db),
+) -> SocialAccount:
+    """Load a social account owned by the current user.
+    
+    Args:
+        account_id: Account ID from the request path
+        current_user: Authenticated user
+        db: Database session
+    
+    Returns:
+        The loaded social account
+    
+    Raises:
+        HTTPException: 404 if the account does not exist or belongs
+            to another user
+    """
+    account = await SocialAccountService(db).get_owned_account(
+        account_id, current_user.user_id
+    )
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Social account {account_id} not found",
+        )
+    
+    return account
@@ -0,0 +1,46 @@
+"""Post analytics dependencies.
+
+Provides dependency functions that load an analytics record owned
+(through its post) by the current user in a single query.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.dependencies.auth import CurrentUser, get_current_user
+from app.models.post_analytics import PostAnalytics
+from app.services.post_analytics_service import PostAnalyticsService
+
+
+async def valid_owned_analytics(
+    analytics_id: int,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db),
+) -> PostAnalytics:
+    """Load an analytics record whose post is owned by the current user.
+    
+    Args:
+        analytics_id: Analytics record ID from the request path
+        current_user: Authenticated user
+        db: Database session
+    
+    Returns:
+        The loaded analytics record
+    
+    Raises:
+        HTTPException: 404 if the record does not exist or its post
+            belongs to another user
+    """
+    analytics = await PostAnalyticsService(db).get_owned_analytics(
+        analytics_id, current_user.user_id
+    )
+    if not analytics:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Analytics {analytics_id} not found",
+        )
+    
+    return analytics
@@ -3,33 +3,71 @@
 Provides dependency functions for protecting routes and extracting user context.
 """
 
-from typing import Optional
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Annotated, Iterable, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError
 
-from app.core.security import decode_token
+from app.core.security import JWTError, decode_token
 
-# HTTP Bearer token security scheme
+# HTTP Bearer token security schemes. The optional one returns None for
+# requests without an Authorization header instead of raising a 403.
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+
+def _credentials_exc() -> HTTPException:
+    """Build the 401 raised for any missing or invalid token.
+    
+    A fresh instance per failure: re-raising a shared exception would keep
+    appending frames to its ``__traceback__``.
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+# Decoded users by token digest, with the token's expiry timestamp.
+# Tokens are immutable until they expire, so a cached decode stays valid.
+TOKEN_CACHE_SIZE = 10_000
+_token_cache: "OrderedDict[bytes, Tuple[float, CurrentUser]]" = OrderedDict()
 
 
 class CurrentUser:
     """Current user context extracted from JWT token.
     
     This class represents the authenticated user making the request.
-    Add additional fields as needed for your application.
+    Add additional fields as needed for your application (and to
+    ``__slots__``). Instances are shared across requests through the
+    token cache, so roles are stored as an immutable tuple.
     """
     
-    def __init__(self, user_id: int, email: str, roles: list[str] = None):
+    __slots__ = ("user_id", "email", "roles", "_role_set")
+    
+    def __init__(
+        self,
+        user_id: int,
+        email: str,
+        roles: Optional[Iterable[str]] = None,
+    ):
         self.user_id = user_id
         self.email = email
-        self.roles = roles or []
+        self.roles: Tuple[str, ...] = tuple(roles or ())
+        self._role_set = frozenset(self.roles)
     
     def has_role(self, role: str) -> bool:
         """Check if user has a specific role."""
-        return role in self.roles
+        return role in self._role_set
+    
+    def has_any_role(self, roles: frozenset[str]) -> bool:
+        """Check if user has at least one of the given roles."""
+        return not self._role_set.isdisjoint(roles)
     
     def __repr__(self) -> str:
         return f"<CurrentUser(user_id={self.user_id}, email='{self.email}')>"
@@ -41,10 +79,17 @@ async def get_current_user(
     """Extract and validate current user from JWT token.
     
     This dependency can be used to protect routes and get user context.
+    Keep it a module-level function: FastAPI caches dependency results per
+    request by callable identity, so nested dependencies such as
+    ``require_auth`` and the ownership checks share a single token decode.
+    Across requests, decoded tokens are kept in an LRU cache keyed by a
+    BLAKE2b digest of the token until the token expires.
     
     Usage:
         @router.get("/protected")
-        async def protected_route(user: CurrentUser = Depends(get_current_user)):
+        async def protected_route(
+            user: Annotated[CurrentUser, Depends(get_current_user)],
+        ):
             return {"user_id": user.user_id}
     
     Args:
@@ -56,14 +101,45 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or missing
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    return _authenticate(credentials.credentials)
+
+
+async def get_optional_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+) -> Optional[CurrentUser]:
+    """Extract the current user if the request carries a bearer token.
+    
+    For routes that serve anonymous callers too. Requests without an
+    Authorization header get None without going through an exception;
+    a token that is present but invalid is still rejected.
+    
+    Args:
+        credentials: HTTP Bearer credentials from request header, if any
+    
+    Returns:
+        CurrentUser object or None for anonymous requests
+    
+    Raises:
+        HTTPException: If a token is given but invalid
+    """
+    if credentials is None:
+        return None
+    return _authenticate(credentials.credentials)
+
+
+def _authenticate(token: str) -> CurrentUser:
+    """Decode a bearer token into a CurrentUser, using the token cache."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    cached = _token_cache.get(key)
+    if cached is not None:
+        expires_at, user = cached
+        if expires_at > time.time():
+            _token_cache.move_to_end(key)
+            return user
+        del _token_cache[key]
     
     try:
-        token = credentials.credentials
         payload = decode_token(token)
         
         # Extract user information from token
@@ -72,19 +148,28 @@ async def get_current_user(
         roles: list[str] = payload.get("roles", [])
         
         if user_id is None:
-            raise credentials_exception
+            raise _credentials_exc()
         
-        return CurrentUser(
+        user = CurrentUser(
             user_id=int(user_id),
             email=email or "",
             roles=roles,
         )
     
     except (JWTError, ValueError):
-        raise credentials_exception
+        raise _credentials_exc() from None
+    
+    # Only tokens with an expiry are cached; it bounds how long the entry lives
+    expires_at = payload.get("exp")
+    if expires_at is not None:
+        _token_cache[key] = (float(expires_at), user)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    
+    return user
 
 
-def require_auth(required_roles: list[str] = None):
+def require_auth(required_roles: Optional[Iterable[str]] = None):
     """Create a dependency that requires specific roles.
     
     This is a dependency factory that returns a dependency function.
@@ -97,19 +182,30 @@ def require_auth(required_roles: list[str] = None):
         ):
             return {"message": "Admin access granted"}
     
+    Calls with the same roles, in any order, return the same dependency
+    function, so FastAPI treats them as one dependency and resolves it
+    once per request.
+    
     Args:
         required_roles: List of roles required to access the route
     
     Returns:
         Dependency function that validates user roles
     """
+    return _require_roles(tuple(sorted(set(required_roles or ()))))
+
+
+@lru_cache(maxsize=None)
+def _require_roles(required_roles: Tuple[str, ...]):
+    """Build the role-checking dependency for a normalized set of roles."""
+    required_set = frozenset(required_roles)
     
     async def check_roles(
-        user: CurrentUser = Depends(get_current_user),
+        user: Annotated[CurrentUser, Depends(get_current_user)],
     ) -> CurrentUser:
         """Check if user has required roles."""
-        if required_roles:
-            if not any(user.has_role(role) for role in required_roles):
+        if required_set:
+            if not user.has_any_role(required_set):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Insufficient permissions",
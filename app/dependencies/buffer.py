@@ -0,0 +1,46 @@
+"""Buffer dependencies.
+
+Provides the Buffer service for the current user as a request-scoped
+dependency, so endpoints share one config lookup per request.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+
+from app.dependencies.auth import CurrentUser, get_current_user
+from app.dependencies.services import get_buffer_config_service
+from app.services.buffer_config_service import BufferConfigService
+from app.services.buffer_service import BufferService
+
+
+async def get_user_buffer_service(
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    buffer_config_service: BufferConfigService = Depends(get_buffer_config_service),
+) -> BufferService:
+    """Get the Buffer service configured for the current user.
+    
+    FastAPI caches the result for the rest of the request, so the
+    configuration is looked up once no matter how many dependencies
+    or handlers need it.
+    
+    Args:
+        current_user: Authenticated user
+        buffer_config_service: Buffer config service for the request
+    
+    Returns:
+        Buffer service for the user's active configuration
+    
+    Raises:
+        HTTPException: 400 if Buffer is not configured for the user
+    """
+    buffer_service = await buffer_config_service.get_buffer_service(
+        current_user.user_id
+    )
+    if not buffer_service:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Buffer is not configured for this user",
+        )
+    
+    return buffer_service
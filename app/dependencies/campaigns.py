@@ -0,0 +1,53 @@
+"""Campaign dependencies.
+
+Provides dependency functions that load a campaign and verify ownership
+in a single step, so endpoints can operate on the loaded model directly.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.dependencies.auth import CurrentUser, get_current_user
+from app.models.campaign import Campaign
+from app.services.campaign_service import CampaignService
+
+
+async def valid_owned_campaign(
+    campaign_id: int,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db),
+) -> Campaign:
+    """Load a campaign owned by the current user.
+    
+    Usage:
+        @router.put("/{campaign_id}")
+        async def update_campaign(
+            campaign: Campaign = Depends(valid_owned_campaign),
+        ):
+            ...
+    
+    Args:
+        campaign_id: Campaign ID from the request path
+        current_user: Authenticated user
+        db: Database session
+    
+    Returns:
+        The loaded campaign
+    
+    Raises:
+        HTTPException: 404 if the campaign does not exist or belongs
+            to another user, so IDs can't be probed for existence
+    """
+    campaign = await CampaignService(db).get_owned_campaign(
+        campaign_id, current_user.user_id
+    )
+    if not campaign:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Campaign {campaign_id} not found",
+        )
+    
+    return campaign
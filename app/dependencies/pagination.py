@@ -0,0 +1,33 @@
+"""Pagination dependencies.
+
+Provides the shared cursor query parameter for keyset-paginated lists.
+"""
+
+from typing import Optional
+
+from fastapi import HTTPException, Query, status
+
+from app.core.pagination import Cursor, decode_cursor
+
+
+def get_cursor(
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from the X-Next-Cursor header of the previous page",
+    ),
+) -> Optional[Cursor]:
+    """Decode the optional keyset pagination cursor.
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if cursor is None:
+        return None
+    
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
@@ -0,0 +1,45 @@
+"""Scheduled post dependencies.
+
+Provides dependency functions that load a scheduled post and verify
+ownership in a single step.
+"""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+
+from app.dependencies.auth import CurrentUser, get_current_user
+from app.dependencies.services import get_scheduled_post_service
+from app.models.scheduled_post import ScheduledPost
+from app.services.scheduled_post_service import ScheduledPostService
+
+
+async def valid_owned_post(
+    post_id: int,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: ScheduledPostService = Depends(get_scheduled_post_service),
+) -> ScheduledPost:
+    """Load a scheduled post owned by the current user.
+    
+    Args:
+        post_id: Post ID from the request path
+        current_user: Authenticated user
+        service: Scheduled post service for the request
+    
+    Returns:
+        The loaded scheduled post
+    
+    Raises:
+        HTTPException: 404 if the post does not exist or belongs
+            to another user
+    """
+    post = await service.get_owned_post(
+        post_id, current_user.user_id
+    )
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Post {post_id} not found",
+        )
+    
+    return post
@@ -0,0 +1,27 @@
+"""Service dependencies.
+
+Provides request-scoped service instances. FastAPI caches each
+dependency for the duration of a request, so handlers and other
+dependencies that ask for the same service share one instance.
+"""
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.services.buffer_config_service import BufferConfigService
+from app.services.scheduled_post_service import ScheduledPostService
+
+
+def get_scheduled_post_service(
+    db: AsyncSession = Depends(get_db),
+) -> ScheduledPostService:
+    """Get the scheduled post service for the request's session."""
+    return ScheduledPostService(db)
+
+
+def get_buffer_config_service(
+    db: AsyncSession = Depends(get_db),
+) -> BufferConfigService:
+    """Get the Buffer config service for the request's session."""
+    return BufferConfigService(db)
@@ -5,18 +5,23 @@ It sets up the FastAPI app with middleware, routers, and event handlers.
 """
 
 import logging
+import uuid
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.v1.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.cors import FastCORSMiddleware
+from app.core.http import close_http_clients
 from app.core.logging import setup_logging
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.db.init_db import create_dev_schema
 from app.db.session import engine
-from app.db.base import Base
 
 # Set up logging
 setup_logging()
@@ -33,14 +38,13 @@ async def lifespan(app: FastAPI):
     
     # Create database tables (in production, use Alembic migrations)
     if settings.ENVIRONMENT == "development":
-        logger.info("Creating database tables...")
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        await create_dev_schema(engine)
     
     yield
     
     # Shutdown
     logger.info(f"Shutting down {settings.PROJECT_NAME}...")
+    await close_http_clients()
     await engine.dispose()
 
 
@@ -53,35 +57,67 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_STR}/docs",
     redoc_url=f"{settings.API_V1_STR}/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
 # CORS middleware - configure based on your needs
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
-# GZip compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Compression middleware
+# List endpoints (analytics, campaigns, posts) return up to 500 rows of JSON.
+# Responses under ~1500 bytes fit in one packet and are sent as-is. Brotli at
+# quality 4 compresses JSON faster than gzip at a similar ratio; clients
+# without Brotli get gzip level 5.
+app.add_middleware(CompressionMiddleware, minimum_size=1500, brotli_quality=4, gzip_level=5)
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+# HTTP exceptions are expected outcomes (401, 404, 409, ...) and are
+# answered without traceback formatting. Server-side ones are logged.
+@app.exception_handler(StarletteHTTPException)
+async def logging_http_exception_handler(request: Request, exc: StarletteHTTPException):
+    """Log 5xx HTTP exceptions and render them with FastAPI's default handler."""
+    if exc.status_code >= 500:
+        logger.warning(
+            "%s %s returned %s: %s",
+            request.method,
+            request.url.path,
+            exc.status_code,
+            exc.detail,
+        )
+    return await http_exception_handler(request, exc)
+
+
 # Global exception handler
+# Endpoints only catch errors they can map to a specific status; anything
+# else ends up here and is logged and rendered once.
 @app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
+async def global_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    logger.exception(
+        "Unhandled exception on %s %s (request %s)",
+        request.method,
+        request.url.path,
+        request_id,
+        exc_info=exc,
+    )
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
             "type": "internal_error",
+            "request_id": request_id,
         },
     )
 
@@ -94,5 +130,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=settings.PORT,
         reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
+        access_log=settings.DEBUG,
         log_level="info",
     )
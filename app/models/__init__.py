@@ -5,6 +5,7 @@ Import all models here for Alembic migrations to work properly.
 
 from app.models.buffer_config import BufferConfig
 from app.models.campaign import Campaign, CampaignStatus, CampaignType
+from app.models.campaign_tags import campaign_tags
 from app.models.post_analytics import PostAnalytics
 from app.models.scheduled_post import PostStatus, PostType, ScheduledPost
 from app.models.scheduled_post_accounts import scheduled_post_accounts
@@ -13,6 +14,7 @@ from app.models.social_account import (
     SocialAccount,
     SocialPlatform,
 )
+from app.models.tag import Tag
 from app.models.user import User
 
 __all__ = [
@@ -29,4 +31,6 @@ __all__ = [
     "CampaignStatus",
     "BufferConfig",
     "scheduled_post_accounts",
+    "Tag",
+    "campaign_tags",
 ]
@@ -25,7 +25,7 @@ class BufferConfig(Base):
         token_expires_at: Token expiration timestamp
         organization_id: Buffer organization ID
         is_active: Whether this configuration is active
-        created_by: User who created this configuration
+        created_by: User who owns this configuration (one per user)
     """
     
     __tablename__ = "buffer_configs"
@@ -58,11 +58,5 @@ class BufferConfig(Base):
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
+        unique=True,  # One configuration per user; create_config upserts on it
     )
-    
-    def __repr__(self) -> str:
-        return (
-            f"<BufferConfig(id={self.id}, "
-            f"is_active={self.is_active}, "
-            f"organization_id='{self.organization_id}')>"
-        )
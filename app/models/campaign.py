@@ -4,21 +4,23 @@ Manages social media campaigns and coordinated posts.
 """
 
 from datetime import date
-from enum import Enum as PyEnum
-from typing import TYPE_CHECKING, Optional
+from enum import StrEnum
+from typing import TYPE_CHECKING, Iterable, Optional
 from uuid import UUID
 
-from sqlalchemy import Date, Enum, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy import Date, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base_class import Base
+from app.db.base_class import Base, enum_check
+from app.models.social_account import decode_platforms, encode_platforms
 
 if TYPE_CHECKING:
     from app.models.scheduled_post import ScheduledPost
+    from app.models.tag import Tag
 
 
-class CampaignType(str, PyEnum):
+class CampaignType(StrEnum):
     """Campaign type enum."""
     AWARENESS = "awareness"
     FUNDRAISING = "fundraising"
@@ -26,7 +28,7 @@ class CampaignType(str, PyEnum):
     GENERAL = "general"
 
 
-class CampaignStatus(str, PyEnum):
+class CampaignStatus(StrEnum):
     """Campaign status enum."""
     DRAFT = "draft"
     ACTIVE = "active"
@@ -47,13 +49,27 @@ class Campaign(Base):
         status: Current campaign status
         start_date: Campaign start date
         end_date: Campaign end date (optional)
-        target_platforms: Platforms targeted by this campaign
+        target_platforms_mask: Targeted platforms as a bitmask of PLATFORM_BITS
+            (read and written through the target_platforms property)
         goals: Campaign goals and KPIs
-        tags: Campaign tags for organization
+        tag_records: Tags for organization, via campaign_tags
+            (names are exposed through the tags property)
         created_by: User who created this campaign
     """
     
     __tablename__ = "campaigns"
+    __table_args__ = (
+        enum_check("campaigns", "campaign_type", CampaignType),
+        enum_check("campaigns", "status", CampaignStatus),
+        # A user's campaigns: ownership lookups and paging by creation time
+        Index("ix_campaigns_created_by_id", "created_by", "id"),
+        Index(
+            "ix_campaigns_created_by_created_at_id",
+            "created_by",
+            "created_at",
+            "id",
+        ),
+    )
     
     name: Mapped[str] = mapped_column(
         String(255),
@@ -64,14 +80,14 @@ class Campaign(Base):
         Text,
         nullable=True,
     )
-    campaign_type: Mapped[CampaignType] = mapped_column(
-        Enum(CampaignType),
+    campaign_type: Mapped[str] = mapped_column(
+        String(32),
         nullable=False,
         default=CampaignType.GENERAL,
         index=True,
     )
-    status: Mapped[CampaignStatus] = mapped_column(
-        Enum(CampaignStatus),
+    status: Mapped[str] = mapped_column(
+        String(32),
         nullable=False,
         default=CampaignStatus.DRAFT,
         index=True,
@@ -86,18 +102,15 @@ class Campaign(Base):
         nullable=True,
         index=True,
     )
-    target_platforms: Mapped[list[str]] = mapped_column(
-        ARRAY(String),
+    target_platforms_mask: Mapped[int] = mapped_column(
+        Integer,
         nullable=False,
+        default=0,
     )
     goals: Mapped[Optional[dict]] = mapped_column(
         JSONB,
         nullable=True,
     )  # {"reach": 10000, "engagement_rate": 5.0, "conversions": 100}
-    tags: Mapped[Optional[list[str]]] = mapped_column(
-        ARRAY(String),
-        nullable=True,
-    )
     created_by: Mapped[UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
@@ -108,11 +121,29 @@ class Campaign(Base):
     scheduled_posts: Mapped[list["ScheduledPost"]] = relationship(
         "ScheduledPost",
         back_populates="campaign",
+        lazy="raise",  # Never lazy-load posts while serializing campaigns
+        passive_deletes=True,  # campaign_id is ON DELETE SET NULL
     )
+    tag_records: Mapped[list["Tag"]] = relationship(
+        "Tag",
+        secondary="campaign_tags",
+        lazy="selectin",  # Serialized with every campaign
+        order_by="Tag.name",
+    )
+    
+    @property
+    def tags(self) -> list[str]:
+        """Campaign tags for organization.
+        
+        Set tags through CampaignService, which resolves names to Tag rows.
+        """
+        return [tag.name for tag in self.tag_records]
+    
+    @property
+    def target_platforms(self) -> list[str]:
+        """Platforms targeted by this campaign."""
+        return decode_platforms(self.target_platforms_mask or 0)
     
-    def __repr__(self) -> str:
-        return (
-            f"<Campaign(id={self.id}, "
-            f"name='{self.name}', "
-            f"status='{self.status.value}')>"
-        )
+    @target_platforms.setter
+    def target_platforms(self, platforms: Iterable[str]) -> None:
+        self.target_platforms_mask = encode_platforms(platforms)
@@ -0,0 +1,28 @@
+"""Association table for Campaign and Tag many-to-many relationship.
+
+This table links campaigns to the tags they are organized under.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, Table
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+
+from app.db.base_class import Base
+
+campaign_tags = Table(
+    "campaign_tags",
+    Base.metadata,
+    Column(
+        "campaign_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("campaigns.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "tag_id",
+        PGUUID(as_uuid=True),
+        ForeignKey("tags.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    # Campaigns with a given tag; the primary key covers the other direction
+    Index("ix_campaign_tags_tag_id", "tag_id"),
+)
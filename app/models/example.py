@@ -30,6 +30,3 @@ class ExampleModel(Base):
         default="active",
         index=True,
     )
-    
-    def __repr__(self) -> str:
-        return f"<ExampleModel(id={self.id}, title='{self.title}', status='{self.status}')>"
@@ -4,11 +4,10 @@ Tracks social media post performance and engagement metrics.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import DateTime, Double, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,11 +41,18 @@ class PostAnalytics(Base):
     """
     
     __tablename__ = "post_analytics"
+    __table_args__ = (
+        # A post's analytics in collection order
+        Index(
+            "ix_post_analytics_scheduled_post_id_collected_at",
+            "scheduled_post_id",
+            "collected_at",
+        ),
+    )
     
     scheduled_post_id: Mapped[UUID] = mapped_column(
         ForeignKey("scheduled_posts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     social_account_id: Mapped[UUID] = mapped_column(
         ForeignKey("social_accounts.id", ondelete="CASCADE"),
@@ -93,8 +99,8 @@ class PostAnalytics(Base):
         nullable=False,
         default=0,
     )
-    engagement_rate: Mapped[Optional[Decimal]] = mapped_column(
-        Numeric(5, 2),  # 5 digits, 2 decimal places (e.g., 100.00)
+    engagement_rate: Mapped[Optional[float]] = mapped_column(
+        Double,  # Percentage; round for display, not in storage
         nullable=True,
     )
     collected_at: Mapped[datetime] = mapped_column(
@@ -108,19 +114,14 @@ class PostAnalytics(Base):
     )
     
     # Relationships
+    # Not part of the analytics responses; load explicitly when needed
     scheduled_post: Mapped["ScheduledPost"] = relationship(
         "ScheduledPost",
         back_populates="analytics",
+        lazy="raise",
     )
     social_account: Mapped["SocialAccount"] = relationship(
         "SocialAccount",
         back_populates="post_analytics",
+        lazy="raise",
     )
-    
-    def __repr__(self) -> str:
-        return (
-            f"<PostAnalytics(id={self.id}, "
-            f"platform='{self.platform}', "
-            f"likes={self.likes}, "
-            f"shares={self.shares})>"
-        )
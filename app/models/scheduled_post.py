@@ -4,15 +4,16 @@ Manages scheduled social media posts.
 """
 
 from datetime import datetime
-from enum import Enum as PyEnum
-from typing import TYPE_CHECKING, Optional
+from enum import StrEnum
+from typing import TYPE_CHECKING, Iterable, Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base_class import Base
+from app.db.base_class import Base, enum_check
+from app.models.social_account import decode_platforms, encode_platforms
 
 if TYPE_CHECKING:
     from app.models.campaign import Campaign
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
     from app.models.social_account import SocialAccount
 
 
-class PostType(str, PyEnum):
+class PostType(StrEnum):
     """Post type enum."""
     TEXT = "text"
     IMAGE = "image"
@@ -29,7 +30,7 @@ class PostType(str, PyEnum):
     CAROUSEL = "carousel"
 
 
-class PostStatus(str, PyEnum):
+class PostStatus(StrEnum):
     """Post status enum."""
     DRAFT = "draft"
     SCHEDULED = "scheduled"
@@ -49,7 +50,8 @@ class ScheduledPost(Base):
         title: Post title (optional)
         text: Post text content
         media_urls: Array of image/video URLs
-        platforms: Target platforms for this post
+        platforms_mask: Target platforms as a bitmask of PLATFORM_BITS
+            (read and written through the platforms property)
         post_type: Type of post (text, image, video, etc.)
         scheduled_time: When to publish the post
         published_time: When the post was actually published
@@ -62,6 +64,20 @@ class ScheduledPost(Base):
     """
     
     __tablename__ = "scheduled_posts"
+    __table_args__ = (
+        enum_check("scheduled_posts", "post_type", PostType),
+        enum_check("scheduled_posts", "status", PostStatus),
+        # Due posts: status = 'scheduled' AND scheduled_time <= now()
+        Index("ix_scheduled_posts_status_scheduled_time", "status", "scheduled_time"),
+        # A user's posts: ownership lookups and paging by scheduled time
+        Index("ix_scheduled_posts_created_by_id", "created_by", "id"),
+        Index(
+            "ix_scheduled_posts_created_by_scheduled_time_id",
+            "created_by",
+            "scheduled_time",
+            "id",
+        ),
+    )
     
     content_id: Mapped[Optional[UUID]] = mapped_column(
         nullable=True,
@@ -79,12 +95,13 @@ class ScheduledPost(Base):
         ARRAY(String),
         nullable=True,
     )
-    platforms: Mapped[list[str]] = mapped_column(
-        ARRAY(String),
+    platforms_mask: Mapped[int] = mapped_column(
+        Integer,
         nullable=False,
+        default=0,
     )
-    post_type: Mapped[PostType] = mapped_column(
-        Enum(PostType),
+    post_type: Mapped[str] = mapped_column(
+        String(32),
         nullable=False,
         default=PostType.TEXT,
     )
@@ -98,11 +115,10 @@ class ScheduledPost(Base):
         nullable=True,
         index=True,
     )
-    status: Mapped[PostStatus] = mapped_column(
-        Enum(PostStatus),
+    status: Mapped[str] = mapped_column(
+        String(32),
         nullable=False,
         default=PostStatus.DRAFT,
-        index=True,
     )
     buffer_post_ids: Mapped[Optional[dict]] = mapped_column(
         JSONB,
@@ -124,7 +140,6 @@ class ScheduledPost(Base):
     created_by: Mapped[UUID] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     
     # Relationships
@@ -143,9 +158,11 @@ class ScheduledPost(Base):
         secondary="scheduled_post_accounts",
     )
     
-    def __repr__(self) -> str:
-        return (
-            f"<ScheduledPost(id={self.id}, "
-            f"status='{self.status.value}', "
-            f"scheduled='{self.scheduled_time}')>"
-        )
+    @property
+    def platforms(self) -> list[str]:
+        """Target platforms for this post."""
+        return decode_platforms(self.platforms_mask or 0)
+    
+    @platforms.setter
+    def platforms(self, platforms: Iterable[str]) -> None:
+        self.platforms_mask = encode_platforms(platforms)
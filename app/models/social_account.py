@@ -4,22 +4,22 @@ Manages social media accounts and their credentials.
 """
 
 from datetime import datetime
-from enum import Enum as PyEnum
-from typing import TYPE_CHECKING, Optional
+from enum import StrEnum
+from typing import TYPE_CHECKING, Iterable, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base_class import Base
+from app.db.base_class import Base, enum_check
 
 if TYPE_CHECKING:
     from app.models.scheduled_post import ScheduledPost
     from app.models.post_analytics import PostAnalytics
 
 
-class SocialPlatform(str, PyEnum):
+class SocialPlatform(StrEnum):
     """Social media platforms enum."""
     FACEBOOK = "facebook"
     TWITTER = "twitter"
@@ -29,7 +29,46 @@ class SocialPlatform(str, PyEnum):
     YOUTUBE = "youtube"
 
 
-class AccountStatus(str, PyEnum):
+# Bit stored for each platform in platform masks (ScheduledPost.platforms_mask,
+# Campaign.target_platforms_mask). The values are persisted: never renumber,
+# give new platforms the next free bit.
+PLATFORM_BITS: dict[str, int] = {
+    SocialPlatform.FACEBOOK: 1,
+    SocialPlatform.TWITTER: 2,
+    SocialPlatform.INSTAGRAM: 4,
+    SocialPlatform.LINKEDIN: 8,
+    SocialPlatform.TIKTOK: 16,
+    SocialPlatform.YOUTUBE: 32,
+}
+
+
+def encode_platforms(platforms: Iterable[str]) -> int:
+    """Pack platform names into a bitmask.
+    
+    Args:
+        platforms: Platform names or SocialPlatform members
+    
+    Returns:
+        Bitmask of PLATFORM_BITS
+    
+    Raises:
+        ValueError: If a platform is unknown
+    """
+    mask = 0
+    for platform in platforms:
+        try:
+            mask |= PLATFORM_BITS[str(platform)]
+        except KeyError:
+            raise ValueError(f"Unknown platform: {platform}") from None
+    return mask
+
+
+def decode_platforms(mask: int) -> list[str]:
+    """Unpack a bitmask into platform names, in PLATFORM_BITS order."""
+    return [str(platform) for platform, bit in PLATFORM_BITS.items() if mask & bit]
+
+
+class AccountStatus(StrEnum):
     """Social account status enum."""
     ACTIVE = "active"
     INACTIVE = "inactive"
@@ -59,9 +98,21 @@ class SocialAccount(Base):
     """
     
     __tablename__ = "social_accounts"
+    __table_args__ = (
+        enum_check("social_accounts", "platform", SocialPlatform),
+        enum_check("social_accounts", "status", AccountStatus),
+        # A user's accounts: ownership lookups and paging by creation time
+        Index("ix_social_accounts_created_by_id", "created_by", "id"),
+        Index(
+            "ix_social_accounts_created_by_created_at_id",
+            "created_by",
+            "created_at",
+            "id",
+        ),
+    )
     
-    platform: Mapped[SocialPlatform] = mapped_column(
-        Enum(SocialPlatform),
+    platform: Mapped[str] = mapped_column(
+        String(32),
         nullable=False,
         index=True,
     )
@@ -79,8 +130,8 @@ class SocialAccount(Base):
         nullable=True,
         index=True,
     )
-    status: Mapped[AccountStatus] = mapped_column(
-        Enum(AccountStatus),
+    status: Mapped[str] = mapped_column(
+        String(32),
         nullable=False,
         default=AccountStatus.ACTIVE,
         index=True,
@@ -127,11 +178,3 @@ class SocialAccount(Base):
         "PostAnalytics",
         back_populates="social_account",
     )
-    
-    def __repr__(self) -> str:
-        return (
-            f"<SocialAccount(id={self.id}, "
-            f"platform='{self.platform.value}', "
-            f"handle='{self.account_handle}', "
-            f"status='{self.status.value}')>"
-        )
@@ -0,0 +1,26 @@
+"""Tag database model.
+
+Stores each distinct tag name once; campaigns reference tags through
+the campaign_tags association table.
+"""
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class Tag(Base):
+    """Tag model.
+    
+    Attributes:
+        name: Tag name, unique across all tags
+    """
+    
+    __tablename__ = "tags"
+    
+    name: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        unique=True,
+    )
@@ -51,10 +51,3 @@ class User(Base):
         nullable=False,
         default=False,
     )
-    
-    def __repr__(self) -> str:
-        return (
-            f"<User(id={self.id}, "
-            f"username='{self.username}', "
-            f"email='{self.email}')>"
-        )
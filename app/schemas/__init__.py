@@ -15,6 +15,7 @@ from app.schemas.campaign import (
 from app.schemas.post_analytics import (
     PlatformAnalyticsSummary,
     PostAnalyticsCreate,
+    PostAnalyticsListItem,
     PostAnalyticsResponse,
     PostAnalyticsUpdate,
 )
@@ -46,6 +47,7 @@ __all__ = [
     "PostAnalyticsCreate",
     "PostAnalyticsUpdate",
     "PostAnalyticsResponse",
+    "PostAnalyticsListItem",
     "PlatformAnalyticsSummary",
     # Campaign
     "CampaignCreate",
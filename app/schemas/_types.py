@@ -0,0 +1,29 @@
+"""Field types and the base schema shared by the schema modules."""
+
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, SkipValidation, StringConstraints
+
+# Length limits shared by string fields. The maximums mirror the sizes of
+# the database columns, so they are kept in one place.
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+ShortName = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+ExternalId = Annotated[str, StringConstraints(max_length=255)]
+PlatformName = Annotated[str, StringConstraints(min_length=1, max_length=50)]
+Title = Annotated[str, StringConstraints(max_length=500)]
+
+# JSONB column read back from our own database. Response schemas pass it
+# through as stored instead of validating every key and value; request
+# schemas keep a plain ``dict`` so input is still checked.
+StoredJSON = SkipValidation[dict]
+
+
+class DeferredSchema(BaseModel):
+    """Base for resource schemas whose validators are built lazily.
+    
+    Pydantic normally compiles every schema's validator and serializer at
+    import. Most schemas are only used by a few routes, so deferring the
+    build to first use keeps start-up and auto-reload fast.
+    """
+    
+    model_config = ConfigDict(defer_build=True)
@@ -9,13 +9,14 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas._types import DeferredSchema, ExternalId, NonEmptyStr
 
-class BufferConfigBase(BaseModel):
+
+class BufferConfigBase(DeferredSchema):
     """Base schema with common fields."""
     
-    organization_id: Optional[str] = Field(
+    organization_id: Optional[ExternalId] = Field(
         None,
-        max_length=255,
         description="Buffer organization ID",
     )
     is_active: bool = Field(
@@ -29,9 +30,8 @@ class BufferConfigCreate(BufferConfigBase):
     
     Used for POST requests.
     """
-    access_token: str = Field(
+    access_token: NonEmptyStr = Field(
         ...,
-        min_length=1,
         description="Buffer API access token (will be encrypted)",
     )
     refresh_token: Optional[str] = Field(
@@ -51,10 +51,10 @@ class BufferConfigUpdate(BaseModel):
     All fields are optional for partial updates.
     """
     
-    access_token: Optional[str] = Field(None, min_length=1)
+    access_token: Optional[NonEmptyStr] = None
     refresh_token: Optional[str] = None
     token_expires_at: Optional[datetime] = None
-    organization_id: Optional[str] = Field(None, max_length=255)
+    organization_id: Optional[ExternalId] = None
     is_active: Optional[bool] = None
 
 
@@ -66,7 +66,7 @@ class BufferConfigResponse(BufferConfigBase):
     Excludes sensitive token fields.
     """
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: UUID
     created_by: UUID
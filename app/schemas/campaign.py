@@ -10,15 +10,15 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.campaign import CampaignStatus, CampaignType
+from app.models.social_account import SocialPlatform
+from app.schemas._types import DeferredSchema, ShortName, StoredJSON
 
 
-class CampaignBase(BaseModel):
+class CampaignBase(DeferredSchema):
     """Base schema with common fields."""
     
-    name: str = Field(
+    name: ShortName = Field(
         ...,
-        min_length=1,
-        max_length=255,
         description="Campaign name",
     )
     description: Optional[str] = Field(
@@ -37,7 +37,7 @@ class CampaignBase(BaseModel):
         None,
         description="Campaign end date (optional)",
     )
-    target_platforms: list[str] = Field(
+    target_platforms: list[SocialPlatform] = Field(
         ...,
         min_items=1,
         description="Platforms targeted by this campaign",
@@ -67,13 +67,13 @@ class CampaignUpdate(BaseModel):
     All fields are optional for partial updates.
     """
     
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[ShortName] = None
     description: Optional[str] = None
     campaign_type: Optional[CampaignType] = None
     status: Optional[CampaignStatus] = None
     start_date: Optional[date] = None
     end_date: Optional[date] = None
-    target_platforms: Optional[list[str]] = Field(None, min_items=1)
+    target_platforms: Optional[list[SocialPlatform]] = Field(None, min_items=1)
     goals: Optional[dict] = None
     tags: Optional[list[str]] = None
 
@@ -85,10 +85,11 @@ class CampaignResponse(CampaignBase):
     Includes database fields like id and timestamps.
     """
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: UUID
     status: CampaignStatus
+    goals: Optional[StoredJSON] = None
     created_by: UUID
     created_at: datetime
     updated_at: datetime
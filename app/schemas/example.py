@@ -9,8 +9,10 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas._types import DeferredSchema
 
-class ExampleBase(BaseModel):
+
+class ExampleBase(DeferredSchema):
     """Base schema with common fields."""
     
     title: str = Field(..., min_length=1, max_length=255, description="Example title")
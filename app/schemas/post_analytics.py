@@ -4,14 +4,15 @@ Schemas define the structure of API requests and responses.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas._types import DeferredSchema, PlatformName, ShortName, StoredJSON
 
-class PostAnalyticsBase(BaseModel):
+
+class PostAnalyticsBase(DeferredSchema):
     """Base schema with common fields."""
     
     scheduled_post_id: UUID = Field(
@@ -22,16 +23,12 @@ class PostAnalyticsBase(BaseModel):
         ...,
         description="Link to the social account",
     )
-    platform: str = Field(
+    platform: PlatformName = Field(
         ...,
-        min_length=1,
-        max_length=50,
         description="Platform name",
     )
-    platform_post_id: str = Field(
+    platform_post_id: ShortName = Field(
         ...,
-        min_length=1,
-        max_length=255,
         description="Platform-specific post ID",
     )
     likes: int = Field(
@@ -64,18 +61,15 @@ class PostAnalyticsBase(BaseModel):
         ge=0,
         description="Total number of times post was displayed",
     )
-    engagement_rate: Optional[Decimal] = Field(
+    engagement_rate: Optional[float] = Field(
         None,
+        ge=0,
         description="Calculated engagement rate percentage",
     )
     collected_at: datetime = Field(
         ...,
         description="When these metrics were collected",
     )
-    raw_data: Optional[dict] = Field(
-        None,
-        description="Full raw analytics data from platform",
-    )
 
 
 class PostAnalyticsCreate(PostAnalyticsBase):
@@ -83,7 +77,10 @@ class PostAnalyticsCreate(PostAnalyticsBase):
     
     Used for POST requests.
     """
-    pass
+    raw_data: Optional[dict] = Field(
+        None,
+        description="Full raw analytics data from platform",
+    )
 
 
 class PostAnalyticsUpdate(BaseModel):
@@ -99,24 +96,34 @@ class PostAnalyticsUpdate(BaseModel):
     clicks: Optional[int] = Field(None, ge=0)
     reach: Optional[int] = Field(None, ge=0)
     impressions: Optional[int] = Field(None, ge=0)
-    engagement_rate: Optional[Decimal] = None
+    engagement_rate: Optional[float] = Field(None, ge=0)
     collected_at: Optional[datetime] = None
     raw_data: Optional[dict] = None
 
 
-class PostAnalyticsResponse(PostAnalyticsBase):
-    """Schema for post analytics responses.
+class PostAnalyticsListItem(PostAnalyticsBase):
+    """Schema for post analytics in list responses.
     
-    Used for GET requests.
+    Omits raw_data, which list queries do not load.
     Includes database fields like id and timestamps.
     """
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: UUID
     created_at: datetime
 
 
+class PostAnalyticsResponse(PostAnalyticsListItem):
+    """Schema for post analytics responses.
+    
+    Used for GET requests on a single record.
+    Includes the full raw platform data.
+    """
+    
+    raw_data: Optional[StoredJSON] = None
+
+
 class PlatformAnalyticsSummary(BaseModel):
     """Summary analytics for a specific platform."""
     
@@ -128,3 +135,12 @@ class PlatformAnalyticsSummary(BaseModel):
     total_reach: int
     total_impressions: int
     avg_engagement_rate: Optional[float]
+
+
+class AnalyticsSyncJobResponse(BaseModel):
+    """Status of a background analytics sync job."""
+    
+    job_id: str
+    status: str = Field(..., description="queued, running, completed or failed")
+    synced: int = Field(0, description="Number of analytics records synced so far")
+    error: Optional[str] = None
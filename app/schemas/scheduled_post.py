@@ -10,30 +10,30 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.scheduled_post import PostStatus, PostType
+from app.models.social_account import SocialPlatform
+from app.schemas._types import DeferredSchema, NonEmptyStr, StoredJSON, Title
 
 
-class ScheduledPostBase(BaseModel):
+class ScheduledPostBase(DeferredSchema):
     """Base schema with common fields."""
     
     content_id: Optional[UUID] = Field(
         None,
         description="Optional link to Content Service content",
     )
-    title: Optional[str] = Field(
+    title: Optional[Title] = Field(
         None,
-        max_length=500,
         description="Post title",
     )
-    text: str = Field(
+    text: NonEmptyStr = Field(
         ...,
-        min_length=1,
         description="Post text content",
     )
     media_urls: Optional[list[str]] = Field(
         None,
         description="Array of image/video URLs",
     )
-    platforms: list[str] = Field(
+    platforms: list[SocialPlatform] = Field(
         ...,
         min_items=1,
         description="Target platforms for this post",
@@ -71,10 +71,10 @@ class ScheduledPostUpdate(BaseModel):
     All fields are optional for partial updates.
     """
     
-    title: Optional[str] = Field(None, max_length=500)
-    text: Optional[str] = Field(None, min_length=1)
+    title: Optional[Title] = None
+    text: Optional[NonEmptyStr] = None
     media_urls: Optional[list[str]] = None
-    platforms: Optional[list[str]] = Field(None, min_items=1)
+    platforms: Optional[list[SocialPlatform]] = Field(None, min_items=1)
     post_type: Optional[PostType] = None
     scheduled_time: Optional[datetime] = None
     status: Optional[PostStatus] = None
@@ -89,13 +89,13 @@ class ScheduledPostResponse(ScheduledPostBase):
     Includes database fields like id and timestamps.
     """
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: UUID
     published_time: Optional[datetime] = None
     status: PostStatus
-    buffer_post_ids: Optional[dict] = None
-    platform_post_ids: Optional[dict] = None
+    buffer_post_ids: Optional[StoredJSON] = None
+    platform_post_ids: Optional[StoredJSON] = None
     error_message: Optional[str] = None
     created_by: UUID
     created_at: datetime
@@ -10,36 +10,31 @@ from uuid import UUID
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.social_account import AccountStatus, SocialPlatform
+from app.schemas._types import DeferredSchema, ExternalId, ShortName, StoredJSON
 
 
-class SocialAccountBase(BaseModel):
+class SocialAccountBase(DeferredSchema):
     """Base schema with common fields."""
     
     platform: SocialPlatform = Field(..., description="Social media platform")
-    account_name: str = Field(
+    account_name: ShortName = Field(
         ...,
-        min_length=1,
-        max_length=255,
         description="Account display name",
     )
-    account_handle: str = Field(
+    account_handle: ShortName = Field(
         ...,
-        min_length=1,
-        max_length=255,
         description="Account handle/username (e.g., @username)",
     )
-    account_id: Optional[str] = Field(
+    account_id: Optional[ExternalId] = Field(
         None,
-        max_length=255,
         description="Platform-specific account ID",
     )
     status: AccountStatus = Field(
         AccountStatus.ACTIVE,
         description="Account status",
     )
-    buffer_profile_id: Optional[str] = Field(
+    buffer_profile_id: Optional[ExternalId] = Field(
         None,
-        max_length=255,
         description="Buffer profile ID",
     )
     is_primary: bool = Field(
@@ -78,14 +73,14 @@ class SocialAccountUpdate(BaseModel):
     All fields are optional for partial updates.
     """
     
-    account_name: Optional[str] = Field(None, min_length=1, max_length=255)
-    account_handle: Optional[str] = Field(None, min_length=1, max_length=255)
-    account_id: Optional[str] = Field(None, max_length=255)
+    account_name: Optional[ShortName] = None
+    account_handle: Optional[ShortName] = None
+    account_id: Optional[ExternalId] = None
     status: Optional[AccountStatus] = None
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
     token_expires_at: Optional[datetime] = None
-    buffer_profile_id: Optional[str] = Field(None, max_length=255)
+    buffer_profile_id: Optional[ExternalId] = None
     is_primary: Optional[bool] = None
     platform_metadata: Optional[dict] = None
 
@@ -98,9 +93,10 @@ class SocialAccountResponse(SocialAccountBase):
     Excludes sensitive token fields.
     """
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
     
     id: UUID
+    platform_metadata: Optional[StoredJSON] = None
     created_by: UUID
     created_at: datetime
     updated_at: datetime
@@ -2,6 +2,5 @@
 
 Services contain the core business logic of the application.
 They are called by API endpoints and interact with the database.
+Import each service from its own module.
 """
-
-from app.services.example_service import ExampleService  # noqa: F401
@@ -6,13 +6,19 @@ Handles business logic for Buffer API configuration.
 import logging
 from typing import Optional
 
-from sqlalchemy import select
+from redis.exceptions import RedisError
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.redis import get_redis
 from app.models.buffer_config import BufferConfig
 from app.schemas.buffer_config import BufferConfigCreate, BufferConfigUpdate
+from app.services.buffer_service import BufferService
 from app.services.providers.provider_factory import get_provider
 from app.services.providers.base_provider import ProviderError
+from app.services.social_account_service import SocialAccountService
 
 logger = logging.getLogger(__name__)
 
@@ -28,42 +34,73 @@ class BufferConfigService:
         """
         self.db = db
     
+    @staticmethod
+    def _token_cache_key(user_id: int) -> str:
+        return f"buffer_cfg:{user_id}"
+    
+    async def _invalidate_token(self, user_id: int) -> None:
+        """Drop the cached access token for a user.
+        
+        Connection test results of the user's accounts were obtained with
+        that token, so they are dropped as well.
+        """
+        try:
+            await get_redis().delete(self._token_cache_key(user_id))
+        except RedisError as e:
+            logger.warning("Failed to invalidate cached Buffer token for user %s: %s", user_id, e)
+        await SocialAccountService(self.db).invalidate_user_connections(user_id)
+    
+    async def _get_active_token(self, user_id: int) -> Optional[str]:
+        """Read the access token of a user's active configuration.
+        
+        Selects the single column instead of loading the config row.
+        """
+        result = await self.db.execute(
+            select(BufferConfig.access_token)
+            .where(
+                BufferConfig.user_id == user_id,
+                BufferConfig.is_active.is_(True),
+            )
+            .order_by(BufferConfig.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+    
+    async def _get_config_token(self, config_id: int) -> Optional[str]:
+        """Read the access token of a configuration by ID."""
+        result = await self.db.execute(
+            select(BufferConfig.access_token).where(BufferConfig.id == config_id)
+        )
+        return result.scalar_one_or_none()
+    
     async def create_config(
         self,
         user_id: int,
         config_data: BufferConfigCreate,
     ) -> BufferConfig:
-        """Create Buffer configuration.
+        """Create Buffer configuration, replacing the user's existing one.
         
         Args:
             user_id: User ID
             config_data: Configuration data
         
         Returns:
-            Created configuration
+            Created or replaced configuration
         """
-        # Check if config already exists for user
-        existing = await self.get_user_config(user_id)
-        if existing:
-            logger.warning(f"Buffer config already exists for user {user_id}")
-            # Update instead of create
-            return await self.update_config(
-                existing.id,
-                BufferConfigUpdate(**config_data.model_dump()),
+        # One statement both creates a first config and replaces an existing
+        # one; the unique index on the owner makes it race-free.
+        values = dict(config_data)
+        stmt = pg_insert(BufferConfig).values(user_id=user_id, **values)
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[BufferConfig.user_id],
+                set_={field: stmt.excluded[field] for field in values},
             )
-        
-        config = BufferConfig(
-            user_id=user_id,
-            access_token=config_data.access_token,
-            refresh_token=config_data.refresh_token,
-            token_expires_at=config_data.token_expires_at,
-            is_active=config_data.is_active if config_data.is_active is not None else True,
-            settings=config_data.settings or {},
+            .returning(BufferConfig)
+            .execution_options(populate_existing=True)
         )
-        
-        self.db.add(config)
-        await self.db.commit()
-        await self.db.refresh(config)
+        config = (await self.db.scalars(stmt)).one()
+        await self._invalidate_token(user_id)
         
         logger.info(f"Created Buffer config for user {user_id}")
         return config
@@ -112,17 +149,27 @@ class BufferConfigService:
         Returns:
             Updated configuration or None
         """
-        config = await self.get_config(config_id)
+        # Read the set fields directly; model_dump would copy every value
+        update_data = {
+            field: getattr(config_data, field)
+            for field in config_data.model_fields_set
+        }
+        if not update_data:
+            return await self.get_config(config_id)
+        
+        # UPDATE ... RETURNING brings back updated_at and all other columns
+        # in the same round trip, so no refresh is needed
+        result = await self.db.scalars(
+            update(BufferConfig)
+            .where(BufferConfig.id == config_id)
+            .values(**update_data)
+            .returning(BufferConfig)
+            .execution_options(populate_existing=True)
+        )
+        config = result.one_or_none()
         if not config:
             return None
-        
-        # Update fields
-        update_data = config_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(config, field, value)
-        
-        await self.db.commit()
-        await self.db.refresh(config)
+        await self._invalidate_token(config.user_id)
         
         logger.info(f"Updated Buffer config {config_id}")
         return config
@@ -136,12 +183,15 @@ class BufferConfigService:
         Returns:
             True if deleted, False if not found
         """
-        config = await self.get_config(config_id)
-        if not config:
+        result = await self.db.execute(
+            delete(BufferConfig)
+            .where(BufferConfig.id == config_id)
+            .returning(BufferConfig.user_id)
+        )
+        user_id = result.scalar_one_or_none()
+        if user_id is None:
             return False
-        
-        await self.db.delete(config)
-        await self.db.commit()
+        await self._invalidate_token(user_id)
         
         logger.info(f"Deleted Buffer config {config_id}")
         return True
@@ -158,11 +208,11 @@ class BufferConfigService:
         Returns:
             True if connection successful
         """
-        config = await self.get_config(config_id)
-        if not config or not config.access_token:
+        access_token = await self._get_config_token(config_id)
+        if not access_token:
             return False
         
-        buffer_service = BufferService(access_token=config.access_token)
+        buffer_service = BufferService(access_token=access_token)
         return await buffer_service.test_connection()
     
     async def get_buffer_service(
@@ -171,14 +221,34 @@ class BufferConfigService:
     ) -> Optional[BufferService]:
         """Get Buffer service instance for a user.
         
+        The active access token is cached in Redis for
+        BUFFER_CONFIG_CACHE_TTL seconds, so most calls skip the database.
+        The cache is cleared whenever the configuration changes.
+        
         Args:
             user_id: User ID
         
         Returns:
             Buffer service instance or None
         """
-        config = await self.get_user_config(user_id)
-        if not config or not config.is_active or not config.access_token:
+        redis = get_redis()
+        key = self._token_cache_key(user_id)
+        
+        try:
+            token = await redis.get(key)
+        except RedisError as e:
+            logger.warning("Buffer token cache unavailable: %s", e)
+            token = None
+        if token:
+            return BufferService(access_token=token.decode())
+        
+        access_token = await self._get_active_token(user_id)
+        if not access_token:
             return None
         
-        return BufferService(access_token=config.access_token)
+        try:
+            await redis.set(key, access_token, ex=settings.BUFFER_CONFIG_CACHE_TTL)
+        except RedisError as e:
+            logger.warning("Failed to cache Buffer token for user %s: %s", user_id, e)
+        
+        return BufferService(access_token=access_token)
@@ -8,11 +8,15 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 import httpx
+import orjson
 
 from app.core.config import settings
+from app.core.http import get_buffer_client, parse_json
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
 
 class BufferAPIError(Exception):
     """Exception raised for Buffer API errors."""
@@ -34,15 +38,20 @@ class BufferService:
     - Retrieve post analytics
     """
     
-    def __init__(self, access_token: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize Buffer service.
         
         Args:
             access_token: Buffer API access token. If not provided, uses environment variable.
+            client: HTTP client to use. Defaults to the shared Buffer client.
         """
         self.access_token = access_token or getattr(settings, 'BUFFER_ACCESS_TOKEN', None)
         self.base_url = getattr(settings, 'BUFFER_API_URL', 'https://api.bufferapp.com/1')
-        self.timeout = 30.0
+        self.client = client or get_buffer_client()
     
     async def _make_request(
         self,
@@ -76,36 +85,40 @@ class BufferService:
         params['access_token'] = self.access_token
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    params=params,
-                )
-                
-                # Check for errors
-                if response.status_code >= 400:
-                    error_msg = f"Buffer API error: {response.status_code}"
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get('message', error_msg)
-                    except Exception:
-                        error_msg = response.text or error_msg
-                    
-                    raise BufferAPIError(
-                        message=error_msg,
-                        status_code=response.status_code,
-                        response=response.json() if response.text else None,
-                    )
+            # Bodies are encoded with orjson instead of httpx's json.dumps
+            response = await self.client.request(
+                method=method,
+                url=url,
+                content=orjson.dumps(data) if data is not None else None,
+                params=params,
+                headers=_JSON_HEADERS if data is not None else None,
+            )
+            
+            # Check for errors
+            if response.status_code >= 400:
+                error_msg = f"Buffer API error: {response.status_code}"
+                error_data = None
+                try:
+                    error_data = parse_json(response)
+                    error_msg = error_data.get('message', error_msg)
+                except Exception:
+                    error_msg = response.text or error_msg
                 
-                return response.json() if response.text else {}
+                raise BufferAPIError(
+                    message=error_msg,
+                    status_code=response.status_code,
+                    response=error_data or None,
+                )
+            
+            return parse_json(response)
         
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling Buffer API: {e}")
+            logger.error("HTTP error calling Buffer API: %s", e)
             raise BufferAPIError(f"Network error: {str(e)}")
+        except BufferAPIError:
+            raise
         except Exception as e:
-            logger.error(f"Unexpected error calling Buffer API: {e}")
+            logger.error("Unexpected error calling Buffer API: %s", e)
             raise BufferAPIError(f"Unexpected error: {str(e)}")
     
     async def authenticate(self) -> Dict[str, Any]:
@@ -122,7 +135,7 @@ class BufferService:
             logger.info(f"Successfully authenticated with Buffer for user: {user_info.get('id')}")
             return user_info
         except BufferAPIError as e:
-            logger.error(f"Buffer authentication failed: {e.message}")
+            logger.error("Buffer authentication failed: %s", e.message)
             raise
     
     async def get_profiles(self) -> List[Dict[str, Any]]:
@@ -140,7 +153,7 @@ class BufferService:
             logger.info(f"Retrieved {len(profiles)} Buffer profiles")
             return profiles
         except BufferAPIError as e:
-            logger.error(f"Failed to get Buffer profiles: {e.message}")
+            logger.error("Failed to get Buffer profiles: %s", e.message)
             raise
     
     async def get_profile(self, profile_id: str) -> Dict[str, Any]:
@@ -160,7 +173,7 @@ class BufferService:
             logger.info(f"Retrieved Buffer profile: {profile_id}")
             return profile
         except BufferAPIError as e:
-            logger.error(f"Failed to get Buffer profile {profile_id}: {e.message}")
+            logger.error("Failed to get Buffer profile %s: %s", profile_id, e.message)
             raise
     
     async def create_post(
@@ -216,7 +229,7 @@ class BufferService:
             logger.info(f"Created Buffer post for {len(profile_ids)} profiles")
             return response
         except BufferAPIError as e:
-            logger.error(f"Failed to create Buffer post: {e.message}")
+            logger.error("Failed to create Buffer post: %s", e.message)
             raise
     
     async def update_post(self, post_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -241,7 +254,7 @@ class BufferService:
             logger.info(f"Updated Buffer post: {post_id}")
             return response
         except BufferAPIError as e:
-            logger.error(f"Failed to update Buffer post {post_id}: {e.message}")
+            logger.error("Failed to update Buffer post %s: %s", post_id, e.message)
             raise
     
     async def delete_post(self, post_id: str) -> Dict[str, Any]:
@@ -261,7 +274,7 @@ class BufferService:
             logger.info(f"Deleted Buffer post: {post_id}")
             return response
         except BufferAPIError as e:
-            logger.error(f"Failed to delete Buffer post {post_id}: {e.message}")
+            logger.error("Failed to delete Buffer post %s: %s", post_id, e.message)
             raise
     
     async def get_post(self, post_id: str) -> Dict[str, Any]:
@@ -281,7 +294,7 @@ class BufferService:
             logger.info(f"Retrieved Buffer post: {post_id}")
             return response
         except BufferAPIError as e:
-            logger.error(f"Failed to get Buffer post {post_id}: {e.message}")
+            logger.error("Failed to get Buffer post %s: %s", post_id, e.message)
             raise
     
     async def get_post_analytics(self, post_id: str) -> Dict[str, Any]:
@@ -318,7 +331,7 @@ class BufferService:
             logger.info(f"Retrieved analytics for Buffer post: {post_id}")
             return analytics
         except BufferAPIError as e:
-            logger.error(f"Failed to get analytics for Buffer post {post_id}: {e.message}")
+            logger.error("Failed to get analytics for Buffer post %s: %s", post_id, e.message)
             raise
     
     async def get_profile_analytics(
@@ -355,7 +368,7 @@ class BufferService:
             logger.info(f"Retrieved analytics for Buffer profile: {profile_id}")
             return response
         except BufferAPIError as e:
-            logger.error(f"Failed to get analytics for Buffer profile {profile_id}: {e.message}")
+            logger.error("Failed to get analytics for Buffer profile %s: %s", profile_id, e.message)
             raise
     
     async def test_connection(self) -> bool:
@@ -4,16 +4,19 @@ Handles business logic for social media campaigns.
 """
 
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import datetime
 
-from sqlalchemy import select, func
+from sqlalchemy import delete, lambda_stmt, select, func, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload
 
+from app.core.pagination import Cursor
 from app.models.campaign import Campaign, CampaignStatus, CampaignType
 from app.models.scheduled_post import ScheduledPost
 from app.models.post_analytics import PostAnalytics
+from app.models.tag import Tag
 from app.schemas.campaign import CampaignCreate, CampaignUpdate
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,28 @@ class CampaignService:
         """
         self.db = db
     
+    async def _get_tags(self, names: Iterable[str]) -> List[Tag]:
+        """Get Tag rows for the given names, creating any that are missing.
+        
+        Args:
+            names: Tag names (duplicates are ignored)
+        
+        Returns:
+            Tags in the order of their first occurrence in names
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return []
+        
+        await self.db.execute(
+            pg_insert(Tag)
+            .values([{'name': name} for name in names])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+        )
+        result = await self.db.scalars(select(Tag).where(Tag.name.in_(names)))
+        by_name = {tag.name: tag for tag in result.all()}
+        return [by_name[name] for name in names]
+    
     async def create_campaign(
         self,
         user_id: int,
@@ -55,9 +80,10 @@ class CampaignService:
             goals=campaign_data.goals or {},
             metadata=campaign_data.metadata or {},
         )
+        campaign.tag_records = await self._get_tags(campaign_data.tags or [])
         
         self.db.add(campaign)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(campaign)
         
         logger.info(f"Created campaign {campaign.id} for user {user_id}")
@@ -77,6 +103,32 @@ class CampaignService:
         )
         return result.scalar_one_or_none()
     
+    async def get_owned_campaign(
+        self,
+        campaign_id: int,
+        user_id: int,
+    ) -> Optional[Campaign]:
+        """Get a campaign by ID if it belongs to the given user.
+        
+        Args:
+            campaign_id: Campaign ID
+            user_id: Owning user ID
+        
+        Returns:
+            Campaign or None if it does not exist or is owned by someone else
+        """
+        # Every campaign route resolves its campaign here; the lambda is
+        # cached by code location, so only the two ids are rebound per call
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(Campaign).where(
+                    Campaign.id == campaign_id,
+                    Campaign.user_id == user_id,
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+    
     async def get_user_campaigns(
         self,
         user_id: int,
@@ -84,6 +136,7 @@ class CampaignService:
         campaign_type: Optional[CampaignType] = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[Cursor] = None,
     ) -> List[Campaign]:
         """Get campaigns for a user.
         
@@ -92,7 +145,8 @@ class CampaignService:
             status: Filter by status (optional)
             campaign_type: Filter by type (optional)
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (deprecated, use cursor)
+            cursor: Keyset position of the last campaign already returned
         
         Returns:
             List of campaigns
@@ -105,7 +159,10 @@ class CampaignService:
         if campaign_type:
             query = query.where(Campaign.campaign_type == campaign_type)
         
-        query = query.order_by(Campaign.created_at.desc())
+        if cursor:
+            query = query.where(tuple_(Campaign.created_at, Campaign.id) < cursor)
+        
+        query = query.order_by(Campaign.created_at.desc(), Campaign.id.desc())
         query = query.limit(limit).offset(offset)
         
         result = await self.db.execute(query)
@@ -113,73 +170,91 @@ class CampaignService:
     
     async def update_campaign(
         self,
-        campaign_id: int,
+        campaign: Campaign,
         campaign_data: CampaignUpdate,
-    ) -> Optional[Campaign]:
+    ) -> Campaign:
         """Update a campaign.
         
         Args:
-            campaign_id: Campaign ID
+            campaign: Campaign loaded in this session
             campaign_data: Updated campaign data
         
         Returns:
-            Updated campaign or None
+            Updated campaign
         """
-        campaign = await self.get_campaign(campaign_id)
-        if not campaign:
-            return None
-        
         # Update fields
-        update_data = campaign_data.model_dump(exclude_unset=True)
+        update_data = {
+            field: getattr(campaign_data, field)
+            for field in campaign_data.model_fields_set
+        }
+        if 'tags' in update_data:
+            campaign.tag_records = await self._get_tags(update_data.pop('tags') or [])
         for field, value in update_data.items():
             setattr(campaign, field, value)
         
-        await self.db.commit()
-        await self.db.refresh(campaign)
+        # The flush is one UPDATE ... RETURNING updated_at (eager_defaults),
+        # so the in-memory campaign is current without a refresh
+        await self.db.flush()
         
-        logger.info(f"Updated campaign {campaign_id}")
+        logger.info(f"Updated campaign {campaign.id}")
         return campaign
     
-    async def delete_campaign(self, campaign_id: int) -> bool:
+    async def delete_campaign(self, campaign: Campaign) -> bool:
         """Delete a campaign.
         
         Args:
-            campaign_id: Campaign ID
+            campaign: Campaign loaded in this session
         
         Returns:
-            True if deleted, False if not found
+            True if deleted
         """
-        campaign = await self.get_campaign(campaign_id)
-        if not campaign:
-            return False
-        
-        await self.db.delete(campaign)
-        await self.db.commit()
+        # A single DELETE; the database cascades the tag links and
+        # detaches posts (ON DELETE SET NULL), so the ORM does not need
+        # to delete the loaded tag collection row by row first
+        result = await self.db.execute(
+            delete(Campaign)
+            .where(Campaign.id == campaign.id)
+            .returning(Campaign.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         
-        logger.info(f"Deleted campaign {campaign_id}")
-        return True
+        logger.info(f"Deleted campaign {campaign.id}")
+        return deleted
     
     async def get_campaign_posts(
         self,
         campaign_id: int,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[Cursor] = None,
     ) -> List[ScheduledPost]:
         """Get all posts in a campaign.
         
         Args:
             campaign_id: Campaign ID
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (deprecated, use cursor)
+            cursor: Keyset position of the last post already returned
         
         Returns:
             List of scheduled posts
         """
+        # List responses do not include social accounts; raise instead of
+        # loading them so a future caller cannot add a query per post
         query = (
             select(ScheduledPost)
-            .options(selectinload(ScheduledPost.social_accounts))
+            .options(raiseload(ScheduledPost.social_accounts))
             .where(ScheduledPost.campaign_id == campaign_id)
-            .order_by(ScheduledPost.scheduled_time.desc())
+        )
+        
+        if cursor:
+            query = query.where(
+                tuple_(ScheduledPost.scheduled_time, ScheduledPost.id) < cursor
+            )
+        
+        query = (
+            query
+            .order_by(ScheduledPost.scheduled_time.desc(), ScheduledPost.id.desc())
             .limit(limit)
             .offset(offset)
         )
@@ -199,42 +274,37 @@ class CampaignService:
         Returns:
             Campaign analytics summary
         """
-        # Get post count
-        post_count_query = (
-            select(func.count(ScheduledPost.id))
-            .where(ScheduledPost.campaign_id == campaign_id)
-        )
-        post_count_result = await self.db.execute(post_count_query)
-        post_count = post_count_result.scalar() or 0
-        
-        # Get analytics summary
-        analytics_query = (
+        # Posts and their analytics in one query; the outer join keeps
+        # posts without analytics in the post count
+        query = (
             select(
+                func.count(func.distinct(ScheduledPost.id)).label('total_posts'),
                 func.count(PostAnalytics.id).label('total_analytics'),
-                func.sum(PostAnalytics.likes).label('total_likes'),
-                func.sum(PostAnalytics.comments).label('total_comments'),
-                func.sum(PostAnalytics.shares).label('total_shares'),
-                func.sum(PostAnalytics.clicks).label('total_clicks'),
-                func.sum(PostAnalytics.reach).label('total_reach'),
-                func.sum(PostAnalytics.impressions).label('total_impressions'),
-                func.avg(PostAnalytics.engagement_rate).label('avg_engagement_rate'),
+                func.coalesce(func.sum(PostAnalytics.likes), 0).label('total_likes'),
+                func.coalesce(func.sum(PostAnalytics.comments), 0).label('total_comments'),
+                func.coalesce(func.sum(PostAnalytics.shares), 0).label('total_shares'),
+                func.coalesce(func.sum(PostAnalytics.clicks), 0).label('total_clicks'),
+                func.coalesce(func.sum(PostAnalytics.reach), 0).label('total_reach'),
+                func.coalesce(func.sum(PostAnalytics.impressions), 0).label('total_impressions'),
+                func.coalesce(func.avg(PostAnalytics.engagement_rate), 0.0).label('avg_engagement_rate'),
             )
-            .join(ScheduledPost)
+            .select_from(ScheduledPost)
+            .outerjoin(PostAnalytics)
             .where(ScheduledPost.campaign_id == campaign_id)
         )
         
-        analytics_result = await self.db.execute(analytics_query)
-        analytics_row = analytics_result.first()
+        # Aggregates without GROUP BY always return exactly one row
+        row = (await self.db.execute(query)).one()
         
         return {
             'campaign_id': campaign_id,
-            'total_posts': post_count,
-            'total_analytics_records': analytics_row.total_analytics or 0 if analytics_row else 0,
-            'total_likes': analytics_row.total_likes or 0 if analytics_row else 0,
-            'total_comments': analytics_row.total_comments or 0 if analytics_row else 0,
-            'total_shares': analytics_row.total_shares or 0 if analytics_row else 0,
-            'total_clicks': analytics_row.total_clicks or 0 if analytics_row else 0,
-            'total_reach': analytics_row.total_reach or 0 if analytics_row else 0,
-            'total_impressions': analytics_row.total_impressions or 0 if analytics_row else 0,
-            'avg_engagement_rate': float(analytics_row.avg_engagement_rate or 0.0) if analytics_row else 0.0,
+            'total_posts': row.total_posts,
+            'total_analytics_records': row.total_analytics,
+            'total_likes': row.total_likes,
+            'total_comments': row.total_comments,
+            'total_shares': row.total_shares,
+            'total_clicks': row.total_clicks,
+            'total_reach': row.total_reach,
+            'total_impressions': row.total_impressions,
+            'avg_engagement_rate': float(row.avg_engagement_rate),
         }
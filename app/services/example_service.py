@@ -6,7 +6,7 @@ They provide a clean separation between API endpoints and data access.
 
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.example import ExampleModel
@@ -64,27 +64,30 @@ class ExampleService:
         example_data: ExampleUpdate,
     ) -> Optional[ExampleModel]:
         """Update an existing example."""
-        example = await self.get(example_id)
-        
-        if not example:
-            return None
-        
         # Update only provided fields
-        update_data = example_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(example, field, value)
+        update_data = {
+            field: getattr(example_data, field)
+            for field in example_data.model_fields_set
+        }
+        if not update_data:
+            return await self.get(example_id)
         
-        await self.db.flush()
-        await self.db.refresh(example)
-        return example
+        # One UPDATE ... RETURNING instead of select, flush and refresh
+        result = await self.db.scalars(
+            update(ExampleModel)
+            .where(ExampleModel.id == example_id)
+            .values(**update_data)
+            .returning(ExampleModel)
+            .execution_options(populate_existing=True)
+        )
+        return result.one_or_none()
     
     async def delete(self, example_id: int) -> bool:
         """Delete an example."""
-        example = await self.get(example_id)
-        
-        if not example:
-            return False
-        
-        await self.db.delete(example)
-        await self.db.flush()
-        return True
+        # RETURNING tells whether the row existed, without loading it first
+        result = await self.db.execute(
+            delete(ExampleModel)
+            .where(ExampleModel.id == example_id)
+            .returning(ExampleModel.id)
+        )
+        return result.scalar_one_or_none() is not None
@@ -3,21 +3,32 @@
 Handles business logic for social media post analytics.
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, date, timedelta
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import lambda_stmt, select, and_, func, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, selectinload
 
+from app.core.pagination import Cursor
 from app.models.post_analytics import PostAnalytics
 from app.models.scheduled_post import ScheduledPost
-from app.schemas.post_analytics import PostAnalyticsCreate, PostAnalyticsUpdate
+from app.schemas.post_analytics import (
+    PlatformAnalyticsSummary,
+    PostAnalyticsCreate,
+    PostAnalyticsUpdate,
+)
 from app.services.providers.provider_factory import get_provider
-from app.services.providers.base_provider import ProviderError
+from app.services.providers.base_provider import ProviderError, SocialMediaProvider
 
 logger = logging.getLogger(__name__)
 
+# Buffer analytics sync tuning
+SYNC_BATCH_SIZE = 50
+SYNC_CONCURRENCY = 8
+
 
 class PostAnalyticsService:
     """Service for managing post analytics."""
@@ -57,12 +68,53 @@ class PostAnalyticsService:
         )
         
         self.db.add(analytics)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(analytics)
         
         logger.info(f"Created analytics record {analytics.id} for post {analytics_data.post_id}")
         return analytics
     
+    async def bulk_create_analytics(
+        self,
+        analytics_data: List[PostAnalyticsCreate],
+    ) -> List[PostAnalytics]:
+        """Create many analytics records in a single INSERT.
+        
+        Args:
+            analytics_data: Analytics data for each record
+        
+        Returns:
+            Created analytics records
+        """
+        if not analytics_data:
+            return []
+        
+        rows = [
+            {
+                'post_id': data.post_id,
+                'platform': data.platform,
+                'likes': data.likes,
+                'comments': data.comments,
+                'shares': data.shares,
+                'clicks': data.clicks,
+                'reach': data.reach,
+                'impressions': data.impressions,
+                'engagement_rate': data.engagement_rate,
+                'recorded_at': data.recorded_at or datetime.utcnow(),
+                'metadata': data.metadata or {},
+            }
+            for data in analytics_data
+        ]
+        
+        result = await self.db.scalars(
+            insert(PostAnalytics).returning(PostAnalytics),
+            rows,
+        )
+        analytics = list(result.all())
+        
+        logger.info(f"Created {len(analytics)} analytics records")
+        return analytics
+    
     async def get_analytics(self, analytics_id: int) -> Optional[PostAnalytics]:
         """Get analytics record by ID.
         
@@ -77,6 +129,34 @@ class PostAnalyticsService:
         )
         return result.scalar_one_or_none()
     
+    async def get_owned_analytics(
+        self,
+        analytics_id: int,
+        user_id: int,
+    ) -> Optional[PostAnalytics]:
+        """Get analytics record by ID if its post belongs to the given user.
+        
+        Args:
+            analytics_id: Analytics record ID
+            user_id: Owning user ID
+        
+        Returns:
+            Analytics record or None if it does not exist or is owned by someone else
+        """
+        # Ownership goes through the post's user_id, so the cached lambda
+        # statement includes the join
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(PostAnalytics)
+                .join(ScheduledPost)
+                .where(
+                    PostAnalytics.id == analytics_id,
+                    ScheduledPost.user_id == user_id,
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+    
     async def get_post_analytics(
         self,
         post_id: int,
@@ -91,9 +171,13 @@ class PostAnalyticsService:
             end_date: Filter by end date (optional)
         
         Returns:
-            List of analytics records
+            List of analytics records, without raw_data loaded
         """
-        query = select(PostAnalytics).where(PostAnalytics.post_id == post_id)
+        query = (
+            select(PostAnalytics)
+            .where(PostAnalytics.post_id == post_id)
+            .options(defer(PostAnalytics.raw_data, raiseload=True))
+        )
         
         if start_date:
             query = query.where(PostAnalytics.recorded_at >= start_date)
@@ -113,6 +197,7 @@ class PostAnalyticsService:
         end_date: Optional[datetime] = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[Cursor] = None,
     ) -> List[PostAnalytics]:
         """Get analytics for all posts by a user.
         
@@ -121,15 +206,17 @@ class PostAnalyticsService:
             start_date: Filter by start date (optional)
             end_date: Filter by end date (optional)
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (deprecated, use cursor)
+            cursor: Keyset position of the last record already returned
         
         Returns:
-            List of analytics records
+            List of analytics records, without raw_data loaded
         """
         query = (
             select(PostAnalytics)
             .join(ScheduledPost)
             .where(ScheduledPost.user_id == user_id)
+            .options(defer(PostAnalytics.raw_data, raiseload=True))
         )
         
         if start_date:
@@ -138,7 +225,12 @@ class PostAnalyticsService:
         if end_date:
             query = query.where(PostAnalytics.recorded_at <= end_date)
         
-        query = query.order_by(PostAnalytics.recorded_at.desc())
+        if cursor:
+            query = query.where(
+                tuple_(PostAnalytics.recorded_at, PostAnalytics.id) < cursor
+            )
+        
+        query = query.order_by(PostAnalytics.recorded_at.desc(), PostAnalytics.id.desc())
         query = query.limit(limit).offset(offset)
         
         result = await self.db.execute(query)
@@ -163,11 +255,14 @@ class PostAnalyticsService:
             return None
         
         # Update fields
-        update_data = analytics_data.model_dump(exclude_unset=True)
+        update_data = {
+            field: getattr(analytics_data, field)
+            for field in analytics_data.model_fields_set
+        }
         for field, value in update_data.items():
             setattr(analytics, field, value)
         
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(analytics)
         
         logger.info(f"Updated analytics record {analytics_id}")
@@ -236,10 +331,102 @@ class PostAnalyticsService:
             'avg_engagement_rate': float(row.avg_engagement_rate or 0.0),
         }
     
+    async def get_platform_summaries(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[PlatformAnalyticsSummary]:
+        """Get analytics totals per platform for a user.
+        
+        Aggregated with GROUP BY in the database, so one row per platform
+        is returned no matter how many analytics records there are.
+        
+        Args:
+            user_id: User ID
+            start_date: Filter by start date (optional)
+            end_date: Filter by end date (optional)
+        
+        Returns:
+            Summaries ordered by platform
+        """
+        query = (
+            select(
+                PostAnalytics.platform,
+                func.count(func.distinct(PostAnalytics.post_id)).label('total_posts'),
+                func.coalesce(func.sum(PostAnalytics.likes), 0).label('total_likes'),
+                func.coalesce(func.sum(PostAnalytics.shares), 0).label('total_shares'),
+                func.coalesce(func.sum(PostAnalytics.comments), 0).label('total_comments'),
+                func.coalesce(func.sum(PostAnalytics.reach), 0).label('total_reach'),
+                func.coalesce(func.sum(PostAnalytics.impressions), 0).label('total_impressions'),
+                func.avg(PostAnalytics.engagement_rate).label('avg_engagement_rate'),
+            )
+            .join(ScheduledPost)
+            .where(ScheduledPost.user_id == user_id)
+        )
+        
+        if start_date:
+            query = query.where(PostAnalytics.recorded_at >= start_date)
+        
+        if end_date:
+            query = query.where(PostAnalytics.recorded_at <= end_date)
+        
+        # Rows are found through the user's posts (the scheduled_post_id
+        # index) and hash-aggregated; an index led by platform would have
+        # to be scanned across all users, so none is added for the GROUP BY
+        query = query.group_by(PostAnalytics.platform).order_by(PostAnalytics.platform)
+        
+        result = await self.db.execute(query)
+        return [
+            PlatformAnalyticsSummary.model_construct(
+                platform=row.platform,
+                total_posts=row.total_posts,
+                total_likes=row.total_likes,
+                total_shares=row.total_shares,
+                total_comments=row.total_comments,
+                total_reach=row.total_reach,
+                total_impressions=row.total_impressions,
+                avg_engagement_rate=(
+                    float(row.avg_engagement_rate)
+                    if row.avg_engagement_rate is not None
+                    else None
+                ),
+            )
+            for row in result
+        ]
+    
+    def _analytics_from_buffer(
+        self,
+        post: ScheduledPost,
+        buffer_analytics: Dict[str, Any],
+    ) -> PostAnalyticsCreate:
+        """Build an analytics record from a Buffer analytics payload.
+        
+        Args:
+            post: Post the analytics belong to (social accounts loaded)
+            buffer_analytics: Analytics returned by Buffer
+        
+        Returns:
+            Analytics data ready to be stored
+        """
+        return PostAnalyticsCreate(
+            post_id=post.id,
+            platform=post.social_accounts[0].platform if post.social_accounts else 'twitter',
+            likes=buffer_analytics.get('likes', 0),
+            comments=buffer_analytics.get('comments', 0),
+            shares=buffer_analytics.get('shares', 0),
+            clicks=buffer_analytics.get('clicks', 0),
+            reach=buffer_analytics.get('reach', 0),
+            impressions=buffer_analytics.get('impressions', 0),
+            engagement_rate=buffer_analytics.get('engagement_rate', 0.0),
+            recorded_at=datetime.utcnow(),
+            metadata={'source': 'buffer', 'raw_data': buffer_analytics},
+        )
+    
     async def sync_analytics_from_buffer(
         self,
         post_id: int,
-        
+        buffer_service: SocialMediaProvider,
     ) -> Optional[PostAnalytics]:
         """Sync analytics from Buffer for a post.
         
@@ -252,61 +439,90 @@ class PostAnalyticsService:
         """
         # Get post with Buffer ID
         result = await self.db.execute(
-            select(ScheduledPost).where(ScheduledPost.id == post_id)
+            select(ScheduledPost)
+            .options(selectinload(ScheduledPost.social_accounts))
+            .where(ScheduledPost.id == post_id)
         )
         post = result.scalar_one_or_none()
         
         if not post or not post.buffer_post_id:
-            logger.warning(f"Post {post_id} not found or missing Buffer ID")
+            logger.warning("Post %s not found or missing Buffer ID", post_id)
             return None
         
         try:
             # Get analytics from Buffer
-            buffer_analytics = await provider.get_post_analytics(post.buffer_post_id)
+            buffer_analytics = await buffer_service.get_post_analytics(post.buffer_post_id)
             
-            # Create analytics record
-            analytics_data = PostAnalyticsCreate(
-                post_id=post_id,
-                platform=post.social_accounts[0].platform if post.social_accounts else 'twitter',
-                likes=buffer_analytics.get('likes', 0),
-                comments=buffer_analytics.get('comments', 0),
-                shares=buffer_analytics.get('shares', 0),
-                clicks=buffer_analytics.get('clicks', 0),
-                reach=buffer_analytics.get('reach', 0),
-                impressions=buffer_analytics.get('impressions', 0),
-                engagement_rate=buffer_analytics.get('engagement_rate', 0.0),
-                recorded_at=datetime.utcnow(),
-                metadata={'source': 'buffer', 'raw_data': buffer_analytics},
+            analytics = await self.create_analytics(
+                self._analytics_from_buffer(post, buffer_analytics)
             )
-            
-            analytics = await self.create_analytics(analytics_data)
             logger.info(f"Synced analytics from Buffer for post {post_id}")
             return analytics
         
         except ProviderError as e:
-            logger.error(f"Failed to sync analytics for post {post_id}: {e.message}")
+            logger.error("Failed to sync analytics for post %s: %s", post_id, e.message)
             return None
     
-    async def bulk_sync_analytics(
+    async def _fetch_buffer_analytics(
         self,
-        user_id: int,
+        posts: List[ScheduledPost],
+        buffer_service: SocialMediaProvider,
+    ) -> List[Tuple[ScheduledPost, Dict[str, Any]]]:
+        """Fetch Buffer analytics for a batch of posts concurrently.
+        
+        Buffer has no multi-post analytics endpoint, so one request is
+        issued per post with at most SYNC_CONCURRENCY in flight.
+        Posts whose fetch fails are logged and skipped.
+        
+        Args:
+            posts: Posts with a Buffer ID
+            buffer_service: Buffer service instance
         
+        Returns:
+            List of (post, Buffer analytics) pairs for successful fetches
+        """
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+        
+        async def fetch(post: ScheduledPost) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await buffer_service.get_post_analytics(post.buffer_post_id)
+                except ProviderError as e:
+                    logger.error("Failed to sync analytics for post %s: %s", post.id, e.message)
+                    return None
+        
+        results = await asyncio.gather(*(fetch(post) for post in posts))
+        return [
+            (post, buffer_analytics)
+            for post, buffer_analytics in zip(posts, results)
+            if buffer_analytics is not None
+        ]
+    
+    async def iter_sync_analytics(
+        self,
+        user_id: int,
+        buffer_service: SocialMediaProvider,
         days: int = 7,
-    ) -> List[PostAnalytics]:
-        """Bulk sync analytics for recent posts.
+    ) -> AsyncIterator[List[PostAnalytics]]:
+        """Sync analytics for recent posts, one batch at a time.
+        
+        Each batch of SYNC_BATCH_SIZE posts is fetched from Buffer and
+        inserted before the next batch starts, so callers can stream or
+        commit results without holding the whole sync in memory.
         
         Args:
             user_id: User ID
             buffer_service: Buffer service instance
             days: Number of days to look back
         
-        Returns:
-            List of created analytics records
+        Yields:
+            Analytics records created for each batch
         """
         # Get recent published posts
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         query = (
             select(ScheduledPost)
+            .options(selectinload(ScheduledPost.social_accounts))
             .where(
                 and_(
                     ScheduledPost.user_id == user_id,
@@ -319,11 +535,36 @@ class PostAnalyticsService:
         result = await self.db.execute(query)
         posts = list(result.scalars().all())
         
+        for i in range(0, len(posts), SYNC_BATCH_SIZE):
+            # Network calls run concurrently; rows are written in one INSERT
+            fetched = await self._fetch_buffer_analytics(
+                posts[i:i + SYNC_BATCH_SIZE],
+                buffer_service,
+            )
+            yield await self.bulk_create_analytics([
+                self._analytics_from_buffer(post, buffer_analytics)
+                for post, buffer_analytics in fetched
+            ])
+    
+    async def bulk_sync_analytics(
+        self,
+        user_id: int,
+        buffer_service: SocialMediaProvider,
+        days: int = 7,
+    ) -> List[PostAnalytics]:
+        """Bulk sync analytics for recent posts.
+        
+        Args:
+            user_id: User ID
+            buffer_service: Buffer service instance
+            days: Number of days to look back
+        
+        Returns:
+            List of created analytics records
+        """
         analytics_records = []
-        for post in posts:
-            analytics = await self.sync_analytics_from_buffer(post.id, buffer_service)
-            if analytics:
-                analytics_records.append(analytics)
+        async for batch in self.iter_sync_analytics(user_id, buffer_service, days):
+            analytics_records.extend(batch)
         
         logger.info(f"Bulk synced analytics for {len(analytics_records)} posts")
         return analytics_records
@@ -12,8 +12,10 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 import httpx
+import orjson
 
 from app.core.config import settings
+from app.core.http import parse_json
 from app.services.providers.base_provider import SocialMediaProvider, ProviderError
 
 logger = logging.getLogger(__name__)
@@ -80,7 +82,7 @@ class AyrshareProvider(SocialMediaProvider):
                 response = await client.request(
                     method=method,
                     url=url,
-                    json=data,
+                    content=orjson.dumps(data) if data is not None else None,
                     params=params,
                     headers=headers,
                 )
@@ -88,8 +90,9 @@ class AyrshareProvider(SocialMediaProvider):
                 # Check for errors
                 if response.status_code >= 400:
                     error_msg = f"Ayrshare API error: {response.status_code}"
+                    error_data = None
                     try:
-                        error_data = response.json()
+                        error_data = parse_json(response)
                         error_msg = error_data.get('message', error_data.get('error', error_msg))
                     except Exception:
                         error_msg = response.text or error_msg
@@ -97,18 +100,18 @@ class AyrshareProvider(SocialMediaProvider):
                     raise ProviderError(
                         message=error_msg,
                         status_code=response.status_code,
-                        response=response.json() if response.text else None,
+                        response=error_data or None,
                     )
                 
-                return response.json() if response.text else {}
+                return parse_json(response)
         
         except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling Ayrshare API: {e}")
+            logger.error("HTTP error calling Ayrshare API: %s", e)
             raise ProviderError(f"Network error: {str(e)}")
         except ProviderError:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error calling Ayrshare API: {e}")
+            logger.error("Unexpected error calling Ayrshare API: %s", e)
             raise ProviderError(f"Unexpected error: {str(e)}")
     
     async def authenticate(self) -> Dict[str, Any]:
@@ -126,7 +129,7 @@ class AyrshareProvider(SocialMediaProvider):
             logger.info(f"Successfully authenticated with Ayrshare")
             return user_info
         except ProviderError as e:
-            logger.error(f"Ayrshare authentication failed: {e.message}")
+            logger.error("Ayrshare authentication failed: %s", e.message)
             raise
     
     async def get_profiles(self) -> List[Dict[str, Any]]:
@@ -160,7 +163,7 @@ class AyrshareProvider(SocialMediaProvider):
             logger.info(f"Retrieved {len(profiles)} Ayrshare profiles")
             return profiles
         except ProviderError as e:
-            logger.error(f"Failed to get Ayrshare profiles: {e.message}")
+            logger.error("Failed to get Ayrshare profiles: %s", e.message)
             raise
     
     async def create_post(
@@ -228,7 +231,7 @@ class AyrshareProvider(SocialMediaProvider):
             logger.info(f"Created Ayrshare post for {len(profile_ids)} profiles")
             return normalized
         except ProviderError as e:
-            logger.error(f"Failed to create Ayrshare post: {e.message}")
+            logger.error("Failed to create Ayrshare post: %s", e.message)
             raise
     
     async def update_post(self, post_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -261,7 +264,7 @@ class AyrshareProvider(SocialMediaProvider):
             logger.info(f"Updated Ayrshare post: {post_id}")
             return response
         except ProviderError as e:
-            logger.error(f"Failed to update Ayrshare post {post_id}: {e.message}")
+            logger.error("Failed to update Ayrshare post %s: %s", post_id, e.message)
             raise
     
     async def delete_post(self, post_id: str) -> Dict[str, Any]:
@@ -281,7 +284,7 @@ class AyrshareProvider(SocialMediaProvider):
             logger.info(f"Deleted Ayrshare post: {post_id}")
             return response
         except ProviderError as e:
-            logger.error(f"Failed to delete Ayrshare post {post_id}: {e.message}")
+            logger.error("Failed to delete Ayrshare post %s: %s", post_id, e.message)
             raise
     
     async def get_post_analytics(self, post_id: str) -> Dict[str, Any]:
@@ -318,7 +321,7 @@ class AyrshareProvider(SocialMediaProvider):
             logger.info(f"Retrieved analytics for Ayrshare post: {post_id}")
             return analytics
         except ProviderError as e:
-            logger.error(f"Failed to get analytics for Ayrshare post {post_id}: {e.message}")
+            logger.error("Failed to get analytics for Ayrshare post %s: %s", post_id, e.message)
             raise
     
     async def test_connection(self) -> bool:
@@ -352,7 +355,7 @@ class AyrshareProvider(SocialMediaProvider):
             logger.info(f"Retrieved status for Ayrshare post: {post_id}")
             return response
         except ProviderError as e:
-            logger.error(f"Failed to get status for Ayrshare post {post_id}: {e.message}")
+            logger.error("Failed to get status for Ayrshare post %s: %s", post_id, e.message)
             raise
     
     async def get_history(
@@ -381,5 +384,5 @@ class AyrshareProvider(SocialMediaProvider):
             logger.info(f"Retrieved Ayrshare history for last {last_days} days")
             return response.get('posts', [])
         except ProviderError as e:
-            logger.error(f"Failed to get Ayrshare history: {e.message}")
+            logger.error("Failed to get Ayrshare history: %s", e.message)
             raise
@@ -75,7 +75,7 @@ class ProviderFactory:
             logger.info(f"Created {provider_type} provider instance")
             return provider
         except Exception as e:
-            logger.error(f"Failed to create {provider_type} provider: {e}")
+            logger.error("Failed to create %s provider: %s", provider_type, e)
             raise ProviderError(f"Failed to create provider: {str(e)}")
     
     @classmethod
@@ -3,22 +3,28 @@
 Handles business logic for scheduled social media posts.
 """
 
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, date
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import insert, lambda_stmt, select, and_, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.core.pagination import Cursor
 from app.models.scheduled_post import ScheduledPost, PostStatus, PostType
+from app.models.scheduled_post_accounts import scheduled_post_accounts
 from app.models.social_account import SocialAccount
 from app.schemas.scheduled_post import ScheduledPostCreate, ScheduledPostUpdate
 from app.services.providers.provider_factory import get_provider
-from app.services.providers.base_provider import ProviderError
+from app.services.providers.base_provider import ProviderError, SocialMediaProvider
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent provider requests when bulk scheduling
+BULK_SCHEDULE_CONCURRENCY = 10
+
 
 class ScheduledPostService:
     """Service for managing scheduled posts."""
@@ -92,6 +98,34 @@ class ScheduledPostService:
         )
         return result.scalar_one_or_none()
     
+    async def get_owned_post(
+        self,
+        post_id: int,
+        user_id: int,
+    ) -> Optional[ScheduledPost]:
+        """Get a scheduled post by ID if it belongs to the given user.
+        
+        Args:
+            post_id: Post ID
+            user_id: Owning user ID
+        
+        Returns:
+            Scheduled post or None if it does not exist or is owned by someone else
+        """
+        # Runs on every single-post request; lambda_stmt builds the
+        # statement once and only rebinds post_id and user_id afterwards.
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(ScheduledPost)
+                .options(selectinload(ScheduledPost.social_accounts))
+                .where(
+                    ScheduledPost.id == post_id,
+                    ScheduledPost.user_id == user_id,
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+    
     async def get_user_posts(
         self,
         user_id: int,
@@ -118,8 +152,9 @@ class ScheduledPostService:
         Returns:
             List of scheduled posts
         """
+        # Social accounts are not part of list responses
         query = select(ScheduledPost).options(
-            selectinload(ScheduledPost.social_accounts)
+            raiseload(ScheduledPost.social_accounts)
         ).where(ScheduledPost.user_id == user_id)
         
         if status:
@@ -145,24 +180,23 @@ class ScheduledPostService:
     
     async def update_post(
         self,
-        post_id: int,
+        post: ScheduledPost,
         post_data: ScheduledPostUpdate,
-    ) -> Optional[ScheduledPost]:
+    ) -> ScheduledPost:
         """Update a scheduled post.
         
         Args:
-            post_id: Post ID
+            post: Loaded post to update
             post_data: Updated post data
         
         Returns:
-            Updated post or None
+            Updated post
         """
-        post = await self.get_post(post_id)
-        if not post:
-            return None
-        
         # Update fields
-        update_data = post_data.model_dump(exclude_unset=True)
+        update_data = {
+            field: getattr(post_data, field)
+            for field in post_data.model_fields_set
+        }
         
         # Handle social_account_ids separately
         social_account_ids = update_data.pop('social_account_ids', None)
@@ -179,118 +213,134 @@ class ScheduledPostService:
             )
             post.social_accounts = list(accounts.scalars().all())
         
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(post, ['social_accounts'])
         
-        logger.info(f"Updated scheduled post {post_id}")
+        logger.info(f"Updated scheduled post {post.id}")
         return post
     
-    async def delete_post(self, post_id: int) -> bool:
+    async def delete_post(self, post: ScheduledPost) -> bool:
         """Delete a scheduled post.
         
         Args:
-            post_id: Post ID
+            post: Loaded post to delete
         
         Returns:
-            True if deleted, False if not found
+            True if deleted
         """
-        post = await self.get_post(post_id)
-        if not post:
-            return False
-        
         await self.db.delete(post)
-        await self.db.commit()
+        await self.db.flush()
         
-        logger.info(f"Deleted scheduled post {post_id}")
+        logger.info(f"Deleted scheduled post {post.id}")
         return True
     
+    async def _create_provider_post(
+        self,
+        post: ScheduledPost,
+        provider: SocialMediaProvider,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a post to the provider for scheduling.
+        
+        Args:
+            post: Post with its social accounts loaded
+            provider: Provider to schedule with
+        
+        Returns:
+            Provider response or None if the post has no provider profiles
+        """
+        # Get profile IDs from associated accounts
+        profile_ids = [
+            acc.buffer_profile_id
+            for acc in post.social_accounts
+            if acc.buffer_profile_id
+        ]
+        
+        if not profile_ids:
+            logger.error("No profiles found for post %s", post.id)
+            return None
+        
+        # Prepare media data
+        media = None
+        if post.media_urls:
+            media = {'photos': post.media_urls}  # Use photos array for compatibility
+        
+        return await provider.create_post(
+            profile_ids=profile_ids,
+            text=post.content,
+            media=media,
+            scheduled_at=post.scheduled_time,
+        )
+    
+    @staticmethod
+    def _mark_scheduled(post: ScheduledPost, provider_response: Dict[str, Any]) -> None:
+        """Record a successful provider scheduling on the post."""
+        post.buffer_post_id = provider_response.get('updates', [{}])[0].get('id')
+        post.status = PostStatus.SCHEDULED
+        post.metadata = {
+            **post.metadata,
+            'provider_response': provider_response,
+            'scheduled_at': datetime.utcnow().isoformat(),
+        }
+    
+    @staticmethod
+    def _mark_schedule_failed(post: ScheduledPost, error: ProviderError) -> None:
+        """Record a failed provider scheduling on the post."""
+        logger.error("Failed to schedule post %s via Buffer: %s", post.id, error.message)
+        post.status = PostStatus.FAILED
+        post.metadata = {
+            **post.metadata,
+            'error': error.message,
+            'error_time': datetime.utcnow().isoformat(),
+        }
+    
     async def schedule_with_provider(
         self,
-        post_id: int,
+        post: ScheduledPost,
+        provider: Optional[SocialMediaProvider] = None,
     ) -> Optional[ScheduledPost]:
         """Schedule a post via social media provider.
         
         Args:
-            post_id: Post ID
+            post: Loaded post with its social accounts
+            provider: Provider to schedule with (defaults to the configured one)
         
         Returns:
-            Updated post or None
+            Updated post or None if it has no provider profiles
         """
-        post = await self.get_post(post_id)
-        if not post:
-            return None
+        provider = provider or get_provider()
         
         try:
-            # Get provider instance
-            provider = get_provider()
-            
-            # Get profile IDs from associated accounts
-            profile_ids = [
-                acc.buffer_profile_id
-                for acc in post.social_accounts
-                if acc.buffer_profile_id
-            ]
-            
-            if not profile_ids:
-                logger.error(f"No profiles found for post {post_id}")
-                return None
-            
-            # Prepare media data
-            media = None
-            if post.media_urls:
-                media = {'photos': post.media_urls}  # Use photos array for compatibility
-            
-            # Create post via provider
-            provider_response = await provider.create_post(
-                profile_ids=profile_ids,
-                text=post.content,
-                media=media,
-                scheduled_at=post.scheduled_time,
-            )
-            
-            # Update post with Buffer IDs
-            post.buffer_post_id = provider_response.get('updates', [{}])[0].get('id')
-            post.status = PostStatus.SCHEDULED
-            post.metadata = {
-                **post.metadata,
-                'provider_response': provider_response,
-                'scheduled_at': datetime.utcnow().isoformat(),
-            }
-            
-            await self.db.commit()
-            await self.db.refresh(post)
-            
-            logger.info(f"Scheduled post {post_id} via Buffer")
-            return post
-        
+            provider_response = await self._create_provider_post(post, provider)
         except ProviderError as e:
-            logger.error(f"Failed to schedule post {post_id} via Buffer: {e.message}")
-            post.status = PostStatus.FAILED
-            post.metadata = {
-                **post.metadata,
-                'error': e.message,
-                'error_time': datetime.utcnow().isoformat(),
-            }
-            await self.db.commit()
+            self._mark_schedule_failed(post, e)
+            await self.db.flush()
             return post
+        
+        if provider_response is None:
+            return None
+        
+        self._mark_scheduled(post, provider_response)
+        await self.db.flush()
+        await self.db.refresh(post)
+        
+        logger.info(f"Scheduled post {post.id} via Buffer")
+        return post
     
     async def publish_now(
         self,
-        post_id: int,
-        
+        post: ScheduledPost,
+        provider: Optional[SocialMediaProvider] = None,
     ) -> Optional[ScheduledPost]:
         """Publish a post immediately via Buffer.
         
         Args:
-            post_id: Post ID
-            buffer_service: Buffer service instance
+            post: Loaded post with its social accounts
+            provider: Provider to publish with (defaults to the configured one)
         
         Returns:
-            Updated post or None
+            Updated post or None if it has no Buffer profiles
         """
-        post = await self.get_post(post_id)
-        if not post:
-            return None
+        provider = provider or get_provider()
         
         try:
             # Get Buffer profile IDs
@@ -301,7 +351,7 @@ class ScheduledPostService:
             ]
             
             if not profile_ids:
-                logger.error(f"No Buffer profiles found for post {post_id}")
+                logger.error("No Buffer profiles found for post %s", post.id)
                 return None
             
             # Prepare media
@@ -327,36 +377,37 @@ class ScheduledPostService:
                 'published_at': datetime.utcnow().isoformat(),
             }
             
-            await self.db.commit()
+            await self.db.flush()
             await self.db.refresh(post)
             
-            logger.info(f"Published post {post_id} immediately")
+            logger.info(f"Published post {post.id} immediately")
             return post
         
         except ProviderError as e:
-            logger.error(f"Failed to publish post {post_id}: {e.message}")
+            logger.error("Failed to publish post %s: %s", post.id, e.message)
             post.status = PostStatus.FAILED
-            await self.db.commit()
+            await self.db.flush()
             return post
     
     async def cancel_scheduled_post(
         self,
-        post_id: int,
-        
+        post: ScheduledPost,
+        provider: Optional[SocialMediaProvider] = None,
     ) -> Optional[ScheduledPost]:
         """Cancel a scheduled post in Buffer.
         
         Args:
-            post_id: Post ID
-            buffer_service: Buffer service instance
+            post: Loaded post
+            provider: Provider to cancel with (defaults to the configured one)
         
         Returns:
-            Updated post or None
+            Updated post or None if it was never sent to Buffer
         """
-        post = await self.get_post(post_id)
-        if not post or not post.buffer_post_id:
+        if not post.buffer_post_id:
             return None
         
+        provider = provider or get_provider()
+        
         try:
             # Delete from Buffer
             await provider.delete_post(post.buffer_post_id)
@@ -368,14 +419,14 @@ class ScheduledPostService:
                 'cancelled_at': datetime.utcnow().isoformat(),
             }
             
-            await self.db.commit()
+            await self.db.flush()
             await self.db.refresh(post)
             
-            logger.info(f"Cancelled scheduled post {post_id}")
+            logger.info(f"Cancelled scheduled post {post.id}")
             return post
         
         except ProviderError as e:
-            logger.error(f"Failed to cancel post {post_id}: {e.message}")
+            logger.error("Failed to cancel post %s: %s", post.id, e.message)
             return post
     
     async def get_calendar(
@@ -383,6 +434,8 @@ class ScheduledPostService:
         user_id: int,
         start_date: date,
         end_date: date,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[ScheduledPost]:
         """Get content calendar for a date range.
         
@@ -390,50 +443,142 @@ class ScheduledPostService:
             user_id: User ID
             start_date: Calendar start date
             end_date: Calendar end date
+            limit: Maximum number of results
+            cursor: Keyset position of the last post already returned
         
         Returns:
             List of scheduled posts in date range
         """
         query = select(ScheduledPost).options(
-            selectinload(ScheduledPost.social_accounts)
+            raiseload(ScheduledPost.social_accounts)
         ).where(
             and_(
                 ScheduledPost.user_id == user_id,
                 ScheduledPost.scheduled_time >= start_date,
                 ScheduledPost.scheduled_time <= end_date,
             )
-        ).order_by(ScheduledPost.scheduled_time.asc())
+        )
+        
+        # The calendar runs forward in time, so the next page starts after the cursor
+        if cursor:
+            query = query.where(
+                tuple_(ScheduledPost.scheduled_time, ScheduledPost.id) > cursor
+            )
+        
+        query = (
+            query
+            .order_by(ScheduledPost.scheduled_time.asc(), ScheduledPost.id.asc())
+            .limit(limit)
+        )
         
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def _load_posts(self, post_ids: List[Any]) -> List[ScheduledPost]:
+        """Reload posts with their social accounts, keeping the given order."""
+        result = await self.db.execute(
+            select(ScheduledPost)
+            .options(selectinload(ScheduledPost.social_accounts))
+            .where(ScheduledPost.id.in_(post_ids))
+            .execution_options(populate_existing=True)
+        )
+        posts = {post.id: post for post in result.scalars().all()}
+        return [posts[post_id] for post_id in post_ids]
+    
     async def bulk_schedule(
         self,
         user_id: int,
         posts_data: List[ScheduledPostCreate],
-        
+        provider: Optional[SocialMediaProvider] = None,
     ) -> List[ScheduledPost]:
         """Create and optionally schedule multiple posts.
         
+        All posts are inserted with one INSERT and their social accounts
+        linked with a second. When a provider is given, draft posts are
+        sent to it concurrently (at most BULK_SCHEDULE_CONCURRENCY at a
+        time) and the results are written back in a single flush.
+        
         Args:
             user_id: User ID
             posts_data: List of post data
-            buffer_service: Buffer service for immediate scheduling (optional)
+            provider: Provider for immediate scheduling (optional)
         
         Returns:
             List of created posts
         """
-        created_posts = []
-        
-        for post_data in posts_data:
-            post = await self.create_post(user_id, post_data)
+        if not posts_data:
+            return []
+        
+        rows = [
+            {
+                'user_id': user_id,
+                'campaign_id': post_data.campaign_id,
+                'post_type': post_data.post_type,
+                'content': post_data.content,
+                'media_urls': post_data.media_urls or [],
+                'scheduled_time': post_data.scheduled_time,
+                'status': post_data.status or PostStatus.DRAFT,
+                'buffer_post_id': post_data.buffer_post_id,
+                'platform_post_ids': post_data.platform_post_ids or {},
+                'metadata': post_data.metadata or {},
+            }
+            for post_data in posts_data
+        ]
+        result = await self.db.scalars(
+            insert(ScheduledPost).returning(
+                ScheduledPost.id,
+                sort_by_parameter_order=True,
+            ),
+            rows,
+        )
+        post_ids = list(result.all())
+        
+        # Link only accounts that exist, as create_post does
+        requested_ids = {
+            account_id
+            for post_data in posts_data
+            for account_id in post_data.social_account_ids or []
+        }
+        known_ids = set()
+        if requested_ids:
+            accounts = await self.db.scalars(
+                select(SocialAccount.id).where(SocialAccount.id.in_(requested_ids))
+            )
+            known_ids = set(accounts.all())
+        
+        links = [
+            {'scheduled_post_id': post_id, 'social_account_id': account_id}
+            for post_id, post_data in zip(post_ids, posts_data)
+            for account_id in dict.fromkeys(post_data.social_account_ids or [])
+            if account_id in known_ids
+        ]
+        if links:
+            await self.db.execute(insert(scheduled_post_accounts), links)
+        
+        posts = await self._load_posts(post_ids)
+        
+        drafts = [post for post in posts if post.status == PostStatus.DRAFT]
+        if provider and drafts:
+            semaphore = asyncio.Semaphore(BULK_SCHEDULE_CONCURRENCY)
+            
+            async def send(post: ScheduledPost) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._create_provider_post(post, provider)
             
-            # Schedule immediately if Buffer service provided
-            if buffer_service and post.status == PostStatus.DRAFT:
-                post = await self.schedule_with_buffer(post.id, buffer_service)
+            results = await asyncio.gather(
+                *(send(post) for post in drafts),
+                return_exceptions=True,
+            )
+            for post, outcome in zip(drafts, results):
+                if isinstance(outcome, ProviderError):
+                    self._mark_schedule_failed(post, outcome)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                elif outcome is not None:
+                    self._mark_scheduled(post, outcome)
             
-            if post:
-                created_posts.append(post)
+            await self.db.flush()
+            posts = await self._load_posts(post_ids)
         
-        logger.info(f"Bulk created {len(created_posts)} posts for user {user_id}")
-        return created_posts
+        logger.info(f"Bulk created {len(posts)} posts for user {user_id}")
+        return posts
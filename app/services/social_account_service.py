@@ -7,13 +7,17 @@ import logging
 from typing import List, Optional
 from datetime import datetime
 
-from sqlalchemy import select
+from redis.exceptions import RedisError
+from sqlalchemy import lambda_stmt, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.pagination import Cursor
+from app.core.redis import get_redis
 from app.models.social_account import SocialAccount, SocialPlatform, AccountStatus
 from app.schemas.social_account import SocialAccountCreate, SocialAccountUpdate
 from app.services.providers.provider_factory import get_provider
-from app.services.providers.base_provider import ProviderError
+from app.services.providers.base_provider import ProviderError, SocialMediaProvider
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,37 @@ class SocialAccountService:
         """
         self.db = db
     
+    @staticmethod
+    def _connection_cache_key(account_id: int) -> str:
+        return f"account_conn:{account_id}"
+    
+    async def _invalidate_connection(self, account_id: int) -> None:
+        """Drop the cached connection test result for an account."""
+        try:
+            await get_redis().delete(self._connection_cache_key(account_id))
+        except RedisError as e:
+            logger.warning("Failed to invalidate cached connection for account %s: %s", account_id, e)
+    
+    async def invalidate_user_connections(self, user_id: int) -> None:
+        """Drop the cached connection test results of all a user's accounts.
+        
+        The results were obtained with the user's Buffer token, so they go
+        stale when the Buffer configuration changes.
+        
+        Args:
+            user_id: Owning user ID
+        """
+        result = await self.db.execute(
+            select(SocialAccount.id).where(SocialAccount.user_id == user_id)
+        )
+        keys = [self._connection_cache_key(account_id) for account_id in result.scalars()]
+        if not keys:
+            return
+        try:
+            await get_redis().delete(*keys)
+        except RedisError as e:
+            logger.warning("Failed to invalidate cached connections for user %s: %s", user_id, e)
+    
     async def create_account(
         self,
         user_id: int,
@@ -77,11 +112,39 @@ class SocialAccountService:
         )
         return result.scalar_one_or_none()
     
+    async def get_owned_account(
+        self,
+        account_id: int,
+        user_id: int,
+    ) -> Optional[SocialAccount]:
+        """Get a social account by ID if it belongs to the given user.
+        
+        Args:
+            account_id: Account ID
+            user_id: Owning user ID
+        
+        Returns:
+            Social account or None if it does not exist or is owned by someone else
+        """
+        # Guards each account route, including connection tests; the
+        # statement is cached after the first call
+        result = await self.db.execute(
+            lambda_stmt(
+                lambda: select(SocialAccount).where(
+                    SocialAccount.id == account_id,
+                    SocialAccount.user_id == user_id,
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+    
     async def get_user_accounts(
         self,
         user_id: int,
         platform: Optional[SocialPlatform] = None,
         status: Optional[AccountStatus] = None,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[SocialAccount]:
         """Get all social accounts for a user.
         
@@ -89,6 +152,8 @@ class SocialAccountService:
             user_id: User ID
             platform: Filter by platform (optional)
             status: Filter by status (optional)
+            limit: Maximum number of results
+            cursor: Keyset position of the last account already returned
         
         Returns:
             List of social accounts
@@ -101,79 +166,84 @@ class SocialAccountService:
         if status:
             query = query.where(SocialAccount.status == status)
         
-        query = query.order_by(SocialAccount.created_at.desc())
+        if cursor:
+            query = query.where(tuple_(SocialAccount.created_at, SocialAccount.id) < cursor)
+        
+        query = (
+            query
+            .order_by(SocialAccount.created_at.desc(), SocialAccount.id.desc())
+            .limit(limit)
+        )
         
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
     async def update_account(
         self,
-        account_id: int,
+        account: SocialAccount,
         account_data: SocialAccountUpdate,
-    ) -> Optional[SocialAccount]:
+    ) -> SocialAccount:
         """Update a social account.
         
         Args:
-            account_id: Account ID
+            account: Loaded account to update
             account_data: Updated account data
         
         Returns:
-            Updated account or None
+            Updated account
         """
-        account = await self.get_account(account_id)
-        if not account:
-            return None
-        
         # Update fields
-        update_data = account_data.model_dump(exclude_unset=True)
+        update_data = {
+            field: getattr(account_data, field)
+            for field in account_data.model_fields_set
+        }
         for field, value in update_data.items():
             setattr(account, field, value)
         
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(account)
+        await self._invalidate_connection(account.id)
         
-        logger.info(f"Updated social account {account_id}")
+        logger.info(f"Updated social account {account.id}")
         return account
     
-    async def delete_account(self, account_id: int) -> bool:
+    async def delete_account(self, account: SocialAccount) -> bool:
         """Delete a social account.
         
         Args:
-            account_id: Account ID
+            account: Loaded account to delete
         
         Returns:
-            True if deleted, False if not found
+            True if deleted
         """
-        account = await self.get_account(account_id)
-        if not account:
-            return False
-        
         await self.db.delete(account)
-        await self.db.commit()
+        await self.db.flush()
+        await self._invalidate_connection(account.id)
         
-        logger.info(f"Deleted social account {account_id}")
+        logger.info(f"Deleted social account {account.id}")
         return True
     
     async def sync_with_provider(
         self,
-        account_id: int,
+        account: SocialAccount,
+        provider: Optional[SocialMediaProvider] = None,
     ) -> Optional[SocialAccount]:
         """Sync account with social media provider profile.
         
         Args:
-            account_id: Account ID
+            account: Loaded account to sync
+            provider: Provider to sync with (defaults to the configured one)
         
         Returns:
-            Updated account or None
+            Updated account or None if it has no provider profile
         """
-        account = await self.get_account(account_id)
-        if not account or not account.buffer_profile_id:
+        if not account.buffer_profile_id:
             return None
         
+        provider = provider or get_provider()
+        await self._invalidate_connection(account.id)
+        
         try:
-            # Get provider instance
-            provider = get_provider()
-            
             # Get profile from provider (using Buffer's get_profile if available)
             if hasattr(provider, 'get_profile'):
                 profile = await provider.get_profile(account.buffer_profile_id)
@@ -195,37 +265,71 @@ class SocialAccountService:
             }
             account.status = AccountStatus.ACTIVE if profile.get('is_active', True) else account.status
             
-            await self.db.commit()
+            await self.db.flush()
             await self.db.refresh(account)
             
-            logger.info(f"Synced account {account_id} with provider")
+            logger.info(f"Synced account {account.id} with provider")
             return account
         
         except ProviderError as e:
-            logger.error(f"Failed to sync account {account_id} with provider: {e.message}")
+            logger.error("Failed to sync account %s with provider: %s", account.id, e.message)
             account.status = AccountStatus.ERROR
-            await self.db.commit()
+            await self.db.flush()
             await self.db.refresh(account)
             return account
     
+    async def get_cached_connection(self, account: SocialAccount) -> Optional[bool]:
+        """Get the result of a recent connection test for an account.
+        
+        Args:
+            account: Loaded account
+        
+        Returns:
+            Cached connection status or None if there is no recent result
+        """
+        try:
+            cached = await get_redis().get(self._connection_cache_key(account.id))
+        except RedisError as e:
+            logger.warning("Connection test cache unavailable: %s", e)
+            return None
+        if cached is None:
+            return None
+        return cached == b"1"
+    
     async def test_connection(
         self,
-        account_id: int,
+        account: SocialAccount,
+        provider: Optional[SocialMediaProvider] = None,
     ) -> bool:
         """Test connection to social account via provider.
         
+        The result is cached for ACCOUNT_CONNECTION_CACHE_TTL seconds so
+        repeated checks can be answered by get_cached_connection.
+        
         Args:
-            account_id: Account ID
+            account: Loaded account to test
+            provider: Provider to test with (defaults to the configured one)
         
         Returns:
             True if connection successful
         """
-        account = await self.get_account(account_id)
-        if not account or not account.buffer_profile_id:
+        if not account.buffer_profile_id:
             return False
         
+        provider = provider or get_provider()
+        
         try:
-            provider = get_provider()
-            return await provider.test_connection()
+            is_connected = await provider.test_connection()
         except ProviderError:
-            return False
+            is_connected = False
+        
+        try:
+            await get_redis().set(
+                self._connection_cache_key(account.id),
+                b"1" if is_connected else b"0",
+                ex=settings.ACCOUNT_CONNECTION_CACHE_TTL,
+            )
+        except RedisError as e:
+            logger.warning("Failed to cache connection for account %s: %s", account.id, e)
+        
+        return is_connected
@@ -0,0 +1,115 @@
+"""Analytics sync job service.
+
+Tracks the status of background analytics syncs in Redis so clients can
+poll for completion after the sync request has returned.
+"""
+
+import logging
+import uuid
+from typing import Any, Dict, Optional
+
+import orjson
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SyncJobStatus:
+    """Lifecycle states of an analytics sync job."""
+    
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class SyncJobService:
+    """Service for storing analytics sync job state.
+    
+    Jobs are kept as JSON documents under ``sync-job:<id>`` and expire
+    after SYNC_JOB_TTL seconds.
+    """
+    
+    def __init__(self, redis: aioredis.Redis):
+        """Initialize service with a Redis client."""
+        self.redis = redis
+    
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"sync-job:{job_id}"
+    
+    async def _save(self, job: Dict[str, Any]) -> None:
+        await self.redis.set(
+            self._key(job["job_id"]),
+            orjson.dumps(job),
+            ex=settings.SYNC_JOB_TTL,
+        )
+    
+    async def create_job(self, user_id: int) -> Dict[str, Any]:
+        """Create a queued job for a user.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            The created job
+        """
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "user_id": user_id,
+            "status": SyncJobStatus.QUEUED,
+            "synced": 0,
+            "error": None,
+        }
+        await self._save(job)
+        
+        logger.info(f"Queued analytics sync job {job['job_id']} for user {user_id}")
+        return job
+    
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID.
+        
+        Args:
+            job_id: Job ID
+        
+        Returns:
+            Job or None if it does not exist or has expired
+        """
+        data = await self.redis.get(self._key(job_id))
+        return orjson.loads(data) if data else None
+    
+    async def get_user_job(
+        self,
+        job_id: str,
+        user_id: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a job by ID if it belongs to the given user.
+        
+        Args:
+            job_id: Job ID
+            user_id: Owning user ID
+        
+        Returns:
+            Job or None if it does not exist or is owned by someone else
+        """
+        job = await self.get_job(job_id)
+        if not job or job["user_id"] != user_id:
+            return None
+        return job
+    
+    async def update_job(self, job_id: str, **fields: Any) -> None:
+        """Update fields of an existing job and refresh its TTL.
+        
+        Args:
+            job_id: Job ID
+            **fields: Fields to update (status, synced, error)
+        """
+        job = await self.get_job(job_id)
+        if not job:
+            logger.warning("Analytics sync job %s expired before update", job_id)
+            return
+        
+        job.update(fields)
+        await self._save(job)
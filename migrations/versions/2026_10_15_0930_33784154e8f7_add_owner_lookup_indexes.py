@@ -0,0 +1,27 @@
+"""Add owner lookup indexes
+
+Revision ID: 33784154e8f7
+Revises: 569e6da02eba
+Create Date: 2026-10-15 09:30:00.000000+00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '33784154e8f7'
+down_revision = '569e6da02eba'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Ownership-scoped lookups filter on (owner, id)
+    op.create_index('ix_campaigns_created_by_id', 'campaigns', ['created_by', 'id'])
+    op.create_index('ix_scheduled_posts_created_by_id', 'scheduled_posts', ['created_by', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_scheduled_posts_created_by_id', table_name='scheduled_posts')
+    op.drop_index('ix_campaigns_created_by_id', table_name='campaigns')
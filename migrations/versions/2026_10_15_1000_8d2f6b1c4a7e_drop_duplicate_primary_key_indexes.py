@@ -0,0 +1,37 @@
+"""Drop duplicate primary key indexes
+
+Revision ID: 8d2f6b1c4a7e
+Revises: 33784154e8f7
+Create Date: 2026-10-15 10:00:00.000000+00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8d2f6b1c4a7e'
+down_revision = '33784154e8f7'
+branch_labels = None
+depends_on = None
+
+# Tables whose ``id`` column had an index alongside its primary key
+TABLES = (
+    'users',
+    'campaigns',
+    'social_accounts',
+    'scheduled_posts',
+    'post_analytics',
+    'buffer_configs',
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # The primary key constraint already indexes id
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_id', table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for table in reversed(TABLES):
+        op.create_index(f'ix_{table}_id', table, ['id'])
@@ -0,0 +1,65 @@
+"""Add updated_at triggers
+
+Revision ID: b5e9c3a7d210
+Revises: 8d2f6b1c4a7e
+Create Date: 2026-10-15 10:30:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'b5e9c3a7d210'
+down_revision = '8d2f6b1c4a7e'
+branch_labels = None
+depends_on = None
+
+# Tables with an updated_at column maintained by the database
+TABLES = (
+    'users',
+    'campaigns',
+    'social_accounts',
+    'scheduled_posts',
+    'post_analytics',
+    'buffer_configs',
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # The model has always declared post_analytics.updated_at but the
+    # column was never created; add it before its trigger needs it.
+    # The backfill runs before the trigger exists, so it keeps created_at.
+    op.add_column(
+        'post_analytics',
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+    )
+    op.execute("UPDATE post_analytics SET updated_at = created_at")
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at "
+            f"BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for table in reversed(TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+    op.drop_column('post_analytics', 'updated_at')
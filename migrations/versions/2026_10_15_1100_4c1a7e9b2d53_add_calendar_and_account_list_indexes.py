@@ -0,0 +1,35 @@
+"""Add calendar and account list indexes
+
+Revision ID: 4c1a7e9b2d53
+Revises: b5e9c3a7d210
+Create Date: 2026-10-15 11:00:00.000000+00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4c1a7e9b2d53'
+down_revision = 'b5e9c3a7d210'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Keyset pagination of a user's calendar and account list
+    op.create_index(
+        'ix_scheduled_posts_created_by_scheduled_time_id',
+        'scheduled_posts',
+        ['created_by', 'scheduled_time', 'id'],
+    )
+    op.create_index(
+        'ix_social_accounts_created_by_created_at_id',
+        'social_accounts',
+        ['created_by', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_social_accounts_created_by_created_at_id', table_name='social_accounts')
+    op.drop_index('ix_scheduled_posts_created_by_scheduled_time_id', table_name='scheduled_posts')
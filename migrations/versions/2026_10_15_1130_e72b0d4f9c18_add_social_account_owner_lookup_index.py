@@ -0,0 +1,25 @@
+"""Add social account owner lookup index
+
+Revision ID: e72b0d4f9c18
+Revises: 4c1a7e9b2d53
+Create Date: 2026-10-15 11:30:00.000000+00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e72b0d4f9c18'
+down_revision = '4c1a7e9b2d53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Ownership-scoped lookups filter on (owner, id)
+    op.create_index('ix_social_accounts_created_by_id', 'social_accounts', ['created_by', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_social_accounts_created_by_id', table_name='social_accounts')
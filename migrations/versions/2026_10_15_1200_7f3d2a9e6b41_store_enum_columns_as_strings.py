@@ -0,0 +1,72 @@
+"""Store enum columns as strings
+
+Revision ID: 7f3d2a9e6b41
+Revises: e72b0d4f9c18
+Create Date: 2026-10-15 12:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '7f3d2a9e6b41'
+down_revision = 'e72b0d4f9c18'
+branch_labels = None
+depends_on = None
+
+# (table, column, enum type, values, server default)
+COLUMNS = (
+    ('campaigns', 'campaign_type', 'campaigntype',
+     ('awareness', 'fundraising', 'event', 'general'), 'general'),
+    ('campaigns', 'status', 'campaignstatus',
+     ('draft', 'active', 'completed', 'cancelled'), 'draft'),
+    ('social_accounts', 'platform', 'socialplatform',
+     ('facebook', 'twitter', 'instagram', 'linkedin', 'tiktok', 'youtube'), None),
+    ('social_accounts', 'status', 'accountstatus',
+     ('active', 'inactive', 'disconnected', 'error'), 'active'),
+    ('scheduled_posts', 'post_type', 'posttype',
+     ('text', 'image', 'video', 'link', 'carousel'), 'text'),
+    ('scheduled_posts', 'status', 'poststatus',
+     ('draft', 'scheduled', 'published', 'failed', 'cancelled'), 'draft'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for table, column, type_name, values, default in COLUMNS:
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(32),
+            postgresql_using=f'{column}::text',
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=default)
+        op.create_check_constraint(
+            f'ck_{table}_{column}',
+            table,
+            f"{column} IN ({', '.join(repr(value) for value in values)})",
+        )
+    
+    for _, _, type_name, _, _ in COLUMNS:
+        postgresql.ENUM(name=type_name).drop(op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for table, column, type_name, values, default in reversed(COLUMNS):
+        enum_type = postgresql.ENUM(*values, name=type_name)
+        enum_type.create(op.get_bind(), checkfirst=True)
+        
+        op.drop_constraint(f'ck_{table}_{column}', table, type_='check')
+        op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=enum_type,
+            postgresql_using=f'{column}::{type_name}',
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=default)
@@ -0,0 +1,45 @@
+"""Add due post and analytics indexes
+
+Revision ID: a91c5e3f7d02
+Revises: 7f3d2a9e6b41
+Create Date: 2026-10-15 12:30:00.000000+00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a91c5e3f7d02'
+down_revision = '7f3d2a9e6b41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Due posts: status = 'scheduled' AND scheduled_time <= now()
+    op.create_index(
+        'ix_scheduled_posts_status_scheduled_time',
+        'scheduled_posts',
+        ['status', 'scheduled_time'],
+    )
+    # A post's analytics in collection order
+    op.create_index(
+        'ix_post_analytics_scheduled_post_id_collected_at',
+        'post_analytics',
+        ['scheduled_post_id', 'collected_at'],
+    )
+    
+    # Covered by the leading columns of the composite indexes
+    op.drop_index('ix_scheduled_posts_status', table_name='scheduled_posts')
+    op.drop_index('ix_scheduled_posts_created_by', table_name='scheduled_posts')
+    op.drop_index('ix_post_analytics_scheduled_post_id', table_name='post_analytics')
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.create_index('ix_post_analytics_scheduled_post_id', 'post_analytics', ['scheduled_post_id'])
+    op.create_index('ix_scheduled_posts_created_by', 'scheduled_posts', ['created_by'])
+    op.create_index('ix_scheduled_posts_status', 'scheduled_posts', ['status'])
+    
+    op.drop_index('ix_post_analytics_scheduled_post_id_collected_at', table_name='post_analytics')
+    op.drop_index('ix_scheduled_posts_status_scheduled_time', table_name='scheduled_posts')
@@ -0,0 +1,71 @@
+"""Store platforms as bitmasks
+
+Revision ID: c3e8f1a6b924
+Revises: a91c5e3f7d02
+Create Date: 2026-10-15 13:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'c3e8f1a6b924'
+down_revision = 'a91c5e3f7d02'
+branch_labels = None
+depends_on = None
+
+# (table, array column, mask column)
+PLATFORM_COLUMNS = [
+    ('scheduled_posts', 'platforms', 'platforms_mask'),
+    ('campaigns', 'target_platforms', 'target_platforms_mask'),
+]
+
+# Must match app.models.social_account.PLATFORM_BITS
+PLATFORM_BITS = (
+    "(VALUES ('facebook', 1), ('twitter', 2), ('instagram', 4), "
+    "('linkedin', 8), ('tiktok', 16), ('youtube', 32)) AS bits(platform, bit)"
+)
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for table, array_column, mask_column in PLATFORM_COLUMNS:
+        op.add_column(
+            table,
+            sa.Column(mask_column, sa.Integer(), nullable=False, server_default='0'),
+        )
+        # Backfill without the updated_at trigger, which would reset every
+        # row's modification time to now()
+        op.execute(f"ALTER TABLE {table} DISABLE TRIGGER {table}_set_updated_at")
+        op.execute(
+            f"UPDATE {table} SET {mask_column} = ("
+            f"SELECT COALESCE(bit_or(bits.bit), 0) FROM {PLATFORM_BITS} "
+            f"WHERE bits.platform = ANY({table}.{array_column}))"
+        )
+        op.execute(f"ALTER TABLE {table} ENABLE TRIGGER {table}_set_updated_at")
+        op.alter_column(table, mask_column, server_default=None)
+        op.drop_column(table, array_column)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for table, array_column, mask_column in PLATFORM_COLUMNS:
+        op.add_column(
+            table,
+            sa.Column(
+                array_column,
+                postgresql.ARRAY(sa.String()),
+                nullable=False,
+                server_default='{}',
+            ),
+        )
+        op.execute(f"ALTER TABLE {table} DISABLE TRIGGER {table}_set_updated_at")
+        op.execute(
+            f"UPDATE {table} SET {array_column} = ARRAY("
+            f"SELECT bits.platform FROM {PLATFORM_BITS} "
+            f"WHERE {table}.{mask_column} & bits.bit <> 0 ORDER BY bits.bit)"
+        )
+        op.execute(f"ALTER TABLE {table} ENABLE TRIGGER {table}_set_updated_at")
+        op.alter_column(table, array_column, server_default=None)
+        op.drop_column(table, mask_column)
@@ -0,0 +1,78 @@
+"""Normalize campaign tags
+
+Revision ID: d7a2b4e8c605
+Revises: c3e8f1a6b924
+Create Date: 2026-10-15 13:30:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'd7a2b4e8c605'
+down_revision = 'c3e8f1a6b924'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        'tags',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.UniqueConstraint('name', name='tags_name_key'),
+    )
+    op.execute(
+        "CREATE TRIGGER tags_set_updated_at "
+        "BEFORE UPDATE ON tags "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+    op.create_table(
+        'campaign_tags',
+        sa.Column('campaign_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tag_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.ForeignKeyConstraint(['campaign_id'], ['campaigns.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('campaign_id', 'tag_id'),
+    )
+    op.create_index('ix_campaign_tags_tag_id', 'campaign_tags', ['tag_id'])
+    
+    # Move existing array values into the new tables
+    op.execute("""
+        INSERT INTO tags (id, name)
+        SELECT gen_random_uuid(), name
+        FROM (SELECT DISTINCT unnest(tags) AS name FROM campaigns) AS names
+        WHERE name IS NOT NULL
+    """)
+    op.execute("""
+        INSERT INTO campaign_tags (campaign_id, tag_id)
+        SELECT DISTINCT campaigns.id, tags.id
+        FROM campaigns
+        CROSS JOIN LATERAL unnest(campaigns.tags) AS names(name)
+        JOIN tags ON tags.name = names.name
+    """)
+    op.drop_column('campaigns', 'tags')
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.add_column('campaigns', sa.Column('tags', postgresql.ARRAY(sa.String()), nullable=True))
+    # Backfill without the trigger, which would reset updated_at to now()
+    op.execute("ALTER TABLE campaigns DISABLE TRIGGER campaigns_set_updated_at")
+    op.execute("""
+        UPDATE campaigns SET tags = (
+            SELECT array_agg(tags.name ORDER BY tags.name)
+            FROM campaign_tags
+            JOIN tags ON tags.id = campaign_tags.tag_id
+            WHERE campaign_tags.campaign_id = campaigns.id
+        )
+    """)
+    op.execute("ALTER TABLE campaigns ENABLE TRIGGER campaigns_set_updated_at")
+    op.drop_index('ix_campaign_tags_tag_id', table_name='campaign_tags')
+    op.drop_table('campaign_tags')
+    op.execute("DROP TRIGGER IF EXISTS tags_set_updated_at ON tags")
+    op.drop_table('tags')
@@ -0,0 +1,44 @@
+"""Make buffer config owner unique
+
+Revision ID: e4b9d2c7a831
+Revises: d7a2b4e8c605
+Create Date: 2026-10-15 14:00:00.000000+00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e4b9d2c7a831'
+down_revision = 'd7a2b4e8c605'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Keep only the newest configuration per user, the one the service used
+    op.execute("""
+        DELETE FROM buffer_configs
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY created_by ORDER BY created_at DESC, id DESC
+                ) AS position
+                FROM buffer_configs
+            ) AS ranked
+            WHERE position > 1
+        )
+    """)
+    op.drop_index('ix_buffer_configs_created_by', table_name='buffer_configs')
+    op.create_index(
+        'ix_buffer_configs_created_by',
+        'buffer_configs',
+        ['created_by'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_buffer_configs_created_by', table_name='buffer_configs')
+    op.create_index('ix_buffer_configs_created_by', 'buffer_configs', ['created_by'])
@@ -0,0 +1,38 @@
+"""Store engagement rate as double precision
+
+Revision ID: f1c6a9d3e257
+Revises: e4b9d2c7a831
+Create Date: 2026-10-15 14:30:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'f1c6a9d3e257'
+down_revision = 'e4b9d2c7a831'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.alter_column(
+        'post_analytics',
+        'engagement_rate',
+        existing_type=sa.Numeric(5, 2),
+        type_=sa.Double(),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.alter_column(
+        'post_analytics',
+        'engagement_rate',
+        existing_type=sa.Double(),
+        type_=sa.Numeric(5, 2),
+        existing_nullable=True,
+        postgresql_using='round(engagement_rate::numeric, 2)',
+    )
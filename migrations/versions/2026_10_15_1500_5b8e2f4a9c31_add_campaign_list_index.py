@@ -0,0 +1,29 @@
+"""Add campaign list index
+
+Revision ID: 5b8e2f4a9c31
+Revises: f1c6a9d3e257
+Create Date: 2026-10-15 15:00:00.000000+00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5b8e2f4a9c31'
+down_revision = 'f1c6a9d3e257'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Keyset pagination of a user's campaigns, newest first
+    op.create_index(
+        'ix_campaigns_created_by_created_at_id',
+        'campaigns',
+        ['created_by', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index('ix_campaigns_created_by_created_at_id', table_name='campaigns')
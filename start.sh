@@ -34,7 +34,7 @@ fi
 
 # Start the service
 echo "Starting ${SERVICE_NAME} on port ${SERVICE_PORT}..."
-nohup uvicorn app.main:app --host 0.0.0.0 --port ${SERVICE_PORT} --reload > "$LOG_FILE" 2>&1 &
+nohup uvicorn app.main:app --host 0.0.0.0 --port ${SERVICE_PORT} --loop uvloop --http httptools --reload > "$LOG_FILE" 2>&1 &
 
 # Save PID
 echo $! > "$PID_FILE"
@@ -0,0 +1,141 @@
+"""Unit tests for authentication dependencies."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.security import create_access_token
+from app.dependencies import auth
+from app.dependencies.auth import (
+    CurrentUser,
+    get_current_user,
+    get_optional_user,
+    require_auth,
+)
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestTokenCache:
+    """Test caching of decoded tokens in get_current_user."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty token cache."""
+        auth._token_cache.clear()
+        yield
+        auth._token_cache.clear()
+    
+    @pytest.mark.asyncio
+    async def test_repeated_token_is_decoded_once(self):
+        """Test that a cached token skips decoding."""
+        token = create_access_token("123", additional_claims={"email": "test@example.com"})
+        
+        with patch.object(auth, "decode_token", wraps=auth.decode_token) as decode:
+            first = await get_current_user(_credentials(token))
+            second = await get_current_user(_credentials(token))
+        
+        assert decode.call_count == 1
+        assert second is first
+        assert first.user_id == 123
+    
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_decoded_again(self):
+        """Test that an expired cache entry is not served."""
+        token = create_access_token("123", expires_delta=timedelta(seconds=-1))
+        
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user(_credentials(token))
+            assert exc_info.value.status_code == 401
+        
+        assert not auth._token_cache
+    
+    @pytest.mark.asyncio
+    async def test_each_rejection_raises_a_new_exception(self):
+        """Test that rejected tokens do not share one exception instance."""
+        errors = []
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user(_credentials("not-a-token"))
+            errors.append(exc_info.value)
+        
+        assert errors[0] is not errors[1]
+        assert errors[1].headers == {"WWW-Authenticate": "Bearer"}
+
+
+class TestGetOptionalUser:
+    """Test the optional authentication dependency."""
+    
+    @pytest.mark.asyncio
+    async def test_anonymous_request_returns_none(self):
+        """Test that a request without credentials is anonymous."""
+        assert await get_optional_user(None) is None
+    
+    @pytest.mark.asyncio
+    async def test_valid_token_returns_user(self):
+        """Test that a valid token is decoded."""
+        token = create_access_token("123")
+        
+        user = await get_optional_user(_credentials(token))
+        
+        assert user.user_id == 123
+    
+    @pytest.mark.asyncio
+    async def test_invalid_token_rejected(self):
+        """Test that a bad token is still a 401."""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_optional_user(_credentials("not-a-token"))
+        assert exc_info.value.status_code == 401
+
+
+class TestRequireAuth:
+    """Test the require_auth dependency factory."""
+    
+    def test_same_roles_share_dependency(self):
+        """Test that equal role sets return the same dependency callable."""
+        assert require_auth(["admin", "editor"]) is require_auth(("editor", "admin"))
+        assert require_auth() is require_auth([])
+    
+    @pytest.mark.asyncio
+    async def test_rejects_user_without_required_role(self):
+        """Test that a user lacking every required role gets a 403."""
+        check_roles = require_auth(["admin"])
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await check_roles(CurrentUser(user_id=1, email="", roles=["user"]))
+        
+        assert exc_info.value.status_code == 403
+    
+    @pytest.mark.asyncio
+    async def test_accepts_user_with_any_required_role(self):
+        """Test that one matching role is enough."""
+        check_roles = require_auth(["admin", "editor"])
+        user = CurrentUser(user_id=1, email="", roles=["editor"])
+        
+        assert await check_roles(user) is user
+
+
+class TestCurrentUser:
+    """Test the CurrentUser context object."""
+    
+    def test_roles_are_immutable(self):
+        """Test that roles are copied into a tuple."""
+        roles = ["editor"]
+        user = CurrentUser(user_id=1, email="", roles=roles)
+        roles.append("admin")
+        
+        assert user.roles == ("editor",)
+        assert not user.has_role("admin")
+    
+    def test_no_instance_dict(self):
+        """Test that attributes live in slots."""
+        user = CurrentUser(user_id=1, email="")
+        
+        assert not hasattr(user, "__dict__")
+        assert user.roles == ()
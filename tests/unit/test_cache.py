@@ -0,0 +1,86 @@
+"""Unit tests for the response cache."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from redis.exceptions import RedisError
+
+from app.core import cache
+from app.dependencies.buffer import get_user_buffer_service
+from app.main import app
+
+PROFILES_URL = "/api/v1/buffer/profiles"
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+    
+    def __init__(self):
+        self.store = {}
+    
+    async def get(self, key):
+        return self.store.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+class UnavailableRedis:
+    """Redis client whose server cannot be reached."""
+    
+    async def get(self, key):
+        raise RedisError("connection refused")
+    
+    async def set(self, key, value, ex=None):
+        raise RedisError("connection refused")
+
+
+class FakeBufferService:
+    """Buffer service that counts profile fetches."""
+    
+    access_token = "token-123"
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def get_profiles(self):
+        self.calls += 1
+        return [{"id": "profile-1", "service": "twitter"}]
+
+
+@pytest.fixture
+def buffer_service():
+    """Serve the profiles endpoint from a fake Buffer service."""
+    service = FakeBufferService()
+    app.dependency_overrides[get_user_buffer_service] = lambda: service
+    yield service
+    app.dependency_overrides.clear()
+
+
+class TestCachedEndpoint:
+    """Test a cached endpoint without the application lifespan running."""
+    
+    def test_second_call_is_served_from_cache(self, buffer_service):
+        """Test that a repeated request does not reach Buffer again."""
+        redis = FakeRedis()
+        client = TestClient(app)
+        
+        with patch.object(cache, "get_redis", return_value=redis):
+            first = client.get(PROFILES_URL)
+            second = client.get(PROFILES_URL)
+        
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json() == [{"id": "profile-1", "service": "twitter"}]
+        assert buffer_service.calls == 1
+        assert all(key.startswith(f"{cache.CACHE_PREFIX}:") for key in redis.store)
+    
+    def test_unavailable_redis_serves_uncached(self, buffer_service):
+        """Test that a Redis outage does not fail the request."""
+        client = TestClient(app)
+        
+        with patch.object(cache, "get_redis", return_value=UnavailableRedis()):
+            response = client.get(PROFILES_URL)
+        
+        assert response.status_code == 200
+        assert buffer_service.calls == 1
@@ -0,0 +1,61 @@
+"""Unit tests for response compression."""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, select_encoding
+
+BODY = "x" * 4096
+
+
+def _client():
+    app = Starlette(routes=[Route("/", lambda request: PlainTextResponse(BODY))])
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return TestClient(app)
+
+
+class TestSelectEncoding:
+    """Test Accept-Encoding negotiation."""
+    
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("gzip, deflate, br", "br"),
+            ("gzip", "gzip"),
+            ("br;q=0, gzip", "gzip"),
+            ("br;q=0.5, gzip;q=0.8", "gzip"),
+            ("BR", "br"),
+            ("*", "br"),
+            ("*;q=0, gzip", "gzip"),
+            ("br;q=0, gzip;q=0", None),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_selects_encoding(self, header, expected):
+        """Test that q-values, including q=0, decide the encoding."""
+        assert select_encoding(header) == expected
+
+
+class TestCompressionMiddleware:
+    """Test that responses use the negotiated encoding."""
+    
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("gzip, br", "br"),
+            ("*", "br"),
+            ("br;q=0, gzip", "gzip"),
+            ("*;q=0, gzip", "gzip"),
+            ("br;q=0, gzip;q=0", None),
+        ],
+    )
+    def test_content_encoding(self, header, expected):
+        """Test the Content-Encoding sent for an Accept-Encoding header."""
+        response = _client().get("/", headers={"Accept-Encoding": header})
+        
+        assert response.headers.get("content-encoding") == expected
+        assert response.text == BODY
@@ -0,0 +1,42 @@
+"""Unit tests for the CORS middleware."""
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.cors import FastCORSMiddleware
+
+
+def _client(allow_origins):
+    app = Starlette(routes=[Route("/", lambda request: PlainTextResponse("ok"))])
+    app.add_middleware(FastCORSMiddleware, allow_origins=allow_origins)
+    return TestClient(app)
+
+
+class TestFastCORSMiddleware:
+    """Test origin checks."""
+    
+    def test_exact_origin_allowed(self):
+        """Test that a listed origin is echoed back."""
+        client = _client(["https://engadi.org", "http://localhost:3000"])
+        
+        response = client.get("/", headers={"Origin": "https://engadi.org"})
+        
+        assert response.headers["access-control-allow-origin"] == "https://engadi.org"
+    
+    def test_unknown_origin_rejected(self):
+        """Test that an unlisted origin gets no CORS headers."""
+        client = _client(["https://engadi.org"])
+        
+        response = client.get("/", headers={"Origin": "https://evil.example"})
+        
+        assert "access-control-allow-origin" not in response.headers
+    
+    def test_wildcard_allows_any_origin(self):
+        """Test that "*" still allows every origin."""
+        client = _client(["*"])
+        
+        response = client.get("/", headers={"Origin": "https://evil.example"})
+        
+        assert response.headers["access-control-allow-origin"] == "*"
@@ -0,0 +1,66 @@
+"""Unit tests for keyset pagination helpers."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from starlette.responses import Response
+
+from app.core.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    set_next_cursor,
+)
+
+
+class TestCursorEncoding:
+    """Test cursor encode/decode round trips."""
+    
+    def test_round_trip(self):
+        """Test that a decoded cursor matches the encoded position."""
+        created_at = datetime(2025, 6, 1, 12, 30, tzinfo=timezone.utc)
+        row_id = uuid4()
+        
+        cursor = encode_cursor(created_at, row_id)
+        
+        assert decode_cursor(cursor) == (created_at, row_id)
+    
+    def test_invalid_cursor_raises(self):
+        """Test that a malformed cursor raises ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestSetNextCursor:
+    """Test the next-cursor response header."""
+    
+    def test_full_page_sets_header(self):
+        """Test that a full page points at its last row."""
+        rows = [
+            SimpleNamespace(id=uuid4(), created_at=datetime(2025, 1, day))
+            for day in (3, 2)
+        ]
+        response = Response()
+        
+        set_next_cursor(response, rows, limit=2, sort_attr="created_at")
+        
+        cursor = response.headers[NEXT_CURSOR_HEADER]
+        assert decode_cursor(cursor) == (rows[-1].created_at, rows[-1].id)
+    
+    def test_partial_page_has_no_header(self):
+        """Test that the last page does not advertise a next cursor."""
+        rows = [SimpleNamespace(id=uuid4(), created_at=datetime(2025, 1, 1))]
+        response = Response()
+        
+        set_next_cursor(response, rows, limit=2, sort_attr="created_at")
+        
+        assert NEXT_CURSOR_HEADER not in response.headers
+    
+    def test_null_sort_value_raises(self):
+        """Test that a nullable sort column is rejected explicitly."""
+        rows = [SimpleNamespace(id=uuid4(), created_at=None)]
+        
+        with pytest.raises(ValueError):
+            set_next_cursor(Response(), rows, limit=1, sort_attr="created_at")
@@ -0,0 +1,69 @@
+"""Unit tests for API response helpers."""
+
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    make_transient_to_detached,
+    mapped_column,
+    relationship,
+)
+
+from app.api.responses import construct_trusted
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Parent(_Base):
+    __tablename__ = "parents"
+    
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    children: Mapped[list["_Child"]] = relationship(lazy="raise")
+
+
+class _Child(_Base):
+    __tablename__ = "children"
+    
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    parent_id: Mapped[UUID] = mapped_column(ForeignKey("parents.id"))
+
+
+class _ParentWithStats(BaseModel):
+    id: UUID
+    name: str
+    children: int = 0
+
+
+def _loaded_parent() -> _Parent:
+    """Build a parent that behaves like a row loaded by a closed session."""
+    parent = _Parent(id=uuid4(), name="parent")
+    make_transient_to_detached(parent)
+    return parent
+
+
+class TestConstructTrusted:
+    """Test filling schemas from trusted rows."""
+    
+    def test_copies_row_attributes(self):
+        """Test that schema fields are read from the row."""
+        parent = _loaded_parent()
+        
+        item = construct_trusted(_ParentWithStats, parent, children=0)
+        
+        assert item.id == parent.id
+        assert item.name == "parent"
+    
+    def test_extra_shadows_raise_relationship(self):
+        """Test that an aggregate named like a lazy="raise" relationship is
+        taken from ``extra`` without touching the relationship."""
+        parent = _loaded_parent()
+        
+        item = construct_trusted(_ParentWithStats, parent, children=3)
+        
+        assert item.children == 3
@@ -1,9 +1,10 @@
 """Unit tests for security utilities."""
 
 import pytest
-from jose import JWTError
 
+from app.core.config import settings
 from app.core.security import (
+    JWTError,
     create_access_token,
     decode_token,
     get_password_hash,
@@ -53,3 +54,11 @@ class TestJWTTokens:
         """Test that invalid token raises error."""
         with pytest.raises(JWTError):
             decode_token("invalid_token")
+    
+    def test_settings_changed_after_import(self, monkeypatch):
+        """Test that issued tokens still decode if settings change later."""
+        monkeypatch.setattr(settings, "SECRET_KEY", "changed-secret-key")
+        
+        token = create_access_token("123")
+        
+        assert decode_token(token)["sub"] == "123"